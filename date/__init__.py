@@ -1 +1,6 @@
-from date import *
\ No newline at end of file
+from date import *
+from intervalindex import IntervalIndex
+from intervalset import IntervalSet
+from timestamp import Timestamp
+from recurrence import Recurrence, Weekly, Monthly, MonthlyWeekday
+from bulk import parse_many
\ No newline at end of file
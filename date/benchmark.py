@@ -0,0 +1,148 @@
+"""Date Benchmarks
+==================
+Time :class:`.Date` against :class:`.OrdinalDate` for sorting and arithmetic, the
+dateparser lexer against the compiled tokenizer, time.strftime against compiled format specs,
+pickle against columnar serialization, Date + Duration and DateInterval.duration against arrays, the
+cached Date.today against time.localtime, and Timestamps against datetimes, e.g.::
+
+	python -m date.benchmark [n]
+
+"""
+from date 								import Date, DateInterval, Duration, OrdinalDate, format_many
+from datearray 							import DateArray, DurationArray, TimestampArray
+from dateparser							import _timelex
+from random								import Random
+from timestamp							import Timestamp
+import datetime
+import timestamp
+import columnar
+import datearray
+import cPickle
+from timeit								import default_timer
+import sys
+import time
+
+
+def timed(name, fn, *args):
+	"""Run `fn(*args)` once, print the elapsed time and return the result."""
+	start 								= default_timer()
+	result 								= fn(*args)
+	print '%-36s %8.3fs' % (name, default_timer() - start)
+	return result
+
+class DatetimeDate(Date):
+	"""A Date converting to and from ordinals with datetime.date on every call, as Date did before the closed form."""
+	__slots__ 	= ()
+	def __int__(self):
+		from datetime import date
+		return date(self.y, self.m, self.d).toordinal()
+	def _toDate(self, n):
+		from datetime import date
+		d 								= date.fromordinal(n)
+		self.ymd 						= (d.year, d.month, d.day)
+	def __add__(self, n):		return DatetimeDate(int(self) + n)
+	def __sub__(self, other):	return DateInterval(other, self) if isinstance(other, Date) else DatetimeDate(int(self) - other)
+
+def dates(cls, ordinals):	return [cls(n) for n in ordinals]
+def add(dates):				return [d + 30 for d in dates]
+def subtract(dates):		return [d - 30 for d in dates]
+def interval(dates):		return [len(b - a) for (a, b) in zip(dates, dates[1:])]
+def ordinal(dates):			return [int(d) for d in dates]
+
+def lex(strings):			return [list(_timelex(s)) for s in strings]
+def tokenize(strings):		return [_timelex.split(s) for s in strings]
+
+def strftime(dates, spec):	return [format(time.strftime(spec, d.timetuple), '12') for d in dates]
+def formatted(dates, spec):	return [format(d, spec + ':12') for d in dates]
+
+def benchmark_dates(n=1000000, seed=0):
+	"""Benchmark `n` random dates (from 1900 to 2100) for each of DatetimeDate (the Date before the closed form), Date and OrdinalDate."""
+	random 								= Random(seed)
+	start, end 							= (int(Date(1900, 1, 1)), int(Date(2100, 1, 1)))
+	ordinals 							= [random.randint(start, end) for _ in xrange(n)]
+	for cls in (DatetimeDate, Date, OrdinalDate):
+		print '%s (%d dates)' % (cls.__name__, n)
+		d 								= timed('  create from ordinal', dates, cls, ordinals)
+		timed('  sort', sorted, d)
+		timed('  date + 30', add, d)
+		timed('  date - 30', subtract, d)
+		timed('  len(date2 - date1)', interval, d)
+		timed('  int(date)', ordinal, d)
+
+def benchmark_lexer(n=1000000, seed=0):
+	"""Benchmark tokenizing `n` date strings (in a variety of formats) with _timelex and _timelex.split."""
+	random 								= Random(seed)
+	formats 							= ('%d-%b-%Y', '%Y-%m-%d', '%d/%m/%Y', '%a, %d %b %Y 10h30 +1100', '%B %d, %Y 4.30pm')
+	strings 							= [format(Date(random.randint(693596, 766645)), random.choice(formats)) for _ in xrange(n)]
+	print 'dateparser (%d strings, %d characters)' % (n, sum(len(s) for s in strings))
+	timed('  _timelex (character at a time)', lex, strings)
+	timed('  _timelex.split (compiled)', tokenize, strings)
+
+def benchmark_format(n=1000000, seed=0):
+	"""Benchmark formatting `n` random dates with time.strftime, format(date, spec) and format_many."""
+	random 								= Random(seed)
+	d 									= [Date(random.randint(693596, 766645)) for _ in xrange(n)]
+	print 'format %%d-%%b-%%Y:12 (%d dates)' % n
+	timed('  time.strftime', strftime, d, '%d-%b-%Y')
+	timed('  format(date, spec) (compiled)', formatted, d, '%d-%b-%Y')
+	timed('  format_many(dates, spec)', format_many, d, '%d-%b-%Y:12')
+
+def benchmark_columnar(n=1000000, seed=0):
+	"""Benchmark serializing `n` sorted random dates with cPickle and :mod:`.columnar`."""
+	random 								= Random(seed)
+	d 									= sorted(Date(random.randint(693596, 766645)) for _ in xrange(n))
+	print 'serialize (%d dates)' % n
+	data 								= timed('  cPickle.dumps', cPickle.dumps, d, 2)
+	timed('  cPickle.loads', cPickle.loads, data)
+	data 								= timed('  columnar.dumps', columnar.dumps, d)
+	timed('  columnar.loads, to Dates', list, columnar.loads(data))
+	timed('  columnar.loads, ordinals only', getattr, columnar.loads(data), 'ordinals')
+
+def benchmark_durations(n=1000000, seed=0):
+	"""Benchmark adding `n` random Durations (of years and months) to `n` random dates, one at a time and as arrays."""
+	random 								= Random(seed)
+	d 									= [Date(random.randint(693596, 766645)) for _ in xrange(n)]
+	durations 							= [Duration(random.randint(0, 10), random.randint(0, 11), 0) for _ in xrange(n)]
+	print 'date + duration (%d dates)' % n
+	timed('  Date + Duration', lambda: [a + b for (a, b) in zip(d, durations)])
+	a, b 								= (DateArray.fromDates(d), DurationArray.fromDurations(durations))
+	timed('  DateArray + DurationArray', a.__add__, b)
+	ends 								= (a + b).toDates()
+	print 'DateInterval.duration (%d intervals)' % n
+	timed('  DateInterval.duration', lambda: [DateInterval(start, end).duration for (start, end) in zip(d, ends)])
+	timed('  datearray.duration', datearray.duration, a, DateArray.fromDates(ends))
+
+def benchmark_today(n=1000000, seed=0):
+	"""Benchmark reading today's date `n` times, from time.localtime and from the (cached) Clock."""
+	print 'today (%d reads)' % n
+	timed('  time.localtime', lambda: [Date(*time.localtime()[:3]) for _ in xrange(n)])
+	timed('  Date.today', lambda: [Date.today for _ in xrange(n)])
+
+def benchmark_timestamps(n=1000000, seed=0):
+	"""Benchmark the dates and formatting of `n` random times, as datetimes, Timestamps and a TimestampArray."""
+	random 								= Random(seed)
+	seconds 							= [random.randint(0, 2000000000) for _ in xrange(n)]
+	datetimes 							= [datetime.datetime.utcfromtimestamp(s) for s in seconds]
+	timestamps 							= [Timestamp(s * 1000000) for s in seconds]
+	t 									= TimestampArray.fromTimestamps(timestamps)
+	print 'timestamp dates (%d times)' % n
+	timed('  datetime.date', lambda: [dt.date() for dt in datetimes])
+	timed('  Timestamp.date', lambda: [ts.date for ts in timestamps])
+	timed('  TimestampArray.dates', lambda: t.dates)
+	print 'timestamp format (%d times)' % n
+	timed('  datetime.strftime', lambda: [dt.strftime('%Y-%m-%d %H:%M') for dt in datetimes])
+	timed('  format(Timestamp)', lambda: [format(ts, '%Y-%m-%d %Hh%M') for ts in timestamps])
+	timed('  timestamp.format_many', timestamp.format_many, t, '%Y-%m-%d %Hh%M')
+
+def benchmark(n=1000000, seed=0):
+	"""Run all the benchmarks."""
+	benchmark_dates(n, seed)
+	benchmark_lexer(n, seed)
+	benchmark_format(n, seed)
+	benchmark_columnar(n, seed)
+	benchmark_durations(n, seed)
+	benchmark_today(n, seed)
+	benchmark_timestamps(n, seed)
+
+if __name__ == '__main__':
+	benchmark(*(int(arg) for arg in sys.argv[1:2]))
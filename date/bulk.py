@@ -0,0 +1,57 @@
+"""Bulk Parsing
+===============
+"""
+from date 								import Date
+from itertools 							import islice
+from multiprocessing 					import Pool
+
+
+def _parseChunk(strings):
+	"""Return ([ordinal, ...], [(offset, string, error), ...]) for a chunk of `strings`, with 0 for a bad string."""
+	ordinals, errors 					= ([], [])
+	for (offset, string) in enumerate(strings):
+		try:
+			ordinals.append(int(Date.fromString(string)))
+		except Exception, e:
+			ordinals.append(0)
+			errors.append((offset, string, str(e)))
+	return ordinals, errors
+
+def _chunks(iterable, chunksize):
+	"""Yield lists of (up to) `chunksize` items from `iterable`."""
+	iterable 							= iter(iterable)
+	chunk 								= list(islice(iterable, chunksize))
+	while chunk:
+		yield chunk
+		chunk 							= list(islice(iterable, chunksize))
+
+def _parsed(iterable, chunksize, workers):
+	"""Yield the results of :func:`_parseChunk` for each chunk of `iterable`, in order."""
+	if not workers or workers == 1:
+		for chunk in _chunks(iterable, chunksize): 	yield _parseChunk(chunk)
+		return
+	pool 								= Pool(workers)
+	try:
+		#Only read (workers * 2) chunks ahead, so the input is streamed rather than read all at once.
+		for chunks in _chunks(_chunks(iterable, chunksize), workers * 2):
+			for result in pool.map(_parseChunk, chunks): 	yield result
+	finally:
+		pool.terminate()
+
+def parse_many(iterable, chunksize=10000, workers=None, ordinals=False):
+	"""Parse an iterable of date strings (as :meth:`.Date.fromString`), returning (dates, errors).
+
+	The strings are read and parsed in chunks of `chunksize`, spread over a pool of `workers` processes
+	(or parsed in this process if `workers` is None). `dates` are in the same order as the strings:
+	a list of Dates (None for a bad string), or, if `ordinals` is True, a numpy array of ordinals (0 for a bad string).
+	`errors` lists (index, string, error message) for each bad string.
+	"""
+	results, errors, start 				= ([], [], 0)
+	for (chunk, chunkErrors) in _parsed(iterable, chunksize, workers):
+		results.append(chunk)
+		errors.extend((start + offset, string, error) for (offset, string, error) in chunkErrors)
+		start 						   += len(chunk)
+	if ordinals:
+		import numpy
+		return numpy.array([n for chunk in results for n in chunk], dtype=numpy.int32), errors
+	return [Date(n) if n else None for chunk in results for n in chunk], errors
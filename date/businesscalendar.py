@@ -0,0 +1,68 @@
+"""Business Calendar
+====================
+"""
+from date 								import Date, Weekend
+from datearray 							import DateArray
+import numpy
+
+
+class BusinessCalendar(object):
+	"""A calendar of business days, i.e. days that are not weekend days or holidays.
+
+	.. inheritance-diagram:: BusinessCalendar
+
+	cal = BusinessCalendar(holidays=[25-Dec-2013, 26-Dec-2013], weekend=Weekend)
+	cal.isBusinessDay(d), cal.addBusinessDays(d, n), cal.businessDaysBetween(d1, d2)
+	Each also accepts DateArrays (and arrays of n), returning arrays.
+
+	A table of business days, and the count of business days before each day, is precomputed
+	for whole years (and extended when required), so these are O(1) or O(log n) lookups.
+	"""
+	def __init__(self, holidays=(), weekend=Weekend):
+		self.weekend 					= numpy.array(sorted(set(int(d) for d in weekend)), dtype=numpy.int32)
+		self.holidays 					= numpy.unique(numpy.array([int(d) for d in holidays], dtype=numpy.int32))
+		if len(self.weekend) >= 7: 		raise ValueError, "A BusinessCalendar must have some business days"
+		self._start, self._end 			= (None, None)
+
+	def _cover(self, lo, hi):
+		"""Ensure the tables include ordinals `lo` to `hi` (extended to whole years)."""
+		if self._start is not None and self._start <= lo and hi <= self._end: 	return
+		if self._start is not None: 	lo, hi = (min(lo, self._start), max(hi, self._end))
+		self._start, self._end 			= (int(Date(Date(int(lo)).y, 1, 1)), int(Date(Date(int(hi)).y, 12, 31)))
+		ordinals 						= numpy.arange(self._start, self._end + 1, dtype=numpy.int32)
+		self._business 					= ~numpy.in1d(ordinals % 7, self.weekend) & ~numpy.in1d(ordinals, self.holidays)
+		self._count 					= numpy.zeros(len(ordinals) + 1, dtype=numpy.int32)
+		numpy.cumsum(self._business, out=self._count[1:])
+
+	def _ordinals(self, *dates):
+		"""Return the ordinals of `dates` (Dates or DateArrays), ensuring the tables include them."""
+		ordinals 						= [d.ordinals if isinstance(d, DateArray) else numpy.int32(int(d)) for d in dates]
+		self._cover(min(o.min() for o in ordinals), max(o.max() for o in ordinals))
+		return ordinals
+
+	def isBusinessDay(self, d):
+		"""Return True if `d` is a business day (or an array of booleans, for a DateArray)."""
+		o, 								= self._ordinals(d)
+		business 						= self._business[o - self._start]
+		return business if isinstance(d, DateArray) else bool(business)
+
+	def businessDaysBetween(self, start, end):
+		"""Return the number of business days after `start`, up to and including `end` (negative if end is before start)."""
+		o1, o2 							= self._ordinals(start, end)
+		between 						= self._count[o2 - self._start + 1] - self._count[o1 - self._start + 1]
+		return between if isinstance(between, numpy.ndarray) else int(between)
+
+	def addBusinessDays(self, d, n):
+		"""Return the `n`th business day after `d` (before, if `n` is negative).
+		If `n` is 0, return `d` if it is a business day, otherwise the next business day."""
+		o, 								= self._ordinals(d)
+		n 								= numpy.asarray(n)
+		while True:
+			#The result is the business day at which the count reaches k.
+			k 							= numpy.where(n > 0, self._count[o - self._start + 1] + n, self._count[o - self._start] + n + 1)
+			before, after 				= (k.min() < 1, k.max() > self._count[-1])
+			if not (before or after): 	break
+			span 						= len(self._business)
+			self._cover(self._start - span if before else self._start, self._end + span if after else self._end)
+		result 							= numpy.asarray(numpy.searchsorted(self._count, k) - 1 + self._start)
+		return DateArray(result) if result.ndim else Date(int(result))
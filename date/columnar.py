@@ -0,0 +1,144 @@
+"""Columnar Serialization
+=========================
+A compact binary format for sequences of Dates, Months, Years or DateIntervals (or Weeks), e.g.::
+
+	data = dumps(dates)						#or dump(dates, file)
+	column = loads(data)					#or load(file), which maps the file rather than reading it
+	column[0], len(column), list(column), column.ordinals
+
+The format is a 12 byte header, (magic, version, tag, count), then a column of `count` little-endian int32s:
+the first value followed by the difference from each value to the next (so sorted columns are small deltas).
+DateIntervals have a second column of lengths (end - start). The tag is the type of every item in the sequence.
+"""
+from date 								import Date, DateInterval, Duration, Interval, Month, Week, Year
+from datearray 							import DateArray, fromOrdinal, toOrdinal, _date
+import mmap
+import numpy
+import struct
+
+_header 								= struct.Struct('<4sBcxxI')
+_magic, _version 						= ('DCOL', 1)
+_int32 									= numpy.dtype('<i4')
+_intervals 								= (('W', Week), ('I', DateInterval), ('V', Interval))
+"""The tag of each class of Interval (of Dates), most specific first, so items are read as the class written."""
+_intervalClasses 						= dict(_intervals)
+
+
+def _encode(items):
+	"""Return (tag, values, lengths) for a sequence of Dates, Months, Years or DateIntervals (or a DateArray)."""
+	if isinstance(items, DateArray): 	return ('D', items.ordinals, None)
+	items 								= list(items)
+	tags 								= set(_tag(cls) for cls in set(map(type, items)))
+	if len(tags) > 1: 					raise TypeError, "Every item must be the same type (Date, Month, Year or DateInterval)"
+	tag 								= tags.pop() if tags else 'D'
+	if tag in _intervalClasses:
+		if any(i._start is None or i._end is None for i in items): 	raise TypeError, "Can't serialize open Intervals"
+		if not all(isinstance(i._start, Date) and isinstance(i._end, Date) for i in items):
+			raise TypeError, "Can only serialize Intervals of Dates"
+		starts 							= DateArray.fromDates([i._start for i in items]).ordinals
+		return (tag, starts, DateArray.fromDates([i._end for i in items]).ordinals - starts)
+	if tag == 'D':
+		ymd 							= numpy.array([d.ymd for d in items], dtype=_int32).reshape(-1, 3)
+		if not ymd[:, 2].all(): 		raise TypeError, "Can't serialize a Date without a day"
+		return (tag, toOrdinal(ymd[:, 0], ymd[:, 1], ymd[:, 2]), None)
+	if tag == 'M': 						return (tag, numpy.array([d.y * 12 + d.m - 1 for d in items], dtype=_int32), None)
+	return (tag, numpy.array([d.y for d in items], dtype=_int32), None)
+
+def _tag(cls):
+	"""Return the tag for items of type `cls`."""
+	if issubclass(cls, Year): 			return 'Y'
+	if issubclass(cls, Month): 			return 'M'
+	if issubclass(cls, Duration): 		raise TypeError, "Can't serialize Durations"
+	if issubclass(cls, Date): 			return 'D'
+	for (tag, interval) in _intervals:
+		if issubclass(cls, interval): 	return tag
+	raise TypeError, "Can't serialize %s" % cls.__name__
+
+def dumps(items):
+	"""Return a sequence of Dates, Months, Years or DateIntervals (all the same type), or a DateArray, as a string."""
+	tag, values, lengths 				= _encode(items)
+	deltas 								= numpy.diff(numpy.concatenate(([0], values)))
+	columns 							= [deltas] + ([] if lengths is None else [lengths])
+	return _header.pack(_magic, _version, tag, len(values)) + ''.join(c.astype(_int32).tostring() for c in columns)
+
+def dump(items, file):
+	"""Write `items` (see :func:`dumps`) to an open (binary) file."""
+	file.write(dumps(items))
+
+
+def loads(data, offset=0):
+	"""Return a :class:`DateColumn` reading `data` (a string, bytearray, memoryview or mmap) from `offset`, without copying it."""
+	return DateColumn(data, offset)
+
+def load(file):
+	"""Return a :class:`DateColumn` reading an open (binary) file, which is memory mapped rather than read."""
+	return DateColumn(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+class DateColumn(object):
+	"""A column of Dates, Months, Years or DateIntervals, read from the format written by :func:`dumps`.
+
+	.. inheritance-diagram:: DateColumn
+
+	c = DateColumn(data) reads `data` (a string, bytearray, memoryview or mmap) in place, it isn't copied
+	len(c), c[i], c[i:j], for item in c, list(c)
+	c.ordinals returns an array of the (decoded) ordinals, c.toDateArray() a DateArray, for a column of Dates
+	c.nbytes is the size of the column in `data` (so columns may be concatenated)
+	"""
+	__slots__ 	= ('tag', 'nbytes', '_deltas', '_lengths', '_values')
+	def __init__(self, data, offset=0):
+		try:
+			data 						= numpy.frombuffer(data, dtype=numpy.uint8)
+		except AttributeError:
+			data 						= numpy.asarray(data)				#a memoryview
+		magic, version, self.tag, n 	= _header.unpack(data[offset:offset + _header.size].tostring())
+		if magic != _magic or version != _version: 	raise ValueError, "Not a DateColumn"
+		columns 						= 2 if self.tag in _intervalClasses else 1
+		start 							= offset + _header.size
+		self.nbytes 					= _header.size + 4 * n * columns
+		if len(data) < offset + self.nbytes: 		raise ValueError, "DateColumn is truncated"
+		self._deltas 					= data[start:start + 4 * n].view(_int32)
+		self._lengths 					= data[start + 4 * n:start + 8 * n].view(_int32) if columns == 2 else None
+		self._values 					= None
+
+	@property
+	def ordinals(self):
+		"""Return the values of the column (ordinals, for Dates or the start of DateIntervals), decoded from the deltas."""
+		if self._values is None: 		self._values = numpy.cumsum(self._deltas, dtype=numpy.int32)
+		return self._values
+
+	def toDateArray(self):
+		"""Return a DateArray of a column of Dates (or the starts of DateIntervals)."""
+		if self.tag != 'D' and self.tag not in _intervalClasses: 	raise TypeError, "Not a column of Dates"
+		return DateArray(self.ordinals)
+
+	def __len__(self): 					return len(self._deltas)
+	def __iter__(self):
+		values 							= self.ordinals
+		if self.tag == 'D':
+			y, m, d 					= fromOrdinal(values)
+			return (_date(*ymd) for ymd in zip(y.tolist(), m.tolist(), d.tolist()))
+		if self._lengths is not None:
+			return (self._item(start, length) for (start, length) in zip(values.tolist(), self._lengths.tolist()))
+		return (self._item(v, None) for v in values.tolist())
+
+	def _item(self, value, length):
+		if self.tag == 'D': 			return Date(value)
+		if self.tag == 'M': 			return Month(value // 12, value % 12 + 1)
+		if self.tag == 'Y': 			return Year(value)
+		interval 						= Interval.__new__(_intervalClasses[self.tag])
+		Interval.__init__(interval, Date(value), Date(value + length))
+		return interval
+
+	def _value(self, i):
+		"""Return the ith value, summing the deltas up to it (rather than decoding the column, if it hasn't been)."""
+		if self._values is not None: 	return int(self._values[i])
+		return int(self._deltas[:i + 1].sum(dtype=numpy.int64))
+
+	def __getitem__(self, item):
+		if isinstance(item, slice):
+			values, lengths 			= (self.ordinals, self._lengths)
+			return [self._item(int(values[i]), None if lengths is None else int(lengths[i])) for i in xrange(*item.indices(len(self)))]
+		if not -len(self) <= item < len(self): 	raise IndexError, "DateColumn index out of range"
+		item 							= item % len(self)
+		return self._item(self._value(item), None if self._lengths is None else int(self._lengths[item]))
@@ -4,7 +4,9 @@
 #TODO - dayfirst should be in Locale
 from classproperty import classproperty
 from dateparser import parse
+from numbers import Number
 from plural import plural
+import re
 import time
 
 
@@ -21,6 +23,116 @@ Sun, Mon, Tue, Wed, Thu, Fri, Sat 	= (Weekday(d) for d in range(0, 7))
 Weekend 							= [Sat, Sun]
 
 
+def _toOrdinal(y, m, d):
+	"""Return the ordinal (day number) of (y, m, d), where 1-Jan-0001 is day 1 (as :meth:`datetime.date.toordinal`)."""
+	#see http://howardhinnant.github.io/date_algorithms.html#days_from_civil
+	y 		   -= (m <= 2)
+	era 		= y // 400
+	yoe 		= y - era * 400
+	doy 		= (153 * (m + (-3 if m > 2 else 9)) + 2) // 5 + d - 1
+	return era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + doy - 305
+
+def _fromOrdinal(n):
+	"""Return (y, m, d) from an ordinal (day number), see :func:`_toOrdinal`."""
+	#see http://howardhinnant.github.io/date_algorithms.html#civil_from_days
+	era, doe 	= divmod(n + 305, 146097)
+	yoe 		= (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+	doy 		= doe - (365 * yoe + yoe // 4 - yoe // 100)
+	mp 			= (5 * doy + 2) // 153
+	m 			= mp + 3 if mp < 10 else mp - 9
+	return (yoe + era * 400 + (m <= 2), m, doy - (153 * mp + 2) // 5 + 1)
+
+def _isLeapYear(y):			return (y % 4 == 0) and ((y % 100 != 0) or (y % 400 == 0))
+
+_mlen 	= (	(31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+			(31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+		)
+def _monthLength(y, m):		return _mlen[_isLeapYear(y)][m-1]
+
+_internSize = 4096
+"""The number of Months (or Years) interned before the cache is cleared."""
+def _intern(cls, ymd):
+	"""Return the shared instance of `cls` (:class:`Month` or :class:`Year`) for `ymd`, creating it if necessary."""
+	try:
+		return cls._interned[ymd]
+	except KeyError:
+		if len(cls._interned) >= _internSize: cls._interned.clear()
+		instance 				= Date.__new__(cls)
+		for (attr, value) in zip(Date.__slots__, ymd):
+			object.__setattr__(instance, attr, value)
+		cls._interned[ymd] 		= instance
+		return instance
+
+_digits 	= tuple('%02d' % i for i in range(100))
+def _weekday(f): 				return _toOrdinal(f[0], f[1], f[2]) % 7
+_directives = {	'd': lambda f: _digits[f[2]],
+				'm': lambda f: _digits[f[1]],
+				'y': lambda f: _digits[f[0] % 100],
+				'Y': lambda f: f[0],
+				'b': lambda f: _monthAbbrs[f[1]],
+				'B': lambda f: _monthNames[f[1]],
+				'a': lambda f: _weekdays[_weekday(f)],
+				'A': lambda f: Weekday._Weekday[_weekday(f)],
+				'w': _weekday,
+				'j': lambda f: '%03d' % (_toOrdinal(f[0], f[1], f[2]) - _toOrdinal(f[0], 1, 1) + 1),
+				'H': '00', 'M': '00', 'S': '00', 'I': '12', 'p': 'AM', '%': '%',
+			}
+"""The strftime directives rendered directly from the fields (y, m, d): a function of the fields, or a constant
+string (the time is midnight). _monthNames and _monthAbbrs (the month names, by month number) are defined after Month."""
+_weekdays 	= tuple(name[:3] for name in Weekday._Weekday)
+
+def _strftime(time_spec, fmt_spec):
+	"""Return a function f(y, m, d) that formats with :func:`time.strftime`, for directives not in :data:`_directives`."""
+	def render(y, m, d):
+		n 						= _toOrdinal(y, m, d) if m and d else 1
+		yday 					= n - _toOrdinal(y, 1, 1) + 1 if m and d else 0
+		return format(time.strftime(time_spec, (y, m, d, 0, 0, 0, (n - 1) % 7, yday, 0)), fmt_spec)
+	return render
+
+def _render(template, getters, fmt_spec):
+	"""Return a function f(*fields) that %-formats `template` with each of `getters` applied to the fields."""
+	if fmt_spec:
+		def render(*fields): 	return format(template % tuple([getter(fields) for getter in getters]), fmt_spec)
+	else:
+		def render(*fields): 	return template % tuple([getter(fields) for getter in getters])
+	return render
+
+_formatters = {}
+def formatter(spec, directives=_directives, strftime=_strftime, formatters=_formatters):
+	"""Return a function f(y, m, d) that formats a date as `format(date, spec)`, e.g. formatter('%d-%b-%Y:12').
+	Returns None if `spec` has no strftime part (the date is formatted as a string).
+	Each spec is compiled once, to a %-format template (with the constant directives filled in) and the functions
+	of the fields for the others; other strftime directives use :func:`time.strftime`.
+	Other types (e.g. :class:`.Timestamp`) pass their own `directives`, `strftime` fallback and cache of `formatters`."""
+	try:
+		return formatters[spec]
+	except KeyError:
+		pass
+	time_spec, fmt_spec 		= spec.split(':') if ':' in spec else (spec, '')
+	parts 						= re.split('(%.?)', time_spec)
+	if not time_spec:
+		render 					= None
+	elif all(part[1:] in directives for part in parts[1::2]):
+		template, getters 		= (parts[0].replace('%', '%%'), [])
+		for (directive, text) in zip(parts[1::2], parts[2::2]):
+			value 				= directives[directive[1:]]
+			if callable(value): getters.append(value)
+			template 		   += ('%s' if callable(value) else value.replace('%', '%%')) + text.replace('%', '%%')
+		render 					= _render(template, tuple(getters), fmt_spec)
+	else:
+		render 					= strftime(time_spec, fmt_spec)
+	if len(formatters) >= _internSize: formatters.clear()
+	formatters[spec] 			= render
+	return render
+
+def format_many(dates, spec):
+	"""Return a list of `dates` (Dates, or a :class:`.DateArray`) each formatted by `spec`, as `format(date, spec)`."""
+	render 						= formatter(spec)
+	if render is None: 			return [format(d, spec) for d in dates]
+	if hasattr(dates, 'ordinals'): 	return map(render, *(a.tolist() for a in dates.ymd))
+	return [render(d.y, d.m, d.d) for d in dates]
+
+
 class Date(object):
 	"""An idealised date (year, month, day).
 
@@ -38,26 +150,28 @@ class Date(object):
 	def __init__(self, y, m=None, d=None):
 		if m is None and d is None: return self._toDate(y)
 		self.ymd = (y, m, d)
-		if d> len(self.month): raise OverflowError, "Day is past end of month"
+		if d> _monthLength(y, m): raise OverflowError, "Day is past end of month"
 
 	@classproperty
 	@classmethod
-	def today(self):
-		now = time.localtime()
-		return Date(now[0], now[1], now[2])
+	def today(self): 			return Date.clock.today
 
 	@classproperty
 	@classmethod
-	def tomorrow(self):  		return Date.today + 1*days
+	def tomorrow(self):  		return Date.clock.tomorrow
 
 	@classproperty
 	@classmethod
-	def yesterday(self): 		return Date.today - 1*days
+	def yesterday(self): 		return Date.clock.yesterday
 
 	@classmethod
 	def fromString(self, string):
-		date 					= parse(string, dayfirst=True).date()
-		return Date(date.year, date.month, date.day)
+		"""Return a Date from a string, e.g. '15-Jan-2013'. Common formats are handled by :data:`recognisers`."""
+		date 					= recognisers(string)
+		if date is None:
+			date 				= parse(string, dayfirst=True).date()
+			date 				= Date(date.year, date.month, date.day)
+		return date
 
 	@property
 	def day(self): 		 		return self
@@ -88,56 +202,88 @@ class Date(object):
 	def __le__(self, d):		return (self.ymd <= d.ymd)
 	def __gt__(self, d): 		return (self.ymd  > d.ymd)
 	def __ge__(self, d): 		return (self.ymd >= d.ymd)
-	def inLeapYear(self):		return (self.y % 4 == 0) and ((self.y % 100 !=0) or (self.y % 400 == 0))
+	def inLeapYear(self):		return _isLeapYear(self.y)
 	def _hyphenate(self, a, b):	return '%s%s%s' % (a, '-' if a and b else '', b)
 	def __str__(self): 			return self._hyphenate(self.d if self.d else '', str(self.month))
-	def __add__(self, n): 		return Date(int(self) + n) if n != 0 else self
+	def __add__(self, n):
+		if not isinstance(n, Number): 	return NotImplemented		#e.g. a DurationArray
+		return Date(int(self) + n) if n != 0 else self
 	def __hash__(self):			return hash((self.y, self.m, self.d))
 	def __format__(self, spec):
 		"""Allow strftime formatting e.g. format(date, '%d%m%y:6')."""
 		#TODO - This assumes a :, doesn't allow "!%d" or "!%d:6", just "%d:".
-		time_spec, fmt_spec 	= spec.split(':') if ':' in spec else (spec, '')
-		formatted				= time.strftime(time_spec, self.timetuple) if time_spec != '' else None
-		return format(str(self) if formatted is None else formatted, fmt_spec)
+		try:
+			render 				= _formatters[spec]
+		except KeyError:
+			render 				= formatter(spec)
+		return format(str(self), spec.lstrip(':')) if render is None else render(self.y, self.m, self.d)
 	def __getitem__(self, item):
 		if isinstance(item, Weekday) and self.d==0 and self.m!=0 and self.y!=0:
-			return [d for d in self if d.weekday==item]
+			end 				= _toOrdinal(self.y, self.m, 1) + _monthLength(self.y, self.m)
+			return [Date(d) for d in xrange(int(nthWeekday(self, item)), end, 7)]
 		return self.month[item] if self.d==0 else None
 
-	def __int__(self):
-		from datetime import date
-		return date(self.y, self.m, self.d).toordinal()
-	# 	#see http://www.hermetic.ch/cal_stud/jdn.htm
-	# 	o = ( self.m - 14 ) // 12
-	# 	return (( 1461 * (   self.y + 4800 +   o ) ) //   4 +
-	# 			(  367 * (   self.m - 2 - 12 * o ) ) //  12 -
-	# 			(    3 * ( ( self.y + 4900 +   o )   // 100 ) ) // 4 +
-	# 			self.d - 32075 )
-
-	def _toDate(self, jd):
-		from datetime import date
-		d = date.fromordinal(jd)
-		self.ymd = (d.year, d.month, d.day)
-	# 	#see http://www.hermetic.ch/cal_stud/jdn.htm
-	# 	l = jd + 68568
-	# 	n = ( 4 * l ) // 146097
-	# 	l = l - ( 146097 * n + 3 ) // 4
-	# 	i = ( 4000 * ( l + 1 ) ) // 1461001
-	# 	l = l - ( 1461 * i ) // 4 + 31
-	# 	j = ( 80 * l ) // 2447
-	# 	d = l - ( 2447 * j ) // 80
-	# 	l = j // 11
-	# 	m = j + 2 - ( 12 * l )
-	# 	y = 100 * ( n - 49 ) + i + l
-	# 	self.ymd = (y, m, d)
+	def __int__(self):			return _toOrdinal(self.y, self.m, self.d)
+	def _toDate(self, n):		self.ymd = _fromOrdinal(n)
 
 	def __sub__(self, other):
 		if isinstance(other, Date):					return DateInterval(other, self)
 		#Hack for Date Literals in program source code
 		if isinstance(other, int) and self.y==0: 	return Date(other, self.m, self.d)
+		if not isinstance(other, Number): 			return NotImplemented		#e.g. a DateArray
 		return Date(int(self) - other) if other != 0 else self
 
 
+class OrdinalDate(Date):
+	"""A Date that also stores its ordinal (day number), with (y, m, d) derived from the ordinal.
+
+	.. inheritance-diagram:: OrdinalDate
+
+	d = OrdinalDate(2013, 1, 15), OrdinalDate(n) or OrdinalDate.fromDate(15-Jan-2013)
+	The ordinal is only calculated once, so int(d), d + n, d - n, d2 - d1 and comparing
+	(e.g. sorting) OrdinalDates are all integer operations.
+	"""
+	__slots__ 	= ('_ordinal',)
+	def __init__(self, y, m=None, d=None):
+		if m is None and d is None:
+			self.y, self.m, self.d 		= _fromOrdinal(y)
+			self._ordinal 				= y
+		else:
+			Date.__init__(self, y, m, d)
+
+	@classmethod
+	def fromDate(cls, date):	return cls(*date.ymd)
+
+	@property
+	def ymd(self): 				return (self.y, self.m, self.d)
+	@ymd.setter
+	def ymd(self, value):
+		"""Set (y, m, d), and the ordinal from them."""
+		self.y, self.m, self.d 			= value
+		self._ordinal 					= _toOrdinal(*value)
+
+	def __int__(self):			return self._ordinal
+	def __setstate__(self, s):	OrdinalDate.__init__(self, *s)
+	def __eq__(self, d): 		return (self._ordinal == d._ordinal) if isinstance(d, OrdinalDate) else Date.__eq__(self, d)
+	def __ne__(self, d): 		return (self._ordinal != d._ordinal) if isinstance(d, OrdinalDate) else Date.__ne__(self, d)
+	def __lt__(self, d): 		return (self._ordinal  < d._ordinal) if isinstance(d, OrdinalDate) else Date.__lt__(self, d)
+	def __le__(self, d):		return (self._ordinal <= d._ordinal) if isinstance(d, OrdinalDate) else Date.__le__(self, d)
+	def __gt__(self, d): 		return (self._ordinal  > d._ordinal) if isinstance(d, OrdinalDate) else Date.__gt__(self, d)
+	def __ge__(self, d): 		return (self._ordinal >= d._ordinal) if isinstance(d, OrdinalDate) else Date.__ge__(self, d)
+	def __hash__(self):			return Date.__hash__(self)
+
+	def __add__(self, n):
+		if isinstance(n, Duration):					return self.fromDate(n.__radd__(self))
+		if not isinstance(n, Number): 				return NotImplemented
+		return OrdinalDate(self._ordinal + n) if n != 0 else self
+
+	def __sub__(self, other):
+		if isinstance(other, Duration):				return self.fromDate(other.__rsub__(self))
+		if isinstance(other, Date):					return DateInterval(other, self)
+		if not isinstance(other, Number): 			return NotImplemented
+		return OrdinalDate(self._ordinal - other) if other != 0 else self
+
+
 class Month(Date):
 	"""A Date object representing just a Month and, optionally, a Year.
 
@@ -145,35 +291,34 @@ class Month(Date):
 
 	List operations, e.g. Jan-2013[1], [-1], for d in Jan-2013, len(Jan-2013)
 	29 in Feb-2013
+	Months are interned: Month(2013, 1) always returns the same (immutable) object.
 	"""
 	__slots__ = ()
+	_interned = {}
 	_Month = (	'January', 'February', 'March',
 				'April',   'May',      'June',
 				'July',    'August',   'September',
 				'October', 'November', 'December',
 			)
-
-	_mlen  = (	31, 28, 31,
-				30, 31, 30,
-				31, 31, 30,
-				31, 30, 31,
-			)
-	def __init__(self, y, m, d=0): 		self.ymd = (y, m, d)
-	def __getitem__(self, item): 		return Date(self.y, self.m, item + (len(self.month)+1 if item<0 else 0))
+	def __new__(cls, y, m, d=0):		return _intern(cls, (y, m, d))
+	def __init__(self, y, m, d=0): 		pass
+	def __reduce__(self):				return (Month, self.ymd)
+	def __setattr__(self, attr, value):	raise AttributeError, "Months are immutable"
+	def __getitem__(self, item): 		return Date(self.y, self.m, item + (len(self)+1 if item<0 else 0))
 	def __contains__(self, d): 			return (0 < d <= len(self)) if self.m != 0 else False
 	def __str__(self): 					return self._hyphenate(self._Month[self.m-1][:3] if self.m else '', str(self.year))
 	def __add__(self, n): 				return Month((self.m+n-1)//12, ((self.m + n-1) % 12) +1, 0)
-	def __iter__(self): 				return (Date(self.y, self.m, d+1) for d in range(0, len(self.month)))
-
-	def __len__(self):
-		if self.m == 0: return len(self.year)
-		return self._mlen[self.m-1] + (1 if self.m == 2 and self.inLeapYear() else 0)
+	def __iter__(self): 				return (Date(self.y, self.m, d+1) for d in range(0, len(self)))
+	def __len__(self): 					return _monthLength(self.y, self.m) if self.m != 0 else len(self.year)
 
 	#Hacks for Date Literals in program source code
 	def __rsub__(self, d):
 		if isinstance(d, int) and self.d==0: return Date(self.y, self.m, d)
 
 Jan, Feb, Mar, Apr, May, Jun, Jul, Aug, Sep, Oct, Nov, Dec = (Month(0, m) for m in range(1, 13))
+_monthNames 	= (None,) + Month._Month
+_monthAbbrs 	= (None,) + tuple(name[:3] for name in Month._Month)
+"""The month names (and abbreviations) by month number, for :data:`_directives`."""
 
 
 class Year(Date):
@@ -182,13 +327,144 @@ class Year(Date):
 	.. inheritance-diagram:: Year
 
 	List operations, e.g. for d in Year(2013), len(Year(2013)
+	Years are interned: Year(2013) always returns the same (immutable) object.
 	"""
 	__slots__ = ()
-	def __init__(self, y): 	self.ymd = (y, 0, 0)
+	_interned = {}
+	def __new__(cls, y):	return _intern(cls, (y, 0, 0))
+	def __init__(self, y): 	pass
+	def __reduce__(self):	return (Year, (self.y,))
+	def __setattr__(self, a, v):	raise AttributeError, "Years are immutable"
 	def __str__(self): 		return ('%4d' % self.y) if self.y else ''
 	def __len__(self): 		return 365 + (1 if self.inLeapYear() else 0)
 	def __add__(self, n):	return Year(self.y+n)
-	def __iter__(self): 	return (d for m in range(0, 12) for d in Date(self.y, m+1, 0))
+	def __iter__(self): 	return (d for m in range(0, 12) for d in Month(self.y, m+1))
+
+
+class DateRecognisers(object):
+	"""Recognise the most common date formats with precompiled regular expressions.
+
+	:meth:`Date.fromString` tries these before the general (but much slower) :func:`.dateparser.parse`.
+	Formats are 2013-01-15, 15-Jan-2013, 15/01/2013 (day first) and 20130115. A string that
+	is not in one of these formats (or is not a valid date) returns None, to be parsed in full.
+	`hits` and `misses` count the strings recognised, or not.
+	"""
+	_formats 	= (	(re.compile(r'(\d{4})-(\d\d)-(\d\d)$'), 			(0, 1, 2)),
+					(re.compile(r'(\d\d?)-([A-Za-z]{3,9})-(\d{4})$'), 	(2, 1, 0)),
+					(re.compile(r'(\d\d?)/(\d\d?)/(\d{4})$'), 			(2, 1, 0)),
+					(re.compile(r'(\d{4})(\d\d)(\d\d)$'), 				(0, 1, 2)),
+				)
+	_months 	= dict((name[:n].lower(), m+1) for (m, name) in enumerate(Month._Month) for n in (3, len(name)))
+	def __init__(self): 		self.hits, self.misses = (0, 0)
+	def __repr__(self):			return '%s(hits=%d, misses=%d)' % (self.__class__.__name__, self.hits, self.misses)
+
+	def __call__(self, string):
+		"""Return a Date from `string` if it is in a recognised format, otherwise None."""
+		string 					= string.strip()
+		for (regex, order) in self._formats:
+			match 				= regex.match(string)
+			if match:
+				y, m, d 		= (match.group(i+1) for i in order)
+				y, m, d 		= (int(y), int(m) if m.isdigit() else self._months.get(m.lower(), 0), int(d))
+				if y > 0 and 1 <= m <= 12 and 1 <= d <= _monthLength(y, m):
+					self.hits  += 1
+					return Date(y, m, d)
+				break
+		self.misses 		   += 1
+		return None
+
+recognisers = DateRecognisers()
+"""The :class:`DateRecognisers` used by :meth:`Date.fromString`."""
+
+
+class Clock(object):
+	"""The current time, for :attr:`Date.today`, :attr:`Date.tomorrow` and :attr:`Date.yesterday`.
+
+	.. inheritance-diagram:: Clock
+
+	The current Date (and the Dates either side of it) are cached, as (y, m, d), until the next local midnight, so reading them is
+	a comparison and creating a Date (a new one each time, as Dates are mutable).
+	Clock(source) reads the time from `source`, a function returning seconds since the epoch (default time.time).
+	clock.freeze(15-Jan-2013) stops the clock at the start of a Date (or a time, in seconds), clock.freeze() at the current time
+	clock.advance(seconds) moves the clock on (or back), whether frozen or not, clock.unfreeze() restarts it from the source
+	Date.clock is the Clock Date.today reads, and may be replaced, e.g. Date.clock = Clock(source).
+	"""
+	__slots__ 	= ('source', '_offset', '_frozen', '_start', '_end', '_days')
+	def __init__(self, source=time.time):
+		self.source, self._offset, self._frozen 	= (source, 0, None)
+		self._reset()
+
+	def _reset(self): 			self._start, self._end = (0, 0)
+	def _tick(self, now):
+		"""Cache the (y, m, d) of the (local) day of `now` and the days either side of it, and the times it starts and ends."""
+		y, m, d 				= time.localtime(now)[:3]
+		today 					= Date(y, m, d)
+		tomorrow 				= today + 1
+		self._days 				= ((today - 1).ymd, today.ymd, tomorrow.ymd)
+		self._start 			= time.mktime((y, m, d, 0, 0, 0, 0, 0, -1))
+		self._end 				= time.mktime((tomorrow.y, tomorrow.m, tomorrow.d, 0, 0, 0, 0, 0, -1))
+
+	def time(self):
+		"""Return the current time, in seconds since the epoch."""
+		return self._frozen if self._frozen is not None else self.source() + self._offset
+
+	def _day(self, i):
+		now 					= self.time()
+		if not self._start <= now < self._end: 	self._tick(now)
+		return Date(*self._days[i])
+	@property
+	def today(self): 			return self._day(1)
+	@property
+	def tomorrow(self): 		return self._day(2)
+	@property
+	def yesterday(self): 		return self._day(0)
+
+	def freeze(self, at=None):
+		"""Stop the clock at `at` (the start of a Date, or a time in seconds), or at the current time."""
+		if isinstance(at, Date): 	at = time.mktime((at.y, at.m, at.d, 0, 0, 0, 0, 0, -1))
+		self._frozen 			= self.time() if at is None else at
+		self._reset()
+		return self
+	def advance(self, seconds):
+		"""Move the clock on by `seconds` (back, if negative)."""
+		if self._frozen is not None: 	self._frozen += seconds
+		else: 							self._offset += seconds
+		self._reset()
+		return self
+	def unfreeze(self):
+		"""Restart the clock, reading the time from the source (without any offset)."""
+		self._frozen, self._offset 	= (None, 0)
+		self._reset()
+		return self
+
+clock = Date.clock = Clock()
+"""The default :class:`Clock`, used by :attr:`Date.today`."""
+
+
+def nthWeekday(month, weekday, n=1):
+	"""Return the `n`th `weekday` of `month` (a Month, or any Date in it), e.g. nthWeekday(Jan-2013, Tue, 2) is 8-Jan-2013.
+	A negative `n` counts back from the end of the month, e.g. -1 is the last `weekday` (see :func:`lastWeekday`).
+	Calculated from ordinals, without iterating over the month. Raises IndexError if there is no `n`th `weekday`."""
+	first, length 				= (_toOrdinal(month.y, month.m, 1), _monthLength(month.y, month.m))
+	if n > 0: 					ordinal = first + (weekday - first) % 7 + 7 * (n - 1)
+	else: 						ordinal = first + length - 1 - (first + length - 1 - weekday) % 7 + 7 * (n + 1)
+	if n == 0 or not first <= ordinal < first + length:
+		raise IndexError, "There is no %s %s in %s" % (n, Weekday(weekday), Month(month.y, month.m))
+	return Date(ordinal)
+
+def lastWeekday(month, weekday):
+	"""Return the last `weekday` of `month` (a Month, or any Date in it), e.g. lastWeekday(Jan-2013, Fri) is 25-Jan-2013."""
+	return nthWeekday(month, weekday, -1)
+
+def nextWeekday(d, weekday):
+	"""Return the first `weekday` on or after `d`, e.g. nextWeekday(1-Jan-2013, Fri) is 4-Jan-2013."""
+	ordinal 					= int(d)
+	return Date(ordinal + (weekday - ordinal) % 7)
+
+def previousWeekday(d, weekday):
+	"""Return the last `weekday` on or before `d`, e.g. previousWeekday(1-Jan-2013, Fri) is 28-Dec-2012."""
+	ordinal 					= int(d)
+	return Date(ordinal - (ordinal - weekday) % 7)
 
 
 class Duration(Date):
@@ -215,12 +491,9 @@ class Duration(Date):
 
 	def __radd__(self, d):
 		if not isinstance(d, Date): raise TypeError
-		#print d, 'plus', self.y, self.m, self.d,
-		yy 		= d.year    	+ self.y
-		mm 		= d.month 		+ self.m
-		dd      = min(len(Month(yy.y + mm.y, mm.m)), d.d)
-		result 	= Date(yy.y + mm.y, mm.m, dd) + self.d
-		return result
+		mm 		= d.m - 1 + self.m
+		yy, mm	= (d.y + self.y + mm // 12, mm % 12 + 1)
+		return Date(yy, mm, min(_monthLength(yy, mm), d.d)) + self.d
 
 	def __rsub__(self, d):
 		if not isinstance(d, Date): raise TypeError
@@ -326,3 +599,63 @@ class Week(DateInterval):
 	.. inheritance-diagram:: Week
 	"""
 	def __init__(self, start): super(DateInterval, self).__init__(start, start+6)
+
+
+class DateRange(object):
+	"""A lazy range of Dates from `start` to `end` (inclusive), every `step`.
+
+	.. inheritance-diagram:: DateRange
+
+	`step` is a number of days (default 1) or a Duration, e.g. DateRange(31-Jan-2013, 31-Dec-2013, 1*months)
+	is the month ends of 2013. Each Date is calculated from `start` (start + i*step), so is only created when needed.
+	len(r), d in r and r[i] are calculated from ordinals, without iterating.
+	Slices and reversed(r) are DateRanges too, e.g. r[::3], r[-12:], reversed(r).
+	"""
+	__slots__ 	= ('_start', '_step', '_first', '_stride', '_len')
+	def __init__(self, start, end, step=1):
+		if isinstance(step, Duration) and step.y == 0 and step.m == 0: step = step.d
+		if (step.months <= 0 and step.d <= 0) if isinstance(step, Duration) else step <= 0:
+			raise ValueError, "DateRange step must be positive"
+		self._start, self._step, self._first, self._stride 	= (start, step, 0, 1)
+		self._len 								= max(self._floor(int(end)) + 1, 0)
+
+	def _at(self, j):
+		"""Return the ordinal of the `j`th step from start."""
+		if isinstance(self._step, Duration): 	return int(self._start + self._step * j)
+		return int(self._start) + self._step * j
+
+	def _floor(self, ordinal):
+		"""Return the last step from start that is on or before `ordinal` (-1 if ordinal is before start)."""
+		if not isinstance(self._step, Duration): return (ordinal - int(self._start)) // self._step
+		#Estimate from the average length of a step, then correct for the different month lengths.
+		j 										= int((ordinal - int(self._start)) // (self._step.months * 30.436875 + self._step.d))
+		while self._at(j + 1) <= ordinal:	j += 1
+		while j >= 0 and self._at(j) > ordinal:	j -= 1
+		return max(j, -1)
+
+	def __len__(self): 							return self._len
+	def __str__(self): 							return '[%s..%s]' % (self[0], self[-1]) if self else '[]'
+	def __repr__(self):
+		return '%s(%s,%s,%s)' % (self.__class__.__name__, self[0], self[-1], self._step * self._stride) if self else 'DateRange()'
+	def __reversed__(self): 					return self[::-1]
+
+	def __iter__(self):
+		if isinstance(self._step, Duration): 	return (self[i] for i in xrange(self._len))
+		step 									= self._step * self._stride
+		return (Date(o) for o in xrange(self._at(self._first), self._at(self._first) + step * self._len, step))
+
+	def __getitem__(self, item):
+		if isinstance(item, slice):
+			start, stop, stride 				= item.indices(self._len)
+			r 									= DateRange.__new__(DateRange)
+			r._start, r._step, r._len 			= (self._start, self._step, len(xrange(start, stop, stride)))
+			r._first, r._stride 				= (self._first + start * self._stride, self._stride * stride)
+			return r
+		if not -self._len <= item < self._len: 	raise IndexError, "DateRange index out of range"
+		return Date(self._at(self._first + (item % self._len) * self._stride))
+
+	def __contains__(self, d):
+		if not isinstance(d, Date) or d.d == 0:	return False
+		j 										= self._floor(int(d))
+		i, offset 								= divmod(j - self._first, self._stride)
+		return self._at(j) == int(d) and offset == 0 and 0 <= i < self._len
@@ -0,0 +1,305 @@
+"""Date Array
+=============
+"""
+from date 								import Date, Duration, _mlen
+from timestamp 							import Timestamp, _epoch, _usPerDay, _usPerSecond
+import numpy
+
+
+def toOrdinal(y, m, d):
+	"""Return an array of ordinals (as returned by `int(Date)`) from arrays of years, months and days."""
+	#see http://howardhinnant.github.io/date_algorithms.html#days_from_civil
+	y, m, d 							= (numpy.asarray(a, dtype=numpy.int32) for a in (y, m, d))
+	y 									= y - (m <= 2)
+	era 								= y // 400
+	yoe 								= y - era * 400
+	doy 								= (153 * (m + numpy.where(m > 2, -3, 9)) + 2) // 5 + d - 1
+	doe 								= yoe * 365 + yoe // 4 - yoe // 100 + doy
+	return (era * 146097 + doe - 305).astype(numpy.int32)
+
+def fromOrdinal(ordinals):
+	"""Return a tuple of arrays (years, months, days) from an array of ordinals."""
+	#see http://howardhinnant.github.io/date_algorithms.html#civil_from_days
+	z 									= numpy.asarray(ordinals, dtype=numpy.int32) + 305
+	era 								= z // 146097
+	doe 								= z - era * 146097
+	yoe 								= (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+	doy 								= doe - (365 * yoe + yoe // 4 - yoe // 100)
+	mp 									= (5 * doy + 2) // 153
+	d 									= doy - (153 * mp + 2) // 5 + 1
+	m 									= mp + numpy.where(mp < 10, 3, -9)
+	y 									= yoe + era * 400 + (m <= 2)
+	return y.astype(numpy.int32), m.astype(numpy.int32), d.astype(numpy.int32)
+
+def isLeapYear(y):
+	"""Return a boolean array, True for each year in `y` that is a leap year."""
+	return (y % 4 == 0) & ((y % 100 != 0) | (y % 400 == 0))
+
+_mlen 									= numpy.array(_mlen, dtype=numpy.int32)
+def monthLength(y, m):
+	"""Return the number of days in each month (`y`, `m`)."""
+	return _mlen[numpy.asarray(isLeapYear(y), dtype=numpy.intp), m - 1]
+
+def addDuration(ordinals, duration):
+	"""Add a :class:`.Duration` (or :class:`DurationArray`) to an array of ordinals, clamping to the end of the month
+	(as `Date + Duration` does, i.e. the years and months are added, then the days)."""
+	months 								= numpy.asarray(duration.y * 12 + duration.m)
+	if not months.any(): 				return ordinals + duration.d
+	y, m, d 							= fromOrdinal(ordinals)
+	mm 									= y * 12 + (m - 1) + months
+	y, m 								= mm // 12, mm % 12 + 1
+	return toOrdinal(y, m, numpy.minimum(d, monthLength(y, m))) + duration.d
+
+def nthWeekday(y, m, weekday, n=1):
+	"""Return a DateArray of the `n`th `weekday` of each month (`y`, `m`), as :func:`.date.nthWeekday`.
+	Any of the arguments may be arrays (e.g. of months, or of weekdays). Raises IndexError if a month has no `n`th `weekday`."""
+	y, m, weekday, n 					= numpy.broadcast_arrays(*(numpy.asarray(a, dtype=numpy.int32) for a in (y, m, weekday, n)))
+	first 								= toOrdinal(y, m, 1)
+	last 								= first + monthLength(y, m) - 1
+	ordinals 							= numpy.where(n > 0, first + (weekday - first) % 7 + 7 * (n - 1), last - (last - weekday) % 7 + 7 * (n + 1))
+	if ((n == 0) | (ordinals < first) | (ordinals > last)).any(): 	raise IndexError, "A month has no such weekday"
+	return DateArray(ordinals)
+
+def lastWeekday(y, m, weekday):
+	"""Return a DateArray of the last `weekday` of each month (`y`, `m`)."""
+	return nthWeekday(y, m, weekday, -1)
+
+def nextWeekday(dates, weekday):
+	"""Return a DateArray of the first `weekday` on or after each of `dates` (a DateArray)."""
+	return DateArray(dates.ordinals + (weekday - dates.ordinals) % 7)
+
+def previousWeekday(dates, weekday):
+	"""Return a DateArray of the last `weekday` on or before each of `dates` (a DateArray)."""
+	return DateArray(dates.ordinals - (dates.ordinals - weekday) % 7)
+
+def duration(starts, ends):
+	"""Return arrays (years, months, days) of the duration from each of `starts` to each of `ends`
+	(DateArrays or arrays of ordinals), the same as :attr:`.DateInterval.duration`."""
+	(y1, m1, d1), (y2, m2, d2) 			= (fromOrdinal(_ordinals(starts)), fromOrdinal(_ordinals(ends)))
+	overflow_m, overflow_d 				= (m1 > m2, d1 > d2)
+	mm 									= m2 - m1 + 12 * overflow_m - overflow_d
+	before 								= y2 * 12 + m2 - 2				#The month before the end
+	dd 									= d2 - d1 + numpy.where(overflow_d, monthLength(before // 12, before % 12 + 1), 0)
+	return y2 - y1 - overflow_m + mm // 12, mm % 12, dd
+
+def durationDays(starts, ends):
+	"""Return an array of the number of days from each of `starts` to each of `ends`, as :attr:`.DateInterval.days`."""
+	return numpy.abs(_ordinals(ends) - _ordinals(starts))
+
+def durationMonths(starts, ends):
+	"""Return an array of the number of whole months from each of `starts` to each of `ends`, as :attr:`.DateInterval.months`."""
+	y, m, d 							= duration(starts, ends)
+	return y * 12 + m
+
+def _ordinals(dates):					return dates.ordinals if isinstance(dates, DateArray) else numpy.asarray(dates, dtype=numpy.int32)
+
+def _date(y, m, d):
+	"""Return a Date from (`y`, `m`, `d`), known to be valid."""
+	date 								= Date.__new__(Date)
+	date.ymd 							= (y, m, d)
+	return date
+
+
+class DateArray(object):
+	"""An array of Dates, stored as a numpy array of ordinals (as returned by `int(Date)`).
+
+	.. inheritance-diagram:: DateArray
+
+	a = DateArray.fromDates([1-Jan-2013, 15-Jan-2013]) returns a DateArray of two dates
+	DateArray(ordinals) returns a DateArray from an array of ordinals (without copying)
+	a.year, a.month, a.day and a.weekday return numpy arrays of the date components, a.inLeapYear() too
+	a + 1, a - 3*months, a < 10-Jan-2013 operate on the whole array at once
+	a[0] returns a Date, a[1:] and a[a.weekday == Mon] return DateArrays
+	"""
+	__slots__ 	= ('ordinals',)
+	def __init__(self, ordinals):		self.ordinals = numpy.asarray(ordinals, dtype=numpy.int32)
+
+	@classmethod
+	def fromDates(cls, dates):
+		"""Return a DateArray from a sequence of Dates."""
+		ymd 							= numpy.array([d.ymd for d in dates], dtype=numpy.int32).reshape(-1, 3)
+		return cls(toOrdinal(ymd[:, 0], ymd[:, 1], ymd[:, 2]))
+
+	def toDates(self):
+		"""Return a list of the Dates in this DateArray."""
+		y, m, d 						= fromOrdinal(self.ordinals)
+		return [_date(*ymd) for ymd in zip(y.tolist(), m.tolist(), d.tolist())]
+
+	@property
+	def ymd(self): 						return fromOrdinal(self.ordinals)
+	@property
+	def year(self): 					return self.ymd[0]
+	@property
+	def month(self): 					return self.ymd[1]
+	@property
+	def day(self): 						return self.ymd[2]
+	@property
+	def weekday(self): 					return self.ordinals % 7
+	def inLeapYear(self): 				return isLeapYear(self.year)
+
+	def __len__(self): 					return len(self.ordinals)
+	def __iter__(self): 				return iter(self.toDates())
+	def __repr__(self): 				return '%s(%s)' % (self.__class__.__name__, self)
+	def __str__(self):
+		dates 							= self.toDates() if len(self) <= 6 else self[:3].toDates() + ['...'] + self[-3:].toDates()
+		return '[%s]' % ', '.join(str(d) for d in dates)
+	def __getitem__(self, item):
+		if isinstance(item, (int, long, numpy.integer)): 	return Date(int(self.ordinals[item]))
+		return DateArray(self.ordinals[item])
+
+	def _ordinals(self, other):
+		"""Return `other` (a DateArray, Date, ordinal or array of ordinals) as ordinal(s)."""
+		if isinstance(other, DateArray): 	return other.ordinals
+		if isinstance(other, Date): 		return int(other)
+		return other
+	def __eq__(self, other): 			return self.ordinals == self._ordinals(other)
+	def __ne__(self, other): 			return self.ordinals != self._ordinals(other)
+	def __lt__(self, other): 			return self.ordinals  < self._ordinals(other)
+	def __le__(self, other): 			return self.ordinals <= self._ordinals(other)
+	def __gt__(self, other): 			return self.ordinals  > self._ordinals(other)
+	def __ge__(self, other): 			return self.ordinals >= self._ordinals(other)
+	__hash__ 							= None
+
+	def __add__(self, n):
+		if isinstance(n, (Duration, DurationArray)): 	return DateArray(addDuration(self.ordinals, n))
+		return DateArray(self.ordinals + n)
+	__radd__ 							= __add__
+
+	def __sub__(self, other):
+		"""Subtract a Duration (or DurationArray) or a number of days, or return the number of days between DateArrays (or Dates)."""
+		if isinstance(other, (Duration, DurationArray)): 	return self + other * -1
+		if isinstance(other, (DateArray, Date)): 		return self.ordinals - self._ordinals(other)
+		return DateArray(self.ordinals - other)
+	def __rsub__(self, other):
+		"""Return the number of days from each Date in this DateArray to `other` (a Date)."""
+		return self._ordinals(other) - self.ordinals
+
+
+class DurationArray(object):
+	"""An array of Durations, stored as numpy arrays of years, months and days.
+
+	.. inheritance-diagram:: DurationArray
+
+	a = DurationArray(years=[1, 2, 3]) or DurationArray(y, m, d) returns a DurationArray from arrays (or numbers) of each
+	a = DurationArray.fromDurations([1*years, 6*months]) returns a DurationArray from a sequence of Durations
+	dates + a, dates - a add (subtract) each Duration to (from) the corresponding Date, clamping to the end of the month
+	as Date + Duration does, e.g. 31-Jan-2013 + 1*months is 28-Feb-2013. dates may be a DateArray or a Date.
+	a * n, -a, a + b, len(a), a[0] (a Duration), a[1:] (a DurationArray)
+	"""
+	__slots__ 	= ('y', 'm', 'd')
+	def __init__(self, years=0, months=0, days=0):
+		self.y, self.m, self.d 			= numpy.broadcast_arrays(*(numpy.asarray(a, dtype=numpy.int32) for a in (years, months, days)))
+
+	@classmethod
+	def fromDurations(cls, durations):
+		"""Return a DurationArray from a sequence of Durations."""
+		ymd 							= numpy.array([d.ymd for d in durations], dtype=numpy.int32).reshape(-1, 3)
+		return cls(ymd[:, 0], ymd[:, 1], ymd[:, 2])
+
+	@property
+	def months(self):
+		"""Return the total number of years and months of each Duration, in whole months (ignoring any days)."""
+		return self.y * 12 + self.m
+
+	def __len__(self): 					return len(self.d)
+	def __iter__(self): 				return (Duration(*ymd) for ymd in zip(self.y.tolist(), self.m.tolist(), self.d.tolist()))
+	def __repr__(self): 				return '%s(%s)' % (self.__class__.__name__, ', '.join(str(d) for d in self))
+	def __getitem__(self, item):
+		if isinstance(item, (int, long, numpy.integer)): 	return Duration(int(self.y[item]), int(self.m[item]), int(self.d[item]))
+		return DurationArray(self.y[item], self.m[item], self.d[item])
+
+	def __mul__(self, n): 				return DurationArray(self.y * n, self.m * n, self.d * n)
+	__rmul__ 							= __mul__
+	def __neg__(self): 					return self * -1
+	def __add__(self, other):
+		if isinstance(other, (Duration, DurationArray)): 	return DurationArray(self.y + other.y, self.m + other.m, self.d + other.d)
+		return NotImplemented
+
+	def __radd__(self, dates):
+		"""Return `dates` (a DateArray or Date) + each Duration."""
+		if isinstance(dates, Duration): return self + dates
+		if isinstance(dates, Date): 	dates = DateArray([int(dates)])
+		if not isinstance(dates, DateArray): raise TypeError
+		return DateArray(addDuration(dates.ordinals, self))
+
+	def __rsub__(self, dates):
+		"""Return `dates` (a DateArray or Date) - each Duration."""
+		return (self * -1).__radd__(dates)
+
+
+class TimestampArray(object):
+	"""An array of Timestamps, stored as a numpy array of int64 microseconds since the epoch.
+
+	.. inheritance-diagram:: TimestampArray
+
+	a = TimestampArray.fromTimestamps(timestamps), or TimestampArray(us) from an array of microseconds (without copying)
+	TimestampArray.fromDates(dates) returns the start of each Date (a DateArray), to add times to
+	a.dates returns a DateArray (by integer division), a.hour, a.minute, a.second, a.microsecond and a.seconds numpy arrays
+	a + n, a - n add (subtract) microseconds, a - b returns the microseconds between them, a < t compares with a Timestamp
+	a[0] returns a Timestamp, a[1:] and a[a.hour < 12] return TimestampArrays
+	"""
+	__slots__ 	= ('us',)
+	def __init__(self, us): 			self.us = numpy.asarray(us, dtype=numpy.int64)
+
+	@classmethod
+	def fromTimestamps(cls, timestamps):
+		"""Return a TimestampArray from a sequence of Timestamps."""
+		return cls(numpy.fromiter((t.us for t in timestamps), dtype=numpy.int64))
+	@classmethod
+	def fromDates(cls, dates):
+		"""Return a TimestampArray of the start of each Date in `dates` (a DateArray)."""
+		return cls((dates.ordinals.astype(numpy.int64) - _epoch) * _usPerDay)
+
+	def toTimestamps(self):
+		"""Return a list of the Timestamps in this TimestampArray."""
+		return [Timestamp(us) for us in self.us.tolist()]
+
+	@property
+	def dates(self): 					return DateArray((self.us // _usPerDay + _epoch).astype(numpy.int32))
+	@property
+	def hour(self): 					return self.us % _usPerDay // (3600 * _usPerSecond)
+	@property
+	def minute(self): 					return self.us % (3600 * _usPerSecond) // (60 * _usPerSecond)
+	@property
+	def second(self): 					return self.us % (60 * _usPerSecond) // _usPerSecond
+	@property
+	def microsecond(self): 				return self.us % _usPerSecond
+	@property
+	def seconds(self): 					return self.us / float(_usPerSecond)
+	@property
+	def fields(self):
+		"""Return arrays (y, m, d, H, M, S, f) of the date and time of each Timestamp (see :func:`.timestamp.format_many`)."""
+		y, m, d 						= self.dates.ymd
+		return (y, m, d, self.hour, self.minute, self.second, self.microsecond)
+
+	def __len__(self): 					return len(self.us)
+	def __iter__(self): 				return iter(self.toTimestamps())
+	def __repr__(self): 				return '%s(%s)' % (self.__class__.__name__, self)
+	def __str__(self):
+		timestamps 						= self.toTimestamps() if len(self) <= 6 else self[:3].toTimestamps() + ['...'] + self[-3:].toTimestamps()
+		return '[%s]' % ', '.join(str(t) for t in timestamps)
+	def __getitem__(self, item):
+		if isinstance(item, (int, long, numpy.integer)): 	return Timestamp(int(self.us[item]))
+		return TimestampArray(self.us[item])
+
+	def _us(self, other):
+		"""Return `other` (a TimestampArray, Timestamp or microseconds) as microseconds."""
+		if isinstance(other, (TimestampArray, Timestamp)): 	return other.us
+		return other
+	def __eq__(self, other): 			return self.us == self._us(other)
+	def __ne__(self, other): 			return self.us != self._us(other)
+	def __lt__(self, other): 			return self.us  < self._us(other)
+	def __le__(self, other): 			return self.us <= self._us(other)
+	def __gt__(self, other): 			return self.us  > self._us(other)
+	def __ge__(self, other): 			return self.us >= self._us(other)
+	__hash__ 							= None
+
+	def __add__(self, us): 				return TimestampArray(self.us + us)
+	__radd__ 							= __add__
+	def __sub__(self, other):
+		"""Subtract a number of microseconds, or return the microseconds since `other` (a TimestampArray or Timestamp)."""
+		if isinstance(other, (TimestampArray, Timestamp)): 	return self.us - other.us
+		return TimestampArray(self.us - other)
+	def __rsub__(self, other):
+		"""Return the microseconds from each Timestamp in this TimestampArray to `other` (a Timestamp)."""
+		return self._us(other) - self.us
@@ -9,6 +9,7 @@ __author__ = "Gustavo Niemeyer <gustavo@niemeyer.net>"
 __license__ = "PSF License"
 
 import datetime
+import re
 import string
 import time
 import sys
@@ -19,11 +20,12 @@ try:
 except ImportError:
     from StringIO import StringIO
 
-#import relativedelta
-#import tz
+from collections import OrderedDict
 
+import tz
 
-__all__ = ["parse", "parserinfo"]
+
+__all__ = ["parse", "parserinfo", "cache"]
 
 
 # Some pointers:
@@ -36,18 +38,23 @@ __all__ = ["parse", "parserinfo"]
 # http://stein.cshl.org/jade/distrib/docs/java.text.SimpleDateFormat.html
 
 
+_wordchars = ('abcdfeghijklmnopqrstuvwxyz'
+              'ABCDEFGHIJKLMNOPQRSTUVWXYZ_'
+              'ßàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ'
+              'ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ')
+_numchars = '0123456789'
+_whitespace = ' \t\r\n'
+
+
 class _timelex(object):
 
     def __init__(self, instream):
         if isinstance(instream, basestring):
             instream = StringIO(instream)
         self.instream = instream
-        self.wordchars = ('abcdfeghijklmnopqrstuvwxyz'
-                          'ABCDEFGHIJKLMNOPQRSTUVWXYZ_'
-                          'ßàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ'
-                          'ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ')
-        self.numchars = '0123456789'
-        self.whitespace = ' \t\r\n'
+        self.wordchars = _wordchars
+        self.numchars = _numchars
+        self.whitespace = _whitespace
         self.charstack = []
         self.tokenstack = []
         self.eof = False
@@ -140,10 +147,54 @@ class _timelex(object):
         return token
 
     def split(cls, s):
-        return list(cls(s))
+        if not isinstance(s, basestring):
+            s = s.read()
+        return _split(s)
     split = classmethod(split)
 
 
+# A compiled equivalent of _timelex.get_token, which tokenizes the whole
+# string at once. A word or number may continue with dots (a "dotted"
+# token, e.g. 4.30 or a.m.), where letters and digits can only follow
+# each other across a dot. Any other character is a token on its own,
+# and each whitespace character is a ' ' token.
+_word = '[%s]' % re.escape(_wordchars)
+_run = '(?:%s+|[%s]+)' % (_word, _numchars)
+_token = re.compile(r'(%(run)s)(\.+(?:%(run)s\.+)*(?:%(run)s)?)?|([%(ws)s])|(.)'
+                    % {'run': _run, 'ws': _whitespace}, re.DOTALL)
+_letter = re.compile(_word)
+
+def _split(s):
+    """Return the tokens of string `s`, exactly as _timelex(s) does."""
+    matches = _token.findall(s.replace('\x00', ''))
+    tokens = []
+    append = tokens.append
+    last = len(matches) - 1
+    for i, (run, dotted, space, other) in enumerate(matches):
+        if dotted:
+            # Split dotted tokens (e.g. 'a.m.' -> 'a', '.', 'm', '.') when
+            # _timelex would have. It only "sees" letters if it reads
+            # another character after the first one.
+            token = run + dotted
+            letter = _letter.search(token)
+            seenletters = letter is not None and (
+                letter.start() < len(token) - 1 or i < last)
+            if seenletters or token.count('.') > 1 or token[-1] == '.':
+                l = token.split('.')
+                append(l[0])
+                for tok in l[1:]:
+                    append('.')
+                    if tok:
+                        append(tok)
+            else:
+                append(token)
+        elif space:
+            append(' ')
+        else:
+            append(run or other)
+    return tokens
+
+
 class _resultbase(object):
 
     def __init__(self):
@@ -309,7 +360,8 @@ class parser(object):
                 repl[attr] = value
         ret = default.replace(**repl)
         if res.weekday is not None and not res.day:
-            ret = ret+relativedelta.relativedelta(weekday=res.weekday)
+            #The first `weekday` on or after `default` (weekday() is 0 for Monday, as res.weekday).
+            ret = ret+datetime.timedelta(days=(res.weekday-ret.weekday())%7)
         if not ignoretz:
             if callable(tzinfos) or tzinfos and res.tzname in tzinfos:
                 if callable(tzinfos):
@@ -689,13 +741,70 @@ class parser(object):
             return None
         return res
 
+class _parsecache(object):
+    """A bounded, least recently used, cache of parse() results.
+
+    Results are keyed on the string and all the parse options. When no
+    default is given, today's date is the default (as parser.parse uses),
+    so cached results never outlive the day they were parsed on.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return "cache(maxsize=%d, size=%d, hits=%d, misses=%d)" % (
+            self.maxsize, len(self), self.hits, self.misses)
+
+    def clear(self):
+        """Remove all results, and reset the hit and miss counts."""
+        self._results.clear()
+        self.hits = self.misses = 0
+
+    def parse(self, timestr, **kwargs):
+        if not kwargs.get("default"):
+            kwargs["default"] = datetime.datetime.now().replace(
+                hour=0, minute=0, second=0, microsecond=0)
+        key = (timestr,) + tuple(sorted(kwargs.items()))
+        try:
+            result = self._results.pop(key)
+        except KeyError:
+            result = DEFAULTPARSER.parse(timestr, **kwargs)
+            self.misses += 1
+            if len(self._results) >= self.maxsize:
+                self._results.popitem(last=False)
+        except TypeError:
+            # Unhashable options (e.g. a tzinfos dict) can't be cached
+            return DEFAULTPARSER.parse(timestr, **kwargs)
+        else:
+            self.hits += 1
+        self._results[key] = result
+        return result
+
+
 DEFAULTPARSER = parser()
+_cache = None
 def parse(timestr, parserinfo=None, **kwargs):
     if parserinfo:
         return parser(parserinfo).parse(timestr, **kwargs)
+    elif _cache is not None:
+        return _cache.parse(timestr, **kwargs)
     else:
         return DEFAULTPARSER.parse(timestr, **kwargs)
 
+def cache(maxsize=1024):
+    """Cache the results of parse() (with the default parserinfo), keeping
+    up to `maxsize` of the most recently used. cache(None) stops caching.
+    Returns the cache, which counts hits and misses and can be clear()ed."""
+    global _cache
+    _cache = _parsecache(maxsize) if maxsize else None
+    return _cache
+
 
 class _tzparser(object):
 
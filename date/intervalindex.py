@@ -0,0 +1,100 @@
+"""Interval Index
+=================
+"""
+from bisect 							import bisect_right
+from date 								import Date
+
+_inf 									= float('inf')
+
+
+def _key(value, unbounded):
+	"""Return the key of an Interval's start or end (`unbounded` if it is None, i.e. the Interval is open):
+	the ordinal of a Date, or any other value (e.g. a number) as it is."""
+	if value is None: 					return unbounded
+	return int(value) if isinstance(value, Date) else value
+
+
+class IntervalIndex(object):
+	"""An index of Intervals (e.g. DateIntervals), for finding the Intervals that contain a value or overlap an Interval.
+
+	.. inheritance-diagram:: IntervalIndex
+
+	index = IntervalIndex(intervals) indexes a sequence of Intervals
+	index.containing(1-Jan-2013) returns the Intervals that contain 1-Jan-2013 (also index[1-Jan-2013])
+	index.overlapping(DateInterval(1-Jan-2013, 31-Jan-2013)) returns the Intervals that overlap Jan-2013
+	Both return the Intervals in order of their start, in O(log n + k) time (for k Intervals found).
+	A start or end of None is open (as :meth:`.Interval.__contains__`), Interval(None, None) contains nothing.
+
+	IntervalIndex.fromSorted(starts, ends, items) builds an index from arrays of ordinals, already sorted by start.
+	"""
+	__slots__ 	= ('_starts', '_items', '_root')
+	def __init__(self, intervals=()):
+		intervals 						= list(intervals)
+		starts 							= [_key(i._start, -_inf) for i in intervals]
+		order 							= sorted(xrange(len(intervals)), key=starts.__getitem__)
+		self._build([starts[j] for j in order], [_key(intervals[j]._end, _inf) for j in order],
+					[intervals[j] for j in order],
+					[not (intervals[j]._start is None and intervals[j]._end is None) for j in order])
+
+	@classmethod
+	def fromSorted(cls, starts, ends, items=None):
+		"""Return an IntervalIndex of (`starts`, `ends`) ordinals (e.g. numpy arrays), which must be sorted by start.
+		Queries return the corresponding `items` (or their positions if `items` is None)."""
+		starts, ends 					= (list(getattr(a, 'tolist', lambda: a)()) for a in (starts, ends))
+		index 							= cls.__new__(cls)
+		index._build([_key(s, -_inf) for s in starts], [_key(e, _inf) for e in ends],
+					range(len(starts)) if items is None else list(items),
+					[s is not None or e is not None for (s, e) in zip(starts, ends)])
+		return index
+
+	def _build(self, starts, ends, items, bounded):
+		"""Build a centered interval tree. Each node is (center, [(start, i)...], [(end, i)...], left, right),
+		holding the Intervals that contain its center, sorted by start and by end (descending)."""
+		def node(positions):
+			if not positions: 			return None
+			center 						= starts[positions[len(positions) // 2]]
+			here 						= [i for i in positions if starts[i] <= center <= ends[i]]
+			return (center,
+					[(starts[i], i) for i in here],
+					sorted(((ends[i], i) for i in here), reverse=True),
+					node([i for i in positions if ends[i] < center]),
+					node([i for i in positions if starts[i] > center]))
+		self._starts, self._items 		= (starts, items)
+		self._root 						= node([i for i in xrange(len(items)) if bounded[i]])
+
+	def _containing(self, x):
+		"""Return the positions of the Intervals that contain ordinal `x`."""
+		found, node 					= ([], self._root)
+		while node is not None:
+			center, byStart, byEnd, left, right = node
+			if x < center:
+				for (start, i) in byStart:
+					if start > x: 		break
+					found.append(i)
+				node 					= left
+			elif x > center:
+				for (end, i) in byEnd:
+					if end < x: 		break
+					found.append(i)
+				node 					= right
+			else:
+				found.extend(i for (start, i) in byStart)
+				node 					= None
+		return found
+
+	def containing(self, value):
+		"""Return the Intervals that contain `value` (e.g. a Date)."""
+		return [self._items[i] for i in sorted(self._containing(_key(value, None)))]
+
+	def overlapping(self, interval):
+		"""Return the Intervals that overlap (have any values in common with) `interval`."""
+		start, end 						= (_key(interval._start, -_inf), _key(interval._end, _inf))
+		if start > end: 				return []
+		found 							= self._containing(start)
+		found.sort()
+		found.extend(xrange(bisect_right(self._starts, start), bisect_right(self._starts, end)))
+		return [self._items[i] for i in found]
+
+	__getitem__ 						= containing
+	def __len__(self): 					return len(self._items)
+	def __iter__(self): 				return iter(self._items)
@@ -0,0 +1,128 @@
+"""Interval Set
+===============
+"""
+from bisect 							import bisect_right
+from date 								import DateInterval, Interval
+from heapq 								import merge
+
+
+class _Unbounded(object):
+	"""The start (or end) of an open Interval, which is before (or after) every value."""
+	__slots__ 	= ('_sign', 'ymd')
+	def __init__(self, sign): 			self._sign, self.ymd = (sign, (sign * float('inf'),))	#ymd, to compare with Dates
+	def __repr__(self): 				return '_before' if self._sign < 0 else '_after'
+	def __lt__(self, other): 			return self._sign < 0 and other is not self
+	def __le__(self, other): 			return self._sign < 0 or other is self
+	def __gt__(self, other): 			return self._sign > 0 and other is not self
+	def __ge__(self, other): 			return self._sign > 0 or other is self
+	def __eq__(self, other): 			return other is self
+	def __ne__(self, other): 			return other is not self
+	def __add__(self, n): 				return self
+	__sub__ 							= __add__
+
+_before, _after 						= (_Unbounded(-1), _Unbounded(1))
+
+
+def _pair(interval):
+	"""Return (start, end) of an Interval, or None if it is empty."""
+	start, end 							= (_before if interval._start is None else interval._start, _after if interval._end is None else interval._end)
+	return (start, end) if start <= end else None
+
+def _coalesce(pairs):
+	"""Return sorted (start, end) `pairs` merged into disjoint pairs, merging pairs that overlap or are adjacent."""
+	result 								= []
+	for (start, end) in pairs:
+		if result and start <= result[-1][1] + 1:
+			if end > result[-1][1]: 	result[-1] = (result[-1][0], end)
+		else:
+			result.append((start, end))
+	return result
+
+def _intersect(a, b):
+	"""Return the intersection of two lists of disjoint, sorted (start, end) pairs."""
+	result, i, j 						= ([], 0, 0)
+	while i < len(a) and j < len(b):
+		start, end 						= (max(a[i][0], b[j][0]), min(a[i][1], b[j][1]))
+		if start <= end: 				result.append((start, end))
+		if a[i][1] < b[j][1]: 			i += 1
+		else: 							j += 1
+	return result
+
+def _complement(pairs, lo, hi):
+	"""Return the (start, end) pairs from `lo` to `hi` that are not in the disjoint, sorted `pairs`."""
+	result 								= []
+	for (start, end) in pairs:
+		if end < lo: 					continue
+		if start > hi: 					break
+		if start > lo: 					result.append((lo, start - 1))
+		if end is _after or end >= hi: 	return result
+		lo 								= end + 1
+	result.append((lo, hi))
+	return result
+
+
+class IntervalSet(object):
+	"""A set of values, held as a sorted list of disjoint Intervals (e.g. DateIntervals).
+
+	.. inheritance-diagram:: IntervalSet
+
+	s = IntervalSet(intervals) merges the Intervals (or DateIntervals) that overlap or are adjacent, e.g.
+	IntervalSet([DateInterval(1-Jan-2013, 10-Jan-2013), DateInterval(5-Jan-2013, 31-Jan-2013)]) is [1-Jan-2013..31-Jan-2013]
+	s | t, s & t, s - t return the union, intersection and difference (also s.union(t), s.intersection(t), s.difference(t))
+	s.complement(DateInterval(1-Jan-2013, 31-Dec-2013)) returns the gaps in s within 2013
+	1-Jan-2013 in s, len(s), s[0], for interval in s
+	Set operations merge the sorted Intervals, in O(n+m) time. t may be an IntervalSet, an Interval or a sequence of Intervals.
+	A start or end of None is open, so Interval(None, None) is every value (unlike :meth:`.Interval.__contains__`).
+	"""
+	__slots__ 	= ('_pairs', '_starts', '_cls')
+	def __init__(self, intervals=()):
+		if isinstance(intervals, Interval): intervals = [intervals]
+		intervals 						= list(intervals)
+		self._init(_coalesce(sorted(p for p in (_pair(i) for i in intervals) if p is not None)), intervals)
+
+	def _init(self, pairs, intervals):
+		self._pairs, self._starts 		= (pairs, [start for (start, end) in pairs])
+		self._cls 						= intervals._cls if isinstance(intervals, IntervalSet) else \
+										  DateInterval if any(isinstance(i, DateInterval) for i in intervals[:1]) else Interval
+		return self
+
+	def _new(self, pairs):
+		"""Return an IntervalSet (of the same class of Intervals) of `pairs`, which are already disjoint and sorted."""
+		return IntervalSet.__new__(IntervalSet)._init(pairs, self)
+
+	def _interval(self, pair):
+		start, end 						= pair
+		return self._cls(None if start is _before else start, None if end is _after else end)
+
+	def __len__(self): 					return len(self._pairs)
+	def __iter__(self): 				return (self._interval(pair) for pair in self._pairs)
+	def __getitem__(self, item): 		return self._interval(self._pairs[item])
+	def __str__(self): 					return '[%s]' % ', '.join(str(i) for i in self)
+	def __repr__(self): 				return '%s(%s)' % (self.__class__.__name__, list(self))
+	def __eq__(self, other): 			return self._pairs == _coerce(other)._pairs
+	def __ne__(self, other): 			return not self == other
+	__hash__ 							= None
+
+	def __contains__(self, value):
+		"""Return True if `value` is in one of the Intervals."""
+		i 								= bisect_right(self._starts, value) - 1
+		return i >= 0 and value <= self._pairs[i][1]
+
+	def union(self, other): 			return self._new(_coalesce(merge(self._pairs, _coerce(other)._pairs)))
+	def intersection(self, other): 		return self._new(_intersect(self._pairs, _coerce(other)._pairs))
+	def difference(self, other):
+		if not self._pairs: 			return self
+		lo, hi 							= (self._pairs[0][0], self._pairs[-1][1])
+		return self._new(_intersect(self._pairs, _complement(_coerce(other)._pairs, lo, hi)))
+	def complement(self, bound):
+		"""Return the values within `bound` (an Interval) that are not in this IntervalSet."""
+		bound 							= _pair(bound)
+		return self._new(_complement(self._pairs, *bound) if bound else [])
+	__or__ 								= union
+	__and__ 							= intersection
+	__sub__ 							= difference
+
+
+def _coerce(other):
+	"""Return `other` (an IntervalSet, Interval or sequence of Intervals) as an IntervalSet."""
+	return other if isinstance(other, IntervalSet) else IntervalSet(other)
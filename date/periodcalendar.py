@@ -0,0 +1,79 @@
+"""Period Calendar
+==================
+"""
+from date 								import Date, DateInterval, Sun
+from datearray 							import DateArray, fromOrdinal, toOrdinal
+import numpy
+
+
+class PeriodCalendar(object):
+	"""A calendar of fiscal years, quarters and periods, and pay periods, from `start` to `end`.
+
+	.. inheritance-diagram:: PeriodCalendar
+
+	cal = PeriodCalendar(1-Jan-2000, 31-Dec-2030, yearStart=Jul) has fiscal years from July to June,
+	named by the year they end in (so 1-Jul-2013 is in fiscal year 2014), with a fiscal period for each month.
+	cal = PeriodCalendar(..., yearStart=Jul, weeks=(4, 4, 5)) has fiscal years of whole weeks, starting on the `weekStart`
+	nearest the start of July, with periods of 4, 4 and 5 weeks in each quarter (a 53rd week is in the last period).
+	cal = PeriodCalendar(..., payAnchor=4-Jan-2013, payDays=14) has fortnightly pay periods, numbered from 4-Jan-2013.
+	cal.fiscalYear(d), cal.fiscalQuarter(d), cal.fiscalPeriod(d), cal.payPeriod(d) and cal.payPeriodDates(d)
+	accept Dates or DateArrays (returning arrays).
+
+	Tables of each, indexed by ordinal, are precomputed from `start` to `end`, so lookups are O(1) indexing.
+	Dates outside the range raise IndexError.
+	"""
+	def __init__(self, start, end, yearStart=1, weeks=None, weekStart=Sun, payAnchor=None, payDays=14):
+		if weeks is not None and (not weeks or 12 % len(weeks) or sum(weeks) * (12 // len(weeks)) != 52):
+			raise ValueError, "weeks must be a pattern of period lengths (e.g. (4, 4, 5)) repeating to 12 periods of 52 weeks"
+		self.start, self.end 			= (start, end)
+		self._start 					= int(start)
+		ordinals 						= numpy.arange(int(start), int(end) + 1, dtype=numpy.int32)
+		yearStart 						= getattr(yearStart, 'm', yearStart)		#a Month (e.g. Jul), or a month number
+		y, m, d 						= fromOrdinal(ordinals)
+		if weeks is None:
+			offset 						= (m - yearStart) % 12
+			self._years 				= y + (m >= yearStart) * (yearStart != 1)
+			self._periods 				= (offset + 1).astype(numpy.int8)
+		else:
+			#The start of each fiscal year (from the year before start, to the year after end).
+			years 						= numpy.arange(y[0] - 1, y[-1] + 3, dtype=numpy.int32)
+			nominal 					= toOrdinal(years - (yearStart != 1), yearStart, 1)
+			starts 						= nominal + (weekStart - nominal + 3) % 7 - 3
+			i 							= numpy.searchsorted(starts, ordinals, side='right') - 1
+			self._years 				= years[i]
+			ends 						= numpy.cumsum(numpy.tile(weeks, 12 // len(weeks)))
+			self._periods 				= numpy.minimum(numpy.searchsorted(ends, (ordinals - starts[i]) // 7, side='right') + 1, 12).astype(numpy.int8)
+		self._quarters 					= ((self._periods - 1) // 3 + 1).astype(numpy.int8)
+		self.payAnchor, self.payDays 	= (payAnchor, payDays)
+
+	def _index(self, d):
+		"""Return the index into the tables of `d` (a Date or DateArray)."""
+		index 							= (d.ordinals if isinstance(d, DateArray) else int(d)) - self._start
+		if numpy.min(index) < 0 or numpy.max(index) >= len(self._years):
+			raise IndexError, "Date is outside the PeriodCalendar (%s to %s)" % (self.start, self.end)
+		return index
+
+	def _lookup(self, table, d):
+		result 							= table[self._index(d)]
+		return result if isinstance(d, DateArray) else int(result)
+
+	def fiscalYear(self, d):
+		"""Return the fiscal year of `d`, named by the calendar year it ends in."""
+		return self._lookup(self._years, d)
+	def fiscalQuarter(self, d):
+		"""Return the fiscal quarter (1 to 4) of `d`."""
+		return self._lookup(self._quarters, d)
+	def fiscalPeriod(self, d):
+		"""Return the fiscal period (1 to 12) of `d`."""
+		return self._lookup(self._periods, d)
+
+	def payPeriod(self, d):
+		"""Return the number of the pay period of `d`, counting from the one starting on payAnchor (0)."""
+		if self.payAnchor is None: 		raise ValueError, "The PeriodCalendar has no pay periods"
+		self._index(d)
+		return ((d.ordinals if isinstance(d, DateArray) else int(d)) - int(self.payAnchor)) // self.payDays
+	def payPeriodDates(self, d):
+		"""Return the pay period of `d`, a DateInterval (or the first Dates of the pay periods, for a DateArray)."""
+		start 							= self.payPeriod(d) * self.payDays + int(self.payAnchor)
+		if isinstance(d, DateArray): 	return DateArray(start)
+		return DateInterval(Date(start), Date(start + self.payDays - 1))
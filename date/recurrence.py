@@ -0,0 +1,211 @@
+"""Recurrence
+=============
+Lazy schedules of Dates, e.g.::
+
+	Weekly(4-Jan-2013, Fri, interval=2)							#every second Friday
+	Monthly(31-Mar-2013, days=[-1], interval=3).adjusted(calendar)	#the last business day of each quarter
+	Monthly(15-Jan-2013, days=[15, -1])							#the 15th and the last day of each month
+	MonthlyWeekday(Jan-2013, Tue, 2) | Monthly(Jan-2013, days=[1])	#the 1st and the second Tuesday of each month
+
+Each occurrence is calculated from the one before (or any Date) in O(1), without iterating over the Dates in between.
+"""
+from date 								import Date, Sat, Sun, _fromOrdinal, _monthLength, _toOrdinal, nthWeekday
+
+
+class Recurrence(object):
+	"""A schedule of Dates, from `start`, limited to `count` occurrences and/or to Dates on or before `until`.
+
+	.. inheritance-diagram:: Recurrence
+
+	for d in r, iterates over the occurrences (lazily, so r may be unlimited)
+	r.after(d) iterates over the occurrences after `d` (skipping straight to the first of them)
+	r.following(d) returns the first occurrence after `d` (None if there isn't one), r.between(d1, d2) a list, inclusive
+	r | s combines two Recurrences, r.adjusted(calendar) moves occurrences to business days
+	Subclasses implement _onOrAfter(ordinal), returning the ordinal of the first occurrence on or after `ordinal`
+	(which is never before start), or None if there are no more occurrences.
+	"""
+	__slots__ 	= ('start', 'count', 'until', '_last')
+	def __init__(self, start, count=None, until=None):
+		self.start, self.count, self.until 	= (start, count, until)
+		self._last 						= None
+
+	def _end(self):
+		"""Return the ordinal of the last occurrence allowed by `count` and `until` (None if unlimited).
+		The `count`th occurrence is found (once) by stepping through the occurrences."""
+		if self._last is None:
+			end 						= int(self.until) if self.until is not None else None
+			if self.count is not None:
+				o, n 					= (self._onOrAfter(int(self.start)), self.count)
+				while o is not None and n > 1 and (end is None or o <= end):
+					o, n 				= (self._onOrAfter(o + 1), n - 1)
+				nth 					= int(self.start) - 1 if (o is None or n < 1) else o
+				end 					= nth if end is None else min(end, nth)
+			self._last 					= (end,)
+		return self._last[0]
+
+	def _find(self, ordinal):
+		"""Return the ordinal of the first occurrence on or after `ordinal` (None if there isn't one)."""
+		o 								= self._onOrAfter(max(ordinal, int(self.start)))
+		end 							= self._end()
+		return None if o is None or (end is not None and o > end) else o
+
+	def _ordinals(self, ordinal):
+		o 								= self._find(ordinal)
+		while o is not None:
+			yield o
+			o 							= self._find(o + 1)
+
+	def __iter__(self): 				return (Date(o) for o in self._ordinals(int(self.start)))
+	def after(self, d):
+		"""Return an iterator of the occurrences after `d`."""
+		return (Date(o) for o in self._ordinals(int(d) + 1))
+	def following(self, d):
+		"""Return the first occurrence after `d` (None if there isn't one)."""
+		o 								= self._find(int(d) + 1)
+		return None if o is None else Date(o)
+	def between(self, start, end):
+		"""Return a list of the occurrences from `start` to `end` (inclusive)."""
+		occurrences, end 				= ([], int(end))
+		for o in self._ordinals(int(start)):
+			if o > end: 				break
+			occurrences.append(Date(o))
+		return occurrences
+
+	def __or__(self, other): 			return Union(self, other)
+	def adjusted(self, calendar=None, roll='preceding', **limits):
+		"""Return this Recurrence with each occurrence moved to a business day, see :class:`Adjusted`."""
+		return Adjusted(self, calendar, roll, **limits)
+
+
+class Weekly(Recurrence):
+	"""Every `interval` weeks on `weekday` (default, the weekday of `start`), from the first `weekday` on or after `start`.
+
+	.. inheritance-diagram:: Weekly
+	"""
+	__slots__ 	= ('_anchor', '_step')
+	def __init__(self, start, weekday=None, interval=1, count=None, until=None):
+		if interval < 1: 				raise ValueError, "interval must be at least 1"
+		Recurrence.__init__(self, start, count, until)
+		weekday 						= start.weekday if weekday is None else weekday
+		self._anchor 					= int(start) + (weekday - int(start)) % 7
+		self._step 						= 7 * interval
+
+	def _onOrAfter(self, ordinal):
+		if ordinal <= self._anchor: 	return self._anchor
+		return self._anchor + -(-(ordinal - self._anchor) // self._step) * self._step
+
+
+class _EveryMonths(Recurrence):
+	"""Every `interval` months, from the month of `start`. Subclasses implement _days(y, m), the sorted
+	ordinals of the occurrences in a month (which may be none)."""
+	__slots__ 	= ('_month', '_interval')
+	_cycle 		= 4800
+	"""The months in 400 years, after which the calendar (and the weekdays) repeat."""
+	def __init__(self, start, interval, count, until):
+		if interval < 1: 				raise ValueError, "interval must be at least 1"
+		Recurrence.__init__(self, start, count, until)
+		self._month, self._interval 	= (start.y * 12 + start.m - 1, interval)
+
+	def _onOrAfter(self, ordinal):
+		y, m, d 						= _fromOrdinal(ordinal)
+		k 								= max(y * 12 + m - 1 - self._month, 0)
+		k 								= -(-k // self._interval) * self._interval
+		end 							= None if self.until is None else int(self.until)
+		#The months searched repeat within a cycle, so a cycle of them without an occurrence means there are no more.
+		for k in xrange(k, k + self._cycle * self._interval, self._interval):
+			y, m 						= divmod(self._month + k, 12)
+			if end is not None and _toOrdinal(y, m + 1, 1) > end: 	return None
+			for o in self._days(y, m + 1):
+				if o >= ordinal: 		return o
+		return None
+
+
+class Monthly(_EveryMonths):
+	"""Every `interval` months on each of `days` (default, the day of `start`), from the month of `start`.
+
+	.. inheritance-diagram:: Monthly
+
+	Negative days count back from the end of the month, e.g. -1 is the last day, and days past the end of a month
+	are the last day of that month (as `Date + Duration`), e.g. Monthly(31-Jan-2013) includes 28-Feb-2013.
+	"""
+	__slots__ 	= ('days',)
+	def __init__(self, start, days=None, interval=1, count=None, until=None):
+		days 							= tuple(days) if days is not None else (start.d or 1,)
+		if not days or 0 in days: 		raise ValueError, "days must be a non-empty list of days of the month (not 0)"
+		_EveryMonths.__init__(self, start, interval, count, until)
+		self.days 						= days
+
+	def _days(self, y, m):
+		first, length 					= (_toOrdinal(y, m, 1), _monthLength(y, m))
+		return sorted(set(first - 1 + (min(d, length) if d > 0 else max(length + d + 1, 1)) for d in self.days))
+
+
+class MonthlyWeekday(_EveryMonths):
+	"""Every `interval` months on the `n`th `weekday` (see :func:`.nthWeekday`), from the month of `start`.
+	Months without an `n`th `weekday` are skipped.
+
+	.. inheritance-diagram:: MonthlyWeekday
+	"""
+	__slots__ 	= ('weekday', 'n')
+	def __init__(self, start, weekday, n=1, interval=1, count=None, until=None):
+		if not (1 <= n <= 5 or -5 <= n <= -1): 	raise ValueError, "n must be 1 to 5, or -5 to -1"
+		_EveryMonths.__init__(self, start, interval, count, until)
+		self.weekday, self.n 			= (weekday, n)
+
+	def _days(self, y, m):
+		try:
+			return [int(nthWeekday(Date(y, m, 1), self.weekday, self.n))]
+		except IndexError:
+			return []
+
+
+class Adjusted(Recurrence):
+	"""The occurrences of `recurrence`, each moved to a business day of `calendar` (a :class:`.BusinessCalendar`,
+	or just weekdays if None): the business day before it if `roll` is 'preceding', or after it if 'following'.
+	Occurrences that move to the same business day occur once.
+
+	.. inheritance-diagram:: Adjusted
+	"""
+	__slots__ 	= ('recurrence', 'calendar', 'roll')
+	_slack 		= 31
+	"""The most days an occurrence is moved when rolling 'following'."""
+	def __init__(self, recurrence, calendar=None, roll='preceding', count=None, until=None):
+		if roll not in ('preceding', 'following'): 	raise ValueError, "roll must be 'preceding' or 'following'"
+		self.recurrence, self.calendar, self.roll 	= (recurrence, calendar, roll)
+		#Start from the first occurrence, as rolling 'preceding' may move it before the start of `recurrence`.
+		first 							= recurrence._find(int(recurrence.start))
+		Recurrence.__init__(self, recurrence.start if first is None else Date(min(self._rolled(first), first)), count, until)
+
+	def _rolled(self, ordinal):
+		"""Return `ordinal`, moved to a business day."""
+		if self.calendar is None:
+			weekday 					= ordinal % 7
+			if weekday not in (Sat, Sun): 	return ordinal
+			if self.roll == 'preceding': 	return ordinal - (1 if weekday == Sat else 2)
+			return ordinal + (2 if weekday == Sat else 1)
+		d 								= Date(ordinal)
+		if self.calendar.isBusinessDay(d): 	return ordinal
+		return int(self.calendar.addBusinessDays(d, -1 if self.roll == 'preceding' else 0))
+
+	def _onOrAfter(self, ordinal):
+		o 								= self.recurrence._find(ordinal - (self._slack if self.roll == 'following' else 0))
+		while o is not None:
+			rolled 						= self._rolled(o)
+			if rolled >= ordinal: 		return rolled
+			o 							= self.recurrence._find(o + 1)
+		return None
+
+
+class Union(Recurrence):
+	"""The occurrences of any of `recurrences` (each occurs once, in order), e.g. r | s.
+
+	.. inheritance-diagram:: Union
+	"""
+	__slots__ 	= ('recurrences',)
+	def __init__(self, *recurrences, **limits):
+		Recurrence.__init__(self, min((r.start for r in recurrences), key=int), **limits)
+		self.recurrences 				= recurrences
+
+	def _onOrAfter(self, ordinal):
+		found 							= [o for o in (r._find(ordinal) for r in self.recurrences) if o is not None]
+		return min(found) if found else None
@@ -0,0 +1,98 @@
+"""Resampling
+=============
+"""
+from date 								import Date, DateInterval, Month, Year, Week, _monthLength
+from datearray 							import DateArray, fromOrdinal
+import numpy
+
+
+def _week(ordinals):					return ordinals - ordinals % 7
+def _month(ordinals):
+	y, m, d 							= fromOrdinal(ordinals)
+	return y * 12 + (m - 1)
+def _quarter(ordinals):
+	y, m, d 							= fromOrdinal(ordinals)
+	return y * 4 + (m - 1) // 3
+def _year(ordinals):					return fromOrdinal(ordinals)[0]
+
+def _quarterLabel(code):
+	y, q 								= divmod(code, 4)
+	return DateInterval(Date(y, q * 3 + 1, 1), Date(y, q * 3 + 3, _monthLength(y, q * 3 + 3)))
+
+_periods 								= {	'week': 	(_week, 	lambda code: Week(Date(code))),
+											'month': 	(_month, 	lambda code: Month(code // 12, code % 12 + 1)),
+											'quarter': 	(_quarter, 	_quarterLabel),
+											'year': 	(_year, 	Year),
+										}
+"""For each period, (function from an array of ordinals to period codes, function from a code to its label)."""
+
+def periodCodes(dates, period):
+	"""Return an array of period codes (integers, in date order) for `dates` (a DateArray, ordinals or a sequence of Dates),
+	where `period` is 'week', 'month', 'quarter' or 'year'."""
+	return _periods[period][0](_ordinals(dates))
+
+def _ordinals(dates):
+	"""Return `dates` (a DateArray, array of ordinals or sequence of Dates) as an array of ordinals."""
+	if isinstance(dates, DateArray): 	return dates.ordinals
+	dates 								= dates if isinstance(dates, numpy.ndarray) else list(dates)
+	if len(dates) and isinstance(dates[0], Date): 	return DateArray.fromDates(dates).ordinals
+	return numpy.asarray(dates, dtype=numpy.int32)
+
+
+class Resampler(object):
+	"""Groups dates by period (week, month, quarter or year), to aggregate values for each period.
+
+	.. inheritance-diagram:: Resampler
+
+	r = Resampler(dates, 'month') groups `dates` (a DateArray, ordinals or a sequence of Dates) by month
+	r.sum(values), r.count(), r.min(values), r.max(values), r.mean(values) return an array with one value per period,
+	where `values` is an array paired with `dates`
+	r.labels returns the periods (Weeks, Months, DateIntervals for quarters, or Years), in order
+	The dates are mapped to periods with array arithmetic on their ordinals, labels are only created when requested.
+	Only periods that contain dates are included.
+	"""
+	__slots__ 	= ('period', 'codes', 'groups', '_order', '_starts')
+	def __init__(self, dates, period='month'):
+		self.period 					= period
+		self.codes, self.groups 		= numpy.unique(periodCodes(dates, period), return_inverse=True)
+		self._order, self._starts 		= (None, None)
+
+	def __len__(self): 					return len(self.codes)
+
+	@property
+	def labels(self):
+		"""Return a list of the periods, in order."""
+		label 							= _periods[self.period][1]
+		return [label(code) for code in self.codes.tolist()]
+
+	def _values(self, values):
+		values 							= numpy.asarray(values)
+		if len(values) != len(self.groups): 	raise ValueError, "There must be one value for each date"
+		return values
+
+	def _reduce(self, ufunc, values):
+		"""Return `ufunc` reduced over the values in each period."""
+		if self._order is None:
+			self._order 				= numpy.argsort(self.groups, kind='mergesort')
+			self._starts 				= numpy.searchsorted(self.groups[self._order], numpy.arange(len(self.codes)))
+		if not len(self.codes): 		return self._values(values)[:0]
+		return ufunc.reduceat(self._values(values)[self._order], self._starts)
+
+	def count(self): 					return numpy.bincount(self.groups, minlength=len(self.codes))
+	def sum(self, values):
+		values 							= self._values(values)
+		if values.dtype.kind in 'iub': 	return self._reduce(numpy.add, values)
+		return numpy.bincount(self.groups, weights=values, minlength=len(self.codes))
+	def min(self, values): 				return self._reduce(numpy.minimum, values)
+	def max(self, values): 				return self._reduce(numpy.maximum, values)
+	def mean(self, values): 			return numpy.bincount(self.groups, weights=self._values(values), minlength=len(self.codes)) / self.count()
+
+	def aggregate(self, values, how='sum'):
+		"""Return [(label, aggregate), ...] for each period, where `how` is 'sum', 'count', 'min', 'max' or 'mean'."""
+		result 							= self.count() if how == 'count' else getattr(self, how)(values)
+		return zip(self.labels, result.tolist())
+
+
+def resample(dates, values, period='month', how='sum'):
+	"""Return [(period, aggregate), ...] of `values` grouped by the `period` of `dates`, see :class:`Resampler`."""
+	return Resampler(dates, period).aggregate(values, how)
@@ -2,7 +2,24 @@
 
 """
 from unittest import TestCase
+import time
 from date import *
+from datearray import DateArray, DurationArray, TimestampArray
+import datearray
+from intervalindex import IntervalIndex
+from intervalset import IntervalSet
+from recurrence import Weekly, Monthly, MonthlyWeekday
+from businesscalendar import BusinessCalendar
+from periodcalendar import PeriodCalendar
+from dateparser import _timelex
+import dateparser
+import tz
+from timestamp import Timestamp
+import timestamp
+from bulk import parse_many
+from resample import Resampler, resample
+import columnar
+from timeseries import TimeSeries
 
 
 class Test_Weekday(TestCase):
@@ -106,6 +123,178 @@ class Test_Date(TestCase):
         self.assertEqual(format(1-Mar-2013, '%d%m%y:6'), '010313')
         self.assertEqual(format(1-Mar-2013, '%Y%m%d:8'), '20130301')
 
+
+class Test_fromString(TestCase):
+    """Date.fromString recognises common formats quickly, falling back to the full parser."""
+
+    def test_recognised(self):
+        hits, misses = (recognisers.hits, recognisers.misses)
+        self.assertEqual(Date.fromString('2013-01-15'),   15-Jan-2013)
+        self.assertEqual(Date.fromString('15-Jan-2013'),  15-Jan-2013)
+        self.assertEqual(Date.fromString('5-january-2013'), 5-Jan-2013)
+        self.assertEqual(Date.fromString('01/02/2013 '),   1-Feb-2013)
+        self.assertEqual(Date.fromString('20130115'),     15-Jan-2013)
+        self.assertEqual(Date.fromString('29-Feb-2012'),  29-Feb-2012)
+        self.assertEqual((recognisers.hits - hits, recognisers.misses - misses), (6, 0))
+
+    def test_fallback(self):
+        misses = recognisers.misses
+        self.assertEqual(Date.fromString('Jan 15, 2013'), 15-Jan-2013)
+        self.assertEqual(Date.fromString('01/13/2013'),   13-Jan-2013)
+        self.assertEqual(Date.fromString('2013-1-5'),      5-Jan-2013)
+        self.assertRaises(ValueError, Date.fromString, '30-Feb-2013')
+        self.assertRaises(ValueError, Date.fromString, '2013-13-01')
+        self.assertEqual(recognisers.misses - misses, 5)
+
+
+class Test_timelex(TestCase):
+    """The compiled tokenizer returns exactly the same tokens as the _timelex lexer."""
+    corpus = ['2013-01-15', '15-Jan-2013', '15/01/2013', '20130115', 'Jan 15, 2013', '15 January 2013',
+              'Tue, 15 Jan 2013 10:30:00 +1100', '2013-01-15T10:30:00.123456Z', '10:30 a.m.', '4.30pm',
+              '10h30m15.5s', '15.01.2013', '1.a', '1.a ', 'a.1', 'x.1.y', 'Jan.', 'a..b', '3rd of March 2013',
+              'Thu Sep 25 10:36:28 BRST 2003', '2003 10:36:28 BRST 25 Sep Thu', '19990101T2359', 'BRST+3BRDT',
+              'EST5EDT,M3.2.0/2,M11.1.0/2', '\x001\x00-Jan\t-\n2013\r', '\xc3\xa9t\xc3\xa9 2013', '', ' ', '...']
+
+    def assertSameTokens(self, s):
+        self.assertEqual(_timelex.split(s), list(_timelex(s)), repr(s))
+
+    def test_corpus(self):
+        for s in self.corpus:
+            self.assertSameTokens(s)
+
+    def test_random(self):
+        from random import Random
+        random = Random(0)
+        chars = list('aZ_09. .-:/+,\t\x00\xc3\xa9') + ['a.m.', '4.30', '1.a']
+        for _ in range(5000):
+            self.assertSameTokens(''.join(random.choice(chars) for _ in range(random.randint(0, 12))))
+
+
+class Test_parse_cache(TestCase):
+    """dateparser.cache() caches parse results."""
+
+    def setUp(self):
+        self.cache = dateparser.cache(maxsize=2)
+
+    def tearDown(self):
+        dateparser.cache(None)
+
+    def test_cache(self):
+        from datetime import datetime
+        self.assertEqual(dateparser.parse('Jan 15, 2013'), datetime(2013, 1, 15))
+        self.assertEqual(dateparser.parse('Jan 15, 2013'), datetime(2013, 1, 15))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(dateparser.parse('1/2/2013', dayfirst=True), datetime(2013, 2, 1))
+        self.assertEqual(dateparser.parse('1/2/2013'), datetime(2013, 1, 2))
+        self.assertEqual((self.cache.hits, self.cache.misses, len(self.cache)), (1, 3, 2))
+        self.assertEqual(dateparser.parse('Jan 15, 2013'), datetime(2013, 1, 15))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 4))
+        self.cache.clear()
+        self.assertEqual((self.cache.hits, self.cache.misses, len(self.cache)), (0, 0, 0))
+
+    def test_default(self):
+        from datetime import datetime
+        self.assertEqual(dateparser.parse('Jan 15', default=datetime(2012, 1, 1)), datetime(2012, 1, 15))
+        self.assertEqual(dateparser.parse('Jan 15', default=datetime(2013, 1, 1)), datetime(2013, 1, 15))
+        self.assertEqual(dateparser.parse('Jan 15').year, datetime.now().year)
+        self.assertEqual(dateparser.parse('10:30', tzinfos={}).hour, 10)
+        self.assertEqual(self.cache.hits, 0)
+
+
+class Test_tz(TestCase):
+    """dateparser returns shared tzinfo objects, and weekdays relative to the default."""
+
+    def test_offsets(self):
+        from datetime import datetime, timedelta
+        a = dateparser.parse('Tue, 15 Jan 2013 10:30:00 +1100')
+        b = dateparser.parse('2013-01-16 09:00 +11:00')
+        self.assertEqual(a.utcoffset(), timedelta(hours=11))
+        self.assertTrue(a.tzinfo is b.tzinfo)
+        self.assertEqual(dateparser.parse('2013-01-15T10:30:00Z').utcoffset(), timedelta(0))
+        self.assertEqual(tz.tzoffset(None, 0), tz.tzutc())
+        self.assertNotEqual(a.tzinfo, tz.tzutc())
+        self.assertEqual(Date.fromString('Tue, 15 Jan 2013 10:30:00 +1100'), 15-Jan-2013)
+
+    def test_tzinfos(self):
+        from datetime import timedelta
+        a = dateparser.parse('15 Jan 2013 10:30 AEST', tzinfos={'AEST': 36000})
+        b = dateparser.parse('15 Jan 2013 10:30 AEST', tzinfos={'AEST': 'AEST-10'})
+        self.assertEqual((a.utcoffset(), a.tzname()), (timedelta(hours=10), 'AEST'))
+        self.assertTrue(a.tzinfo is b.tzinfo)
+        self.assertTrue(tz.tzstr('EST+5') is tz.tzoffset('EST', -5*3600))
+        self.assertRaises(ValueError, tz.tzstr, 'EST5EDT')
+
+    def test_weekday(self):
+        from datetime import datetime
+        default = datetime(2013, 1, 15)                 #a Tuesday
+        self.assertEqual(dateparser.parse('Friday', default=default), datetime(2013, 1, 18))
+        self.assertEqual(dateparser.parse('Tue', default=default), datetime(2013, 1, 15))
+        self.assertEqual(dateparser.parse('Mon 10:30', default=default), datetime(2013, 1, 21, 10, 30))
+
+
+class Test_parse_many(TestCase):
+    """parse_many parses many date strings, in chunks, optionally using many processes."""
+    strings = ['15-Jan-2013', '2013-01-16', 'rubbish', 'Jan 17, 2013', '30-Feb-2013', '18/01/2013', None, '20130119']
+    dates = [15-Jan-2013, 16-Jan-2013, None, 17-Jan-2013, None, 18-Jan-2013, None, 19-Jan-2013]
+
+    def test_parse_many(self):
+        dates, errors = parse_many(iter(self.strings), chunksize=3)
+        self.assertEqual(dates, self.dates)
+        self.assertEqual([(i, s) for (i, s, error) in errors], [(2, 'rubbish'), (4, '30-Feb-2013'), (6, None)])
+
+    def test_ordinals(self):
+        ordinals, errors = parse_many(self.strings, ordinals=True)
+        self.assertEqual(list(ordinals), [int(d) if d else 0 for d in self.dates])
+        self.assertEqual(len(errors), 3)
+
+    def test_workers(self):
+        dates, errors = parse_many(self.strings * 5, chunksize=3, workers=2)
+        self.assertEqual(dates, self.dates * 5)
+        self.assertEqual([i for (i, s, error) in errors], [i for (i, d) in enumerate(self.dates * 5) if d is None])
+
+
+class Test_OrdinalDate(TestCase):
+    """OrdinalDates store their ordinal, for integer arithmetic and comparisons."""
+
+    def test_ordinal(self):
+        from datetime import date
+        for n in range(1, 800000, 997):
+            d = date.fromordinal(n)
+            self.assertEqual(Date(n).ymd, (d.year, d.month, d.day))
+            self.assertEqual(int(Date(d.year, d.month, d.day)), n)
+            self.assertEqual(OrdinalDate(n).ymd, (d.year, d.month, d.day))
+            self.assertEqual(int(OrdinalDate(d.year, d.month, d.day)), n)
+
+    def test_OrdinalDate(self):
+        d = OrdinalDate(2013, 1, 15)
+        self.assertEqual(d, 15-Jan-2013)
+        self.assertEqual(str(d), '15-Jan-2013')
+        self.assertEqual(OrdinalDate.fromDate(15-Jan-2013), d)
+        self.assertEqual(hash(d), hash(15-Jan-2013))
+        self.assertRaises(OverflowError, lambda: OrdinalDate(2013, 2, 29))
+
+    def test_arithmetic(self):
+        d = OrdinalDate.fromDate(31-Jan-2013)
+        self.assertTrue(isinstance(d + 1, OrdinalDate))
+        self.assertEqual(d + 1,         1-Feb-2013)
+        self.assertEqual(d - 31,       31-Dec-2012)
+        self.assertEqual(d + 1*months, 28-Feb-2013)
+        self.assertEqual(d - 2*months, 30-Nov-2012)
+        self.assertTrue(isinstance(d + 1*months, OrdinalDate))
+        self.assertEqual(len(d - OrdinalDate.fromDate(1-Jan-2013)), 30)
+
+    def test_sort(self):
+        dates = [OrdinalDate.fromDate(d) for d in (15-Jan-2013, 1-Jan-2013, 31-Dec-2012)]
+        self.assertEqual(sorted(dates), [31-Dec-2012, 1-Jan-2013, 15-Jan-2013])
+        self.assertTrue(dates[1] < dates[0] and dates[0] > 14-Jan-2013)
+
+    def test_ymd(self):
+        d = OrdinalDate(2013, 1, 31)
+        d.ymd = (2013, 3, 1)
+        self.assertEqual((int(d), d + 1, d), (int(1-Mar-2013), 2-Mar-2013, 1-Mar-2013))
+        self.assertTrue(d > OrdinalDate.fromDate(28-Feb-2013))
+
+
 class Test_Month(TestCase):
     """Month objects represent a Month and Year."""
 
@@ -121,6 +310,16 @@ class Test_Month(TestCase):
         self.assertEqual(len(Feb-2003), 28)
         self.assertEqual(len(Feb-2004), 29)
 
+    def test_interned(self):
+        import copy, pickle
+        m = (15-Jan-2013).month
+        self.assertTrue(m is Month(2013, 1))
+        self.assertTrue(m is (31-Jan-2013).month)
+        self.assertTrue(copy.copy(m) is m)
+        self.assertTrue(pickle.loads(pickle.dumps(m, 2)) is m)
+        self.assertEqual(pickle.loads(pickle.dumps(m)), m)
+        self.assertRaises(AttributeError, setattr, m, 'm', 2)
+
 
 class Test_Year(TestCase):
     """Year objects represent a Year."""
@@ -137,6 +336,12 @@ class Test_Year(TestCase):
         self.assertEqual(len((Feb-2003).year), 365)
         self.assertEqual(len((Feb-2004).year), 366)
 
+    def test_interned(self):
+        y = (15-Jan-2013).year
+        self.assertTrue(y is Year(2013))
+        self.assertTrue(y + 1 is (1-Jan-2014).year)
+        self.assertRaises(AttributeError, setattr, y, 'ymd', (2014, 0, 0))
+
 
 class Test_Duration(TestCase):
     """Durations are a number of days, months and/or years."""
@@ -235,3 +440,667 @@ class Test_Week(TestCase):
         self.assertEqual(d[Fri], [4-Jan-2013, 11-Jan-2013, 18-Jan-2013, 25-Jan-2013])
         self.assertEqual(d[Fri][-1], 25-Jan-2013)
 
+
+
+class Test_DateArray(TestCase):
+    """DateArrays hold many Dates as an array of ordinals."""
+
+    def test_DateArray(self):
+        dates = [28-Feb-2012, 29-Feb-2012, 1-Mar-2013, 31-Dec-1999, 1-Jan-1]
+        a = DateArray.fromDates(dates)
+        self.assertEqual(len(a), 5)
+        self.assertEqual(list(a.ordinals), [int(d) for d in dates])
+        self.assertEqual(a.toDates(), dates)
+        self.assertEqual(list(DateArray(a.ordinals)), dates)
+        self.assertEqual(a[1], 29-Feb-2012)
+        self.assertEqual(a[-1], 1-Jan-1)
+        self.assertEqual(a[1:3].toDates(), [29-Feb-2012, 1-Mar-2013])
+        self.assertEqual(str(a[:2]), '[28-Feb-2012, 29-Feb-2012]')
+
+    def test_components(self):
+        j = int(1-Jan-1896)
+        a = DateArray(range(j, j + 146097, 13))
+        dates = a.toDates()
+        self.assertEqual(list(a.year),    [d.y for d in dates])
+        self.assertEqual(list(a.month),   [d.m for d in dates])
+        self.assertEqual(list(a.day),     [d.d for d in dates])
+        self.assertEqual(list(a.weekday), [d.weekday for d in dates])
+        self.assertEqual(list(a.inLeapYear()), [d.inLeapYear() for d in dates])
+        self.assertEqual(dates[::100], [Date(n) for n in range(j, j + 146097, 1300)])
+
+    def test_comparison(self):
+        a = DateArray.fromDates([14-Jan-2013, 15-Jan-2013, 16-Jan-2013])
+        self.assertEqual(list(a == 15-Jan-2013), [False, True, False])
+        self.assertEqual(list(a  < 15-Jan-2013), [True, False, False])
+        self.assertEqual(list(a >= int(15-Jan-2013)), [False, True, True])
+        self.assertEqual(a[a.weekday == Tue].toDates(), [15-Jan-2013])
+
+    def test_arithmetic(self):
+        a = DateArray.fromDates([31-Dec-2012, 31-Jan-2013, 15-Jan-2013])
+        self.assertEqual((a + 1).toDates(), [1-Jan-2013, 1-Feb-2013, 16-Jan-2013])
+        self.assertEqual((a - 1).toDates(), [30-Dec-2012, 30-Jan-2013, 14-Jan-2013])
+        self.assertEqual((a + 1*months).toDates(), [31-Jan-2013, 28-Feb-2013, 15-Feb-2013])
+        self.assertEqual((a + 1*years + 1*months + 1*days).toDates(), [1-Feb-2014, 1-Mar-2014, 16-Feb-2014])
+        self.assertEqual((a - 2*months).toDates(), [d - 2*months for d in a])
+        self.assertEqual(list(a - (1-Jan-2013)), [-1, 30, 14])
+        self.assertEqual(list((a + 7*days) - a), [7, 7, 7])
+        self.assertEqual(list((1-Jan-2013) - a), [1, -30, -14])
+
+
+class Test_nthWeekday(TestCase):
+    """The nth, last, next and previous weekdays are calculated from ordinals, the same as filtering the month."""
+
+    def test_nthWeekday(self):
+        self.assertEqual(nthWeekday(Jan-2013, Tue, 2), 8-Jan-2013)
+        self.assertEqual(lastWeekday(Jan-2013, Fri), 25-Jan-2013)
+        self.assertEqual(nthWeekday(15-Feb-2012, Wed, -1), 29-Feb-2012)
+        self.assertRaises(IndexError, nthWeekday, Feb-2013, Fri, 5)
+        self.assertRaises(IndexError, nthWeekday, Feb-2013, Fri, 0)
+        for month in (Month(2012, m) for m in range(1, 13)):
+            for weekday in range(7):
+                days = [d for d in month if d.weekday == weekday]
+                for n in range(1, len(days) + 1):
+                    self.assertEqual(nthWeekday(month, weekday, n), days[n - 1])
+                    self.assertEqual(nthWeekday(month, weekday, -n), days[-n])
+                self.assertRaises(IndexError, nthWeekday, month, weekday, len(days) + 1)
+
+    def test_next_previous(self):
+        for d in DateRange(25-Dec-2012, 10-Jan-2013):
+            for weekday in range(7):
+                self.assertEqual(nextWeekday(d, weekday), [e for e in DateRange(d, d + 6) if e.weekday == weekday][0])
+                self.assertEqual(previousWeekday(d, weekday), [e for e in DateRange(d - 6, d) if e.weekday == weekday][0])
+
+    def test_vectorized(self):
+        import numpy
+        y, m = numpy.repeat(numpy.arange(2013, 2023), 12), numpy.tile(numpy.arange(1, 13), 10)
+        months = [Month(int(a), int(b)) for (a, b) in zip(y, m)]
+        self.assertEqual(datearray.nthWeekday(y, m, Tue, 2).toDates(), [nthWeekday(month, Tue, 2) for month in months])
+        self.assertEqual(datearray.lastWeekday(y, m, Fri).toDates(), [lastWeekday(month, Fri) for month in months])
+        self.assertEqual(datearray.nthWeekday(2013, 1, [Mon, Tue], [1, -1]).toDates(), [7-Jan-2013, 29-Jan-2013])
+        self.assertRaises(IndexError, datearray.nthWeekday, y, m, Fri, 5)
+        a = DateArray.fromDates(list(DateRange(25-Dec-2012, 10-Jan-2013)))
+        self.assertEqual(datearray.nextWeekday(a, Fri).toDates(), [nextWeekday(d, Fri) for d in a])
+        self.assertEqual(datearray.previousWeekday(a, Fri).toDates(), [previousWeekday(d, Fri) for d in a])
+
+
+class Test_DurationArray(TestCase):
+    """Adding (subtracting) a DurationArray is the same as adding (subtracting) each Duration to each Date."""
+
+    def test_clamping(self):
+        self.assertEqual((31-Jan-2013 + DurationArray(months=[1, 13, 37])).toDates(), [28-Feb-2013, 28-Feb-2014, 29-Feb-2016])
+        self.assertEqual((29-Feb-2012 - DurationArray(years=[1, 4], days=1)).toDates(), [27-Feb-2011, 28-Feb-2008])
+        a = DateArray.fromDates([31-Jan-2013, 31-Mar-2013, 29-Feb-2012])
+        self.assertEqual((a + DurationArray(months=1)).toDates(), [28-Feb-2013, 30-Apr-2013, 29-Mar-2012])
+        self.assertEqual((a - DurationArray(months=[1, 1, 12])).toDates(), [31-Dec-2012, 28-Feb-2013, 28-Feb-2011])
+
+    def test_same_as_Duration(self):
+        import random
+        r = random.Random(0)
+        dates = [Date(r.randint(int(1-Jan-1900), int(31-Dec-2100))) for _ in range(5000)]
+        durations = [Duration(r.randint(-5, 5), r.randint(-30, 30), r.randint(-40, 40)) for _ in range(5000)]
+        a, b = (DateArray.fromDates(dates), DurationArray.fromDurations(durations))
+        self.assertEqual((a + b).toDates(), [d + x for (d, x) in zip(dates, durations)])
+        self.assertEqual((b + a).toDates(), [d + x for (d, x) in zip(dates, durations)])
+        self.assertEqual((a - b).toDates(), [d - x for (d, x) in zip(dates, durations)])
+        self.assertEqual(list(b), durations)
+
+    def test_DurationArray(self):
+        b = DurationArray.fromDurations([1*years, 6*months, 10*days])
+        self.assertEqual((len(b), b[1], list(b.months)), (3, 6*months, [12, 6, 0]))
+        self.assertEqual(list(b[1:] * 2), [12*months, 20*days])
+        self.assertEqual(list(-b[:1]), [-1*years])
+        self.assertEqual(list(b[:2] + 1*months), [1*years + 1*months, 7*months])
+
+
+class Test_duration(TestCase):
+    """datearray.duration is the same as DateInterval.duration, for arrays of starts and ends."""
+
+    def test_duration(self):
+        import random
+        r = random.Random(0)
+        starts = [Date(r.randint(int(1-Jan-1900), int(31-Dec-2100))) for _ in range(5000)]
+        ends = [s + r.randint(-400, 20000) for s in starts]
+        starts += [31-Jan-2013, 29-Feb-2012, 15-Mar-2013, 31-Mar-2013]
+        ends += [1-Mar-2013, 28-Feb-2013, 14-Mar-2014, 1-Mar-2013]
+        a, b = (DateArray.fromDates(starts), DateArray.fromDates(ends))
+        intervals = [DateInterval(s, e) for (s, e) in zip(starts, ends)]
+        y, m, d = datearray.duration(a, b)
+        self.assertEqual(zip(y.tolist(), m.tolist(), d.tolist()), [i.duration.ymd for i in intervals])
+        self.assertEqual(list(datearray.durationDays(a, b.ordinals)), [len(i) for i in intervals])
+        self.assertEqual(list(datearray.durationMonths(a, b)), [i.months.months for i in intervals])
+
+
+class Test_Timestamp(TestCase):
+    """Timestamps are microseconds since the epoch, converting to Dates and formatting as datetime does."""
+
+    def test_timestamp(self):
+        from datetime import datetime, timedelta
+        dt = datetime(2013, 1, 15, 10, 30, 5, 250)
+        t = Timestamp.fromDatetime(dt)
+        self.assertEqual(t, Timestamp.fromDate(15-Jan-2013, 10, 30, 5, 250))
+        self.assertEqual((t.date, t.hour, t.minute, t.second, t.microsecond), (15-Jan-2013, 10, 30, 5, 250))
+        self.assertEqual(t.toDatetime(), dt)
+        self.assertEqual(str(t), str(dt))
+        self.assertEqual(str(Timestamp.fromDate(15-Jan-2013)), '2013-01-15 00:00:00')
+        self.assertEqual(Timestamp(-1).date, 31-Dec-1969)
+        self.assertEqual(Timestamp.fromSeconds(86400.5), Timestamp(86400500000))
+        self.assertEqual((t + timedelta(hours=14)).date, 16-Jan-2013)
+        self.assertEqual((t + 1) - t, 1)
+        self.assertTrue(t < t + 1)
+        self.assertEqual(Timestamp.fromDatetime(datetime(2013, 1, 15, 10, tzinfo=tz.tzoffset(None, 36000))), Timestamp.fromDate(15-Jan-2013))
+
+    def test_now(self):
+        Date.clock = Clock().freeze(15-Jan-2013)
+        try:
+            self.assertEqual(Timestamp.now().date, 15-Jan-2013)
+        finally:
+            Date.clock = clock
+
+    def test_format(self):
+        from datetime import datetime
+        dt = datetime(2013, 1, 15, 22, 5, 9, 42)
+        t = Timestamp.fromDatetime(dt)
+        for spec in ['%Y-%m-%d %H.%M.%S.%f', '%d-%b-%Y %I%p', '%a %A %j %w', '%c', '%Y%m%d%Hh%M:>16']:
+            time_spec, fmt_spec = spec.split(':') if ':' in spec else (spec, '')
+            self.assertEqual(format(t, spec), format(dt.strftime(time_spec), fmt_spec), spec)
+        self.assertEqual(format(t, ':22'), format(str(t), '22'))
+        self.assertEqual(timestamp.format_many([t, t + 3600000000], '%H:'), ['22', '23'])
+        self.assertEqual(timestamp.format_many(TimestampArray.fromTimestamps([t]), '%d %f'), ['15 000042'])
+
+    def test_array(self):
+        from random import Random
+        random = Random(0)
+        timestamps = [Timestamp(random.randint(-10**15, 10**16)) for _ in range(1000)]
+        a = TimestampArray.fromTimestamps(timestamps)
+        self.assertEqual(a.dates.toDates(), [t.date for t in timestamps])
+        self.assertEqual(a.hour.tolist(), [t.hour for t in timestamps])
+        self.assertEqual(a.minute.tolist(), [t.minute for t in timestamps])
+        self.assertEqual(a.second.tolist(), [t.second for t in timestamps])
+        self.assertEqual(a.microsecond.tolist(), [t.microsecond for t in timestamps])
+        self.assertEqual(list(a + 1), [t + 1 for t in timestamps])
+        self.assertEqual(a[0], timestamps[0])
+        self.assertEqual(((a + 5) - a).tolist(), [5] * 1000)
+        self.assertEqual(len(a[a < timestamps[0]]), sum(t < timestamps[0] for t in timestamps))
+        self.assertEqual(TimestampArray.fromDates(DateArray.fromDates([15-Jan-2013]))[0], Timestamp.fromDate(15-Jan-2013))
+
+
+class Test_DateRange(TestCase):
+    """DateRanges are lazy ranges of Dates, every n days or every Duration."""
+
+    def test_days(self):
+        r = DateRange(30-Dec-2012, 2-Jan-2013)
+        self.assertEqual(list(r), [30-Dec-2012, 31-Dec-2012, 1-Jan-2013, 2-Jan-2013])
+        self.assertEqual(len(r), 4)
+        self.assertEqual(r[0], 30-Dec-2012)
+        self.assertEqual(r[-1], 2-Jan-2013)
+        self.assertEqual(list(reversed(r)), list(r)[::-1])
+        self.assertTrue(1-Jan-2013 in r)
+        self.assertFalse(3-Jan-2013 in r)
+        self.assertFalse(Jan-2013 in r)
+        self.assertRaises(IndexError, lambda: r[4])
+        self.assertEqual(len(DateRange(2-Jan-2013, 1-Jan-2013)), 0)
+
+    def test_step(self):
+        r = DateRange(6-Jan-2013, 31-Dec-2013, 7*days)
+        self.assertEqual(len(r), 52)
+        self.assertEqual(r[-1], 29-Dec-2013)
+        self.assertTrue(13-Jan-2013 in r)
+        self.assertFalse(14-Jan-2013 in r)
+        self.assertEqual(list(r), [d for d in Year(2013) if d.weekday == Sun])
+        self.assertEqual(list(r[1::2]), list(r)[1::2])
+        self.assertEqual(list(r[-3:][::-1]), list(r)[-3:][::-1])
+        self.assertFalse(6-Jan-2013 in r[1::2])
+        self.assertTrue(13-Jan-2013 in r[1::2])
+        self.assertRaises(ValueError, DateRange, 1-Jan-2013, 31-Dec-2013, 0)
+
+    def test_months(self):
+        r = DateRange(31-Jan-2012, 31-Dec-2013, 1*months)
+        self.assertEqual(len(r), 24)
+        self.assertEqual(list(r), [m[-1] for y in (2012, 2013) for m in (Month(y, n) for n in range(1, 13))])
+        self.assertEqual(r[1], 29-Feb-2012)
+        self.assertEqual(r[13], 28-Feb-2013)
+        self.assertTrue(30-Apr-2013 in r)
+        self.assertFalse(30-Mar-2013 in r)
+        self.assertEqual(list(r[::-6]), [31-Dec-2013, 30-Jun-2013, 31-Dec-2012, 30-Jun-2012])
+        self.assertEqual(len(DateRange(31-Jan-2012, 30-Dec-2013, 1*months)), 23)
+        r = DateRange(31-Jan-1900, 1-Jan-2100, 3*months + 1*days)
+        self.assertEqual(len(r), len([j for j in range(0, 800) if (31-Jan-1900) + (3*months + 1*days) * j <= 1-Jan-2100]))
+        r = DateRange(15-Jan-1900, 31-Dec-2099, 1*years)
+        self.assertEqual(len(r), 200)
+        self.assertEqual(r[199], 15-Jan-2099)
+        self.assertTrue(15-Jan-2000 in r)
+
+
+class Test_TimeSeries(TestCase):
+    """A TimeSeries slices by binary search, finds as-of values and aggregates rolling windows, as brute force does."""
+
+    def setUp(self):
+        from random import Random
+        random = Random(0)
+        ordinals = sorted(random.sample(xrange(int(1-Jan-2012), int(31-Dec-2013)), 300))
+        self.values = dict((Date(o), random.randint(-100, 100)) for o in ordinals)
+        self.ts = TimeSeries.fromDict(self.values)
+
+    def brute(self, start, end):
+        return sorted((d, v) for (d, v) in self.values.items() if start <= d <= end)
+
+    def test_lookup(self):
+        ts = self.ts
+        self.assertEqual(list(ts), sorted(self.values.items()))
+        for d in DateRange(1-Jan-2012, 31-Dec-2013, 17):
+            self.assertEqual(d in ts, d in self.values)
+            self.assertEqual(ts.get(d), self.values.get(d))
+            before = [v for (e, v) in sorted(self.values.items()) if e <= d]
+            self.assertEqual(ts.asOf(d), before[-1] if before else None)
+        d = sorted(self.values)[5]
+        self.assertEqual(ts[d], self.values[d])
+        self.assertRaises(KeyError, ts.__getitem__, d + 1 if d + 1 not in self.values else d - 1)
+        self.assertEqual(ts.asOf(31-Dec-2011), None)
+
+    def test_slicing(self):
+        ts = self.ts
+        self.assertEqual(list(ts[Feb-2012]), self.brute(1-Feb-2012, 29-Feb-2012))
+        self.assertEqual(list(ts[Year(2013)]), self.brute(1-Jan-2013, 31-Dec-2013))
+        self.assertEqual(list(ts[DateInterval(10-Mar-2012, 20-Jun-2013)]), self.brute(10-Mar-2012, 20-Jun-2013))
+        self.assertEqual(list(ts[10-Mar-2012:Jun-2013]), self.brute(10-Mar-2012, 30-Jun-2013))
+        self.assertEqual(list(ts[:Jan-2012]), self.brute(1-Jan-2000, 31-Jan-2012))
+        self.assertEqual(list(ts[DateInterval(1-Jan-2011, 31-Dec-2011)]), [])
+
+    def test_append(self):
+        items = sorted(self.values.items())
+        ts = TimeSeries()
+        for (d, v) in items[:100]:
+            ts.append(d, v)
+        ts.extend([d for (d, v) in items[100:]], [v for (d, v) in items[100:]])
+        self.assertEqual(list(ts), items)
+        self.assertRaises(ValueError, ts.append, items[-1][0], 1)
+        view = ts[Jan-2012]
+        view.append(1-Jan-2014, 7)
+        self.assertEqual(list(ts), items)
+        self.assertEqual(list(TimeSeries([3-Jan-2013, 1-Jan-2013], [3, 1])), [(1-Jan-2013, 1), (3-Jan-2013, 3)])
+        self.assertRaises(ValueError, TimeSeries, [1-Jan-2013, 1-Jan-2013], [1, 2])
+
+    def test_rolling(self):
+        ts, items = (self.ts, [(int(d), v) for (d, v) in sorted(self.values.items())])
+        for (window, start) in [(30, lambda d: int(d) - 29), (3*months, lambda d: int(d - 3*months) + 1)]:
+            windows = [[w for (e, w) in items if start(Date(o)) <= e <= o] for (o, v) in items]
+            for how, f in [('sum', sum), ('count', len), ('min', min), ('max', max), ('mean', lambda v: sum(v) / float(len(v)))]:
+                expected = [(Date(o), f(w)) for ((o, v), w) in zip(items, windows)]
+                self.assertEqual(list(ts.rolling(window, how)), expected, how)
+
+
+class Test_IntervalIndex(TestCase):
+    """IntervalIndexes find the Intervals that contain a Date, or overlap an Interval."""
+
+    def setUp(self):
+        from random import Random
+        random = Random(0)
+        self.intervals = [DateInterval(Date(n), Date(n + random.randint(0, 60)))
+                          for n in (random.randint(int(1-Jan-2013), int(31-Dec-2013)) for _ in range(500))]
+        self.intervals += [DateInterval(None, 1-Feb-2013), DateInterval(1-Dec-2013, None), DateInterval(None, None)]
+        self.index = IntervalIndex(self.intervals)
+
+    def test_containing(self):
+        key = lambda i: int(i._start) if i._start is not None else 0
+        for d in DateRange(1-Dec-2012, 31-Mar-2014, 5):
+            self.assertEqual(sorted(self.index.containing(d), key=key),
+                             sorted((i for i in self.intervals if d in i), key=key))
+        self.assertEqual(self.index[1-Jan-2012], [DateInterval(None, 1-Feb-2013)])
+        numbers = [Interval(0.5, 1.5), Interval(1.5, 2.5)]
+        index = IntervalIndex(numbers)
+        self.assertEqual([index.containing(x) for x in (0.2, 1.2, 1.5, 2.7)], [[], numbers[:1], numbers, []])
+
+    def test_overlapping(self):
+        key = lambda i: int(i._start) if i._start is not None else 0
+        for d in DateRange(1-Dec-2012, 31-Mar-2014, 11):
+            query = DateInterval(d, d + 20)
+            self.assertEqual(sorted(self.index.overlapping(query), key=key),
+                             sorted((i for i in self.intervals if (i._start is not None or i._end is not None) and
+                                     (i._start is None or i._start <= query._end) and
+                                     (i._end is None or query._start <= i._end)), key=key))
+        self.assertEqual(len(self.index.overlapping(DateInterval(None, None))), 502)
+        self.assertEqual(self.index.overlapping(DateInterval(2-Jan-2013, 1-Jan-2013)), [])
+
+    def test_fromSorted(self):
+        starts, ends = [1, 3, 5, 7], [10, 4, 5, None]
+        index = IntervalIndex.fromSorted(starts, ends)
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index[5], [0, 2])
+        self.assertEqual(index[100], [3])
+        self.assertEqual(index.overlapping(Interval(4, 6)), [0, 1, 2])
+        index = IntervalIndex.fromSorted(starts, ends, 'abcd')
+        self.assertEqual(index.overlapping(Interval(6, None)), ['a', 'd'])
+
+
+class Test_IntervalSet(TestCase):
+    """IntervalSets hold disjoint, coalesced Intervals, with the same values as the Intervals they are made from."""
+
+    days = range(int(1-Dec-2012), int(31-Jan-2014) + 1)
+
+    def values(self, intervals):
+        bounds = [(int(i._start) if i._start is not None else 0, int(i._end) if i._end is not None else 10**7) for i in intervals]
+        return set(d for d in self.days if any(start <= d <= end for (start, end) in bounds))
+
+    def random(self, random):
+        intervals = []
+        for _ in range(random.randint(0, 8)):
+            start = Date(random.randint(int(1-Jan-2013), int(31-Dec-2013)))
+            end = start + random.randint(-2, 40)
+            intervals.append(DateInterval(start if random.random() > 0.1 else None, end if random.random() > 0.1 else None))
+        return intervals
+
+    def test_coalesce(self):
+        s = IntervalSet([DateInterval(5-Jan-2013, 31-Jan-2013), DateInterval(1-Jan-2013, 10-Jan-2013),
+                         DateInterval(1-Feb-2013, 3-Feb-2013), DateInterval(10-Mar-2013, 12-Mar-2013), DateInterval(2-Apr-2013, 1-Apr-2013)])
+        self.assertEqual(list(s), [DateInterval(1-Jan-2013, 3-Feb-2013), DateInterval(10-Mar-2013, 12-Mar-2013)])
+        self.assertTrue(isinstance(s[0], DateInterval))
+        self.assertEqual((len(s), 3-Feb-2013 in s, 4-Feb-2013 in s, 31-Dec-2012 in s), (2, True, False, False))
+        self.assertEqual(list(IntervalSet(Interval(1, 3)) | Interval(5, 6) | Interval(4, 4)), [Interval(1, 6)])
+
+    def test_operations(self):
+        from random import Random
+        random = Random(0)
+        for _ in range(100):
+            a, b = (self.random(random), self.random(random))
+            s, t = (IntervalSet(a), IntervalSet(b))
+            self.assertEqual(self.values(s), self.values(a))
+            self.assertEqual(self.values(s | t), self.values(a) | self.values(b))
+            self.assertEqual(self.values(s & t), self.values(a) & self.values(b))
+            self.assertEqual(self.values(s - t), self.values(a) - self.values(b))
+            self.assertEqual(self.values(s.complement(DateInterval(1-Mar-2013, 31-Oct-2013))),
+                             self.values([DateInterval(1-Mar-2013, 31-Oct-2013)]) - self.values(a))
+            self.assertEqual(IntervalSet(list(s)), s)
+            self.assertTrue(all(i._end + 1 < j._start for (i, j) in zip(s, list(s)[1:])))
+
+    def test_open(self):
+        s = IntervalSet([DateInterval(None, 31-Jan-2013), DateInterval(1-Mar-2013, None)])
+        self.assertEqual(list(s.complement(DateInterval(None, None))), [DateInterval(1-Feb-2013, 28-Feb-2013)])
+        self.assertEqual(list(s | DateInterval(15-Jan-2013, 1-Mar-2013)), [DateInterval(None, None)])
+        self.assertEqual((1-Jan-1900 in s, 15-Feb-2013 in s, 1-Jan-2100 in s), (True, False, True))
+        self.assertEqual(list(IntervalSet().complement(DateInterval(1-Jan-2013, 31-Jan-2013))), [DateInterval(1-Jan-2013, 31-Jan-2013)])
+
+
+class Test_BusinessCalendar(TestCase):
+    """BusinessCalendars count business days (i.e. not weekends or holidays)."""
+
+    def setUp(self):
+        self.holidays = [1-Jan-2013, 28-Jan-2013, 29-Mar-2013, 1-Apr-2013, 25-Dec-2013, 26-Dec-2013, 1-Jan-2014]
+        self.calendar = BusinessCalendar(self.holidays)
+
+    def business(self, d):
+        return d.weekday not in Weekend and d not in self.holidays
+
+    def test_isBusinessDay(self):
+        days = list(DateRange(1-Dec-2012, 31-Jan-2014))
+        self.assertEqual([self.calendar.isBusinessDay(d) for d in days], [self.business(d) for d in days])
+        self.assertEqual(list(self.calendar.isBusinessDay(DateArray.fromDates(days))), [self.business(d) for d in days])
+        self.assertFalse(BusinessCalendar(weekend=[Fri, Sat]).isBusinessDay(1-Mar-2013))
+        self.assertTrue( BusinessCalendar(weekend=[Fri, Sat]).isBusinessDay(3-Mar-2013))
+
+    def test_addBusinessDays(self):
+        c = self.calendar
+        self.assertEqual(c.addBusinessDays(24-Dec-2013, 1), 27-Dec-2013)
+        self.assertEqual(c.addBusinessDays(27-Dec-2013, -1), 24-Dec-2013)
+        self.assertEqual(c.addBusinessDays(28-Dec-2013, 0), 30-Dec-2013)
+        self.assertEqual(c.addBusinessDays(30-Dec-2013, 0), 30-Dec-2013)
+        self.assertEqual(c.addBusinessDays(28-Dec-2013, 3), 2-Jan-2014)
+        self.assertEqual(c.addBusinessDays(28-Dec-2013, -1), 27-Dec-2013)
+        for d in DateRange(1-Dec-2012, 31-Jan-2014, 3):
+            for n in (1, 5, 20, -1, -5, -20):
+                expected, step = d, 1 if n > 0 else -1
+                for _ in range(abs(n)):
+                    expected += step
+                    while not self.business(expected):
+                        expected += step
+                self.assertEqual(c.addBusinessDays(d, n), expected)
+                self.assertEqual(c.businessDaysBetween(d, expected), n if n > 0 else n + (not self.business(d)))
+        far = c.addBusinessDays(1-Jan-2013, 2610)
+        self.assertEqual(far, c.addBusinessDays(c.addBusinessDays(1-Jan-2013, 1000), 1610))
+        self.assertEqual(c.businessDaysBetween(1-Jan-2013, far), 2610)
+        self.assertEqual(c.addBusinessDays(far, -2609), 2-Jan-2013)
+        a = DateArray.fromDates([24-Dec-2013, 28-Dec-2013, 1-Jan-2013])
+        self.assertEqual(c.addBusinessDays(a, 1).toDates(), [27-Dec-2013, 30-Dec-2013, 2-Jan-2013])
+        self.assertEqual(c.addBusinessDays(a, [1, 2, -1]).toDates(), [27-Dec-2013, 31-Dec-2013, 31-Dec-2012])
+
+    def test_businessDaysBetween(self):
+        c = self.calendar
+        self.assertEqual(c.businessDaysBetween(1-Jan-2013, 31-Dec-2013), 255)
+        self.assertEqual(c.businessDaysBetween(31-Dec-2013, 1-Jan-2013), -255)
+        self.assertEqual(c.businessDaysBetween(1-Jan-2013, 1-Jan-2013), 0)
+        a = DateArray.fromDates([1-Jan-2013, 1-Jul-2013])
+        self.assertEqual(list(c.businessDaysBetween(a, 31-Dec-2013)), [255, len(filter(self.business, DateRange(2-Jul-2013, 31-Dec-2013)))])
+
+
+class Test_Resampler(TestCase):
+    """Resampler groups dates by period, and aggregates paired values, the same as grouping by d.week, d.month or d.year."""
+    dates = list(DateRange(20-Dec-2012, 10-Feb-2014, 5))
+
+    def key(self, period):
+        """Return a hashable key for a period (Intervals are compared by their start and end)."""
+        return (period._start, period._end) if isinstance(period, DateInterval) else period
+
+    def test_periods(self):
+        values = range(len(self.dates))
+        quarter = lambda d: DateInterval(Date(d.y, (d.m - 1) // 3 * 3 + 1, 1), Month(d.y, (d.m - 1) // 3 * 3 + 3)[-1])
+        for (period, label) in (('week', lambda d: d.week), ('month', lambda d: d.month), ('quarter', quarter), ('year', lambda d: d.year)):
+            r = Resampler(DateArray.fromDates(self.dates), period)
+            groups = {}
+            for (d, v) in zip(self.dates, values):
+                groups.setdefault(self.key(label(d)), []).append(v)
+            labels = [self.key(l) for l in r.labels]
+            self.assertEqual(labels, sorted(groups))
+            self.assertEqual(list(r.sum(values)),   [sum(groups[l]) for l in labels])
+            self.assertEqual(list(r.count()),       [len(groups[l]) for l in labels])
+            self.assertEqual(list(r.min(values)),   [min(groups[l]) for l in labels])
+            self.assertEqual(list(r.max(values)),   [max(groups[l]) for l in labels])
+            self.assertEqual(list(r.mean(values)),  [float(sum(groups[l])) / len(groups[l]) for l in labels])
+
+    def test_resample(self):
+        self.assertEqual(resample([1-Jan-2013, 15-Jan-2013, 3-Mar-2013], [1.5, 2.0, 4.0], 'month'),
+                         [(Jan-2013, 3.5), (Mar-2013, 4.0)])
+        self.assertEqual(resample([1-Jan-2013, 31-Dec-2013, 1-Jan-2014], None, 'year', 'count'), [(Year(2013), 2), (Year(2014), 1)])
+        self.assertEqual(resample([], [], 'month'), [])
+        self.assertRaises(ValueError, Resampler([1-Jan-2013], 'month').sum, [1, 2])
+
+
+class Test_columnar(TestCase):
+    """Sequences of Dates, Months, Years and DateIntervals round trip through the columnar format."""
+    dates = [1-Jan-2013, 15-Jan-2013, 3-Feb-2012, 29-Feb-2012]
+
+    def test_round_trip(self):
+        intervals = [DateInterval(1-Jan-2013, 31-Jan-2013), DateInterval(3-Feb-2012, 29-Feb-2012)]
+        for items in (self.dates, [d.month for d in self.dates], [d.year for d in self.dates], []):
+            column = columnar.loads(columnar.dumps(items))
+            self.assertEqual(list(column), items)
+            self.assertEqual(len(column), len(items))
+            if items:
+                self.assertEqual((column[0], column[-1], column[1:3]), (items[0], items[-1], items[1:3]))
+        column = columnar.loads(columnar.dumps(intervals))
+        self.assertEqual([(i._start, i._end) for i in column], [(i._start, i._end) for i in intervals])
+        self.assertEqual(list(columnar.loads(columnar.dumps(DateArray.fromDates(self.dates)))), self.dates)
+
+    def test_intervals(self):
+        """Intervals are read as the class written, and single items are decoded on their own."""
+        weeks = [Week(1-Jan-2013), Week(3-Feb-2012)]
+        column = columnar.loads(columnar.dumps(weeks))
+        self.assertEqual([type(column[0]), type(column[-1])] + map(type, column) + map(type, column[:1]), [Week] * 5)
+        self.assertEqual((column[1]._start, column[1]._end), (3-Feb-2012, 9-Feb-2012))
+        column = columnar.loads(columnar.dumps([Interval(1-Jan-2013, 5-Jan-2013)]))
+        self.assertEqual((type(column[0]), len(column[0])), (Interval, 4))
+        self.assertTrue(column._values is None)
+        self.assertRaises(TypeError, columnar.dumps, [Interval(1, 5)])
+
+    def test_format(self):
+        data = columnar.dumps(self.dates)
+        self.assertEqual(len(data), 12 + 4 * len(self.dates))
+        column = columnar.loads(data)
+        self.assertEqual(list(column._deltas), [int(self.dates[0])] + [int(b) - int(a) for (a, b) in zip(self.dates, self.dates[1:])])
+        self.assertEqual(column.toDateArray().toDates(), self.dates)
+        self.assertRaises(ValueError, columnar.loads, 'not a column')
+        self.assertRaises(ValueError, columnar.loads, data[:-1])
+        self.assertRaises(TypeError, columnar.dumps, [1-Jan-2013, Jan-2013])
+        self.assertRaises(TypeError, columnar.dumps, [Interval(None, 1-Jan-2013)])
+
+    def test_zero_copy(self):
+        """Columns are read in place from buffers (including concatenated columns) and memory mapped files."""
+        import tempfile
+        months = [d.month for d in self.dates]
+        data = bytearray(columnar.dumps(self.dates) + columnar.dumps(months))
+        first = columnar.loads(memoryview(data))
+        self.assertEqual(list(columnar.loads(memoryview(data), first.nbytes)), months)
+        data[12:16] = columnar.dumps([2-Jan-2013])[12:]
+        self.assertEqual(first[0], 2-Jan-2013)
+        with tempfile.TemporaryFile() as f:
+            columnar.dump(self.dates, f)
+            f.flush()
+            self.assertEqual(list(columnar.load(f)), self.dates)
+
+
+class Test_Recurrence(TestCase):
+    """Recurrences are the same as filtering every Date, and skip straight to any Date."""
+    days = list(DateRange(1-Jan-2013, 31-Dec-2015))
+
+    def check(self, recurrence, expected):
+        self.assertEqual(recurrence.between(self.days[0], self.days[-1]), expected)
+        for d in self.days[::17]:
+            following, found = ([e for e in expected if e > d], recurrence.following(d))
+            if following: self.assertEqual(found, following[0])
+            else:         self.assertTrue(found is None or found > self.days[-1])
+
+    def test_Weekly(self):
+        self.check(Weekly(4-Jan-2013, Fri, interval=2), [d for d in self.days if d.weekday == Fri and (int(d) - int(4-Jan-2013)) % 14 == 0])
+        self.check(Weekly(2-Jan-2013, Fri, count=3), [4-Jan-2013, 11-Jan-2013, 18-Jan-2013])
+        self.assertEqual(list(Weekly(2-Jan-2013, until=23-Jan-2013)), [2-Jan-2013, 9-Jan-2013, 16-Jan-2013, 23-Jan-2013])
+
+    def test_Monthly(self):
+        self.check(Monthly(15-Jan-2013, days=[15, -1]), [d for d in self.days if d.d == 15 or d.d == len(d.month)])
+        self.check(Monthly(31-Jan-2013, interval=2, until=31-Dec-2013),
+                   [31-Jan-2013, 31-Mar-2013, 31-May-2013, 31-Jul-2013, 30-Sep-2013, 30-Nov-2013])
+        self.check(MonthlyWeekday(Jan-2013, Tue, 2), [d for d in self.days if d.weekday == Tue and 8 <= d.d <= 14])
+        self.check(MonthlyWeekday(Jan-2013, Fri, 5, count=4), [29-Mar-2013, 31-May-2013, 30-Aug-2013, 29-Nov-2013])
+        self.assertEqual(MonthlyWeekday(Feb-2013, Fri, 5, interval=4800).following(1-Jan-2013), None)
+        self.assertEqual(MonthlyWeekday(Jan-2013, Fri, 5, until=28-Feb-2013).following(1-Jan-2013), None)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, Weekly, 4-Jan-2013, Fri, interval=0)
+        self.assertRaises(ValueError, Monthly, 1-Jan-2013, days=[])
+        self.assertRaises(ValueError, Monthly, 1-Jan-2013, days=[0, 15])
+        self.assertRaises(ValueError, Monthly, 1-Jan-2013, interval=0)
+        self.assertRaises(ValueError, MonthlyWeekday, Jan-2013, Fri, 6)
+        self.assertRaises(ValueError, MonthlyWeekday, Jan-2013, Fri, 0)
+
+    def test_Adjusted(self):
+        calendar = BusinessCalendar(holidays=[29-Mar-2013, 1-Apr-2013, 31-Dec-2013])
+        quarters = Monthly(31-Mar-2013, days=[-1], interval=3)
+        self.check(quarters.adjusted(), [max(e for e in self.days if e.month == d.month and e.weekday not in Weekend)
+                                         for d in self.days if d.m % 3 == 0 and d.d == len(d.month)])
+        self.check(quarters.adjusted(calendar, count=4), [28-Mar-2013, 28-Jun-2013, 30-Sep-2013, 30-Dec-2013])
+        self.check(quarters.adjusted(calendar, 'following', count=4), [2-Apr-2013, 1-Jul-2013, 30-Sep-2013, 1-Jan-2014])
+        self.check(Monthly(1-Jun-2013, days=[1, 2]).adjusted(count=3), [31-May-2013, 1-Jul-2013, 2-Jul-2013])
+
+    def test_Union(self):
+        union = MonthlyWeekday(Jan-2013, Tue, 2) | Monthly(1-Jan-2013, days=[1, 8])
+        self.check(union, [d for d in self.days if d.d in (1, 8) or (d.weekday == Tue and 8 <= d.d <= 14)])
+        from itertools import islice
+        self.assertEqual(list(islice(union.after(31-Dec-2099), 3)), [1-Jan-2100, 8-Jan-2100, 12-Jan-2100])
+
+
+class Test_PeriodCalendar(TestCase):
+    """PeriodCalendars look up fiscal years, quarters, periods and pay periods from precomputed tables."""
+
+    def test_months(self):
+        c = PeriodCalendar(1-Jan-2010, 31-Dec-2016, yearStart=Jul)
+        days = list(DateRange(1-Jan-2010, 31-Dec-2016, 3))
+        self.assertEqual([c.fiscalYear(d) for d in days], [d.y + (d.m >= 7) for d in days])
+        self.assertEqual([c.fiscalPeriod(d) for d in days], [(d.m - 7) % 12 + 1 for d in days])
+        self.assertEqual([c.fiscalQuarter(d) for d in days], [(d.m - 7) % 12 // 3 + 1 for d in days])
+        a = DateArray.fromDates(days)
+        self.assertEqual(list(c.fiscalYear(a)), [c.fiscalYear(d) for d in days])
+        self.assertEqual(list(c.fiscalQuarter(a)), [c.fiscalQuarter(d) for d in days])
+        self.assertEqual(PeriodCalendar(1-Jan-2013, 31-Dec-2013).fiscalYear(31-Dec-2013), 2013)
+        self.assertRaises(IndexError, c.fiscalYear, 1-Jan-2017)
+        self.assertRaises(IndexError, c.fiscalYear, DateArray.fromDates([1-Jan-2013, 31-Dec-2009]))
+
+    def test_weeks(self):
+        c = PeriodCalendar(1-Jan-2010, 31-Dec-2016, weeks=(4, 4, 5))
+        starts = [d for d in DateRange(2-Jan-2010, 31-Dec-2016) if (c.fiscalYear(d), c.fiscalPeriod(d)) != (c.fiscalYear(d - 1), c.fiscalPeriod(d - 1))]
+        self.assertTrue(all(d.weekday == Sun for d in starts))
+        self.assertEqual(starts[:3], [3-Jan-2010, 31-Jan-2010, 28-Feb-2010])
+        lengths = [int(b) - int(a) for (a, b) in zip(starts, starts[1:])]
+        self.assertEqual(lengths[:12], [28, 28, 35] * 4)
+        self.assertEqual((c.fiscalYear(3-Jan-2015), c.fiscalPeriod(3-Jan-2015), c.fiscalYear(4-Jan-2015)), (2014, 12, 2015))
+        self.assertEqual(lengths[59], 42)       #The 53rd week of 2014
+        for weeks in ((), (4, 4, 4, 5, 5), (4, 4, 4), (5, 4, 4, 4)):
+            self.assertRaises(ValueError, PeriodCalendar, 1-Jan-2010, 31-Dec-2016, weeks=weeks)
+        self.assertEqual(PeriodCalendar(1-Jan-2013, 31-Dec-2013, weeks=(4, 5, 4) * 4).fiscalPeriod(1-Jul-2013), 7)
+
+    def test_pay_periods(self):
+        c = PeriodCalendar(1-Jan-2013, 31-Dec-2013, payAnchor=4-Jan-2013)
+        self.assertEqual([c.payPeriod(d) for d in (3-Jan-2013, 4-Jan-2013, 17-Jan-2013, 18-Jan-2013)], [-1, 0, 0, 1])
+        self.assertEqual(c.payPeriodDates(20-Jan-2013), DateInterval(18-Jan-2013, 31-Jan-2013))
+        self.assertEqual(c.payPeriodDates(DateArray.fromDates([1-Jan-2013, 20-Jan-2013])).toDates(), [21-Dec-2012, 18-Jan-2013])
+        self.assertRaises(ValueError, PeriodCalendar(1-Jan-2013, 31-Dec-2013).payPeriod, 1-Jan-2013)
+
+
+class Test_Clock(TestCase):
+    """Date.today reads a Clock, which caches the current Date until midnight and may be frozen or advanced."""
+
+    def setUp(self):
+        self.now = [time.mktime((2013, 1, 15, 23, 59, 0, 0, 0, -1))]
+        self.reads = []
+        Date.clock = Clock(lambda: self.reads.append(1) or self.now[0])
+
+    def tearDown(self):
+        Date.clock = clock
+
+    def test_cached(self):
+        self.assertEqual((Date.yesterday, Date.today, Date.tomorrow), (14-Jan-2013, 15-Jan-2013, 16-Jan-2013))
+        today = Date.today
+        today.ymd = (2000, 1, 1)
+        self.assertEqual(Date.today, 15-Jan-2013)
+        self.now[0] += 60
+        self.assertEqual(Date.today, 16-Jan-2013)
+        self.now[0] -= 86400
+        self.assertEqual(Date.today, 15-Jan-2013)
+        self.assertEqual(len(self.reads), 7)
+
+    def test_freeze(self):
+        Date.clock.freeze(29-Feb-2012)
+        self.assertEqual(Date.today, 29-Feb-2012)
+        Date.clock.advance(86400)
+        self.assertEqual(Date.today, 1-Mar-2012)
+        self.now[0] += 86400
+        self.assertEqual(Date.today, 1-Mar-2012)
+        Date.clock.unfreeze()
+        self.assertEqual(Date.today, 16-Jan-2013)
+        Date.clock.advance(-2 * 86400)
+        self.assertEqual(Date.today, 14-Jan-2013)
+        Date.clock.freeze()
+        self.now[0] += 10 * 86400
+        self.assertEqual(Date.today, 14-Jan-2013)
+
+
+class Test_format(TestCase):
+    """Format specs are compiled once, and give the same results as strftime."""
+
+    def test_directives(self):
+        import datetime
+        specs = ['%d-%b-%Y:12', '%A %d %B %Y', '%a %j %w %y', '%Hh%M', '%I%p 100%%', '%U %W', 'it\'s %d "%m"']
+        for n in xrange(int(1-Jan-2012), int(1-Jan-2014), 7):
+            for spec in specs:
+                time_spec, fmt_spec = spec.split(':') if ':' in spec else (spec, '')
+                expected = format(datetime.date.fromordinal(n).strftime(time_spec), fmt_spec)
+                self.assertEqual(format(Date(n), spec), expected)
+                self.assertEqual(formatter(spec)(*Date(n).ymd), expected)
+
+    def test_compiled_once(self):
+        self.assertIs(formatter('%d-%b-%Y:12'), formatter('%d-%b-%Y:12'))
+        self.assertIsNone(formatter(':>12'))
+        self.assertEqual(format(1-Mar-2013, ':>12'), '  1-Mar-2013')
+        self.assertEqual(format(1-Mar-2013, ''), '1-Mar-2013')
+
+    def test_format_many(self):
+        dates = [1-Mar-2013, 15-Jan-2013, 29-Feb-2012]
+        self.assertEqual(format_many(dates, '%d-%b-%Y:>12'), [' 01-Mar-2013', ' 15-Jan-2013', ' 29-Feb-2012'])
+        self.assertEqual(format_many(DateArray.fromDates(dates), '%a %d/%m'), ['Fri 01/03', 'Tue 15/01', 'Wed 29/02'])
+        self.assertEqual(format_many(dates, ':>11'), [format(d, ':>11') for d in dates])
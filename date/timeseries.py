@@ -0,0 +1,164 @@
+"""Time Series
+==============
+"""
+from date 								import Date, Duration, Interval, _monthLength, _toOrdinal
+from datearray 							import DateArray, addDuration
+from resample 							import _ordinals
+from collections 						import deque
+import numpy
+
+
+def _range(key):
+	"""Return (first, last) ordinals of `key`: a Date, Month, Year or Interval (or slice) of Dates (None if open)."""
+	if isinstance(key, slice):
+		if key.step is not None: 		raise ValueError, "TimeSeries slices don't have a step"
+		key 							= Interval(key.start, key.stop)
+	if isinstance(key, Interval):
+		return (None if key._start is None else _range(key._start)[0], None if key._end is None else _range(key._end)[1])
+	y, m, d 							= key.ymd
+	if d: 								return (_toOrdinal(y, m, d),) * 2
+	if m: 								return (_toOrdinal(y, m, 1), _toOrdinal(y, m, _monthLength(y, m)))
+	return (_toOrdinal(y, 1, 1), _toOrdinal(y, 12, 31))
+
+
+class TimeSeries(object):
+	"""Values keyed by Date, stored as parallel arrays of (sorted, unique) ordinals and values.
+
+	.. inheritance-diagram:: TimeSeries
+
+	ts = TimeSeries(dates, values) from `dates` (a DateArray, ordinals or a sequence of Dates), sorting them if necessary
+	ts = TimeSeries.fromDict({1-Jan-2013: 1.5, ...}), ts.append(d, value) and ts.extend(dates, values) add later Dates
+	ts[15-Jan-2013] returns the value on a Date (KeyError if there isn't one), ts.get(d, default) too
+	ts[Jan-2013], ts[Year(2013)], ts[DateInterval(d1, d2)] and ts[d1:d2] (inclusive) return TimeSeries of the values
+	in a Month, Year or range (views of the arrays, found by binary search)
+	ts.asOf(d) returns the last value on or before `d`, ts.rolling(30, 'mean') or ts.rolling(3*months, 'sum')
+	aggregates the values in a window of days (or a Duration) ending on each Date
+	ts.dates (a DateArray) and ts.values (an array), len(ts), for (d, value) in ts, d in ts
+	Appending grows the arrays by doubling, so adding a Date after the last one is amortised O(1).
+	"""
+	__slots__ 	= ('_ordinals', '_values', '_n')
+	def __init__(self, dates=(), values=(), dtype=None):
+		ordinals, values 				= (_ordinals(dates), numpy.asarray(values, dtype=dtype))
+		if len(ordinals) != len(values): 	raise ValueError, "There must be one value for each date"
+		if len(ordinals) and (numpy.diff(ordinals) <= 0).any():
+			order 						= numpy.argsort(ordinals, kind='mergesort')
+			ordinals, values 			= (ordinals[order], values[order])
+			if (numpy.diff(ordinals) == 0).any(): 	raise ValueError, "A TimeSeries has one value for each date"
+		self._ordinals, self._values, self._n 	= (ordinals, values, len(ordinals))
+
+	@classmethod
+	def fromDict(cls, values, dtype=None):
+		"""Return a TimeSeries of a dict of {Date: value}."""
+		return cls(list(values.keys()), list(values.values()), dtype)
+
+	def _view(self, i, j):
+		"""Return a TimeSeries of the ith to (j-1)th values, sharing the arrays."""
+		ts 								= TimeSeries.__new__(TimeSeries)
+		ts._ordinals, ts._values, ts._n = (self._ordinals[i:j], self._values[i:j], max(j - i, 0))
+		return ts
+
+	@property
+	def dates(self): 					return DateArray(self._ordinals[:self._n])
+	@property
+	def values(self): 					return self._values[:self._n]
+	@property
+	def first(self): 					return Date(int(self._ordinals[0])) if self._n else None
+	@property
+	def last(self): 					return Date(int(self._ordinals[self._n - 1])) if self._n else None
+
+	def __len__(self): 					return self._n
+	def __iter__(self): 				return iter(zip(self.dates.toDates(), self.values.tolist()))
+	def __repr__(self): 				return '%s(%s)' % (self.__class__.__name__, self)
+	def __str__(self):
+		pairs 							= list(self) if self._n <= 6 else list(self._view(0, 3)) + ['...'] + list(self._view(self._n - 3, self._n))
+		return '{%s}' % ', '.join(p if isinstance(p, str) else '%s: %s' % p for p in pairs)
+
+	def _index(self, ordinal):
+		"""Return the index of `ordinal`, or None if it isn't in this TimeSeries."""
+		i 								= numpy.searchsorted(self._ordinals[:self._n], ordinal)
+		return i if i < self._n and self._ordinals[i] == ordinal else None
+
+	def __contains__(self, d): 			return self._index(int(d)) is not None
+	def get(self, d, default=None):
+		"""Return the value on Date `d` (or `default`)."""
+		i 								= self._index(int(d))
+		return default if i is None else self._values[i]
+
+	def __getitem__(self, key):
+		if isinstance(key, Date) and key.d and not isinstance(key, Duration):
+			i 							= self._index(int(key))
+			if i is None: 				raise KeyError, key
+			return self._values[i]
+		return self.between(*_range(key))
+
+	def between(self, start, end):
+		"""Return a TimeSeries of the values from `start` to `end` (Dates, or ordinals, inclusive, None if open)."""
+		ordinals 						= self._ordinals[:self._n]
+		i 								= 0 if start is None else numpy.searchsorted(ordinals, int(start), side='left')
+		j 								= self._n if end is None else numpy.searchsorted(ordinals, int(end), side='right')
+		return self._view(i, j)
+
+	def asOf(self, d, default=None):
+		"""Return the last value on or before `d` (or `default`, if there isn't one)."""
+		i 								= numpy.searchsorted(self._ordinals[:self._n], int(d), side='right') - 1
+		return default if i < 0 else self._values[i]
+
+	def _reserve(self, n):
+		"""Make room for `n` more values, doubling the size of the arrays when they are full."""
+		#Only arrays allocated here are longer than the TimeSeries, so views (and the caller's arrays) are never written to.
+		if self._n + n <= len(self._ordinals): 	return
+		size 							= max(2 * (self._n + n), 16)
+		ordinals, values 				= (numpy.empty(size, dtype=numpy.int32), numpy.empty(size, dtype=self._values.dtype))
+		ordinals[:self._n], values[:self._n] 	= (self._ordinals[:self._n], self._values[:self._n])
+		self._ordinals, self._values 	= (ordinals, values)
+
+	def append(self, d, value):
+		"""Add a `value` on Date `d`, which must be after the last Date."""
+		ordinal 						= int(d)
+		if self._n and ordinal <= self._ordinals[self._n - 1]: 	raise ValueError, "Dates must be appended in order"
+		if not self._n and not len(self._values): 	self._values = numpy.asarray([value])[:0]
+		self._reserve(1)
+		self._ordinals[self._n], self._values[self._n] 	= (ordinal, value)
+		self._n 					   += 1
+
+	def extend(self, dates, values):
+		"""Add `values` on `dates` (sorted, and after the last Date)."""
+		ordinals, values 				= (_ordinals(dates), numpy.asarray(values))
+		if len(ordinals) != len(values): 	raise ValueError, "There must be one value for each date"
+		if not len(ordinals): 			return
+		if (numpy.diff(ordinals) <= 0).any() or (self._n and ordinals[0] <= self._ordinals[self._n - 1]):
+			raise ValueError, "Dates must be appended in order"
+		if not self._n and not len(self._values): 	self._values = values[:0]
+		self._reserve(len(ordinals))
+		self._ordinals[self._n:self._n + len(ordinals)] 	= ordinals
+		self._values[self._n:self._n + len(ordinals)] 	= values
+		self._n 					   += len(ordinals)
+
+	def rolling(self, window, how='mean'):
+		"""Return a TimeSeries of `how` ('sum', 'count', 'mean', 'min' or 'max') of the values in the `window` ending on
+		each Date, where `window` is a number of days (e.g. 7 is the Date and the 6 days before it) or a Duration (e.g. 1*months
+		is the Dates after the same day of the month before)."""
+		ordinals, values 				= (self._ordinals[:self._n], self._values[:self._n])
+		if isinstance(window, Duration): 	starts = addDuration(ordinals, window * -1) + 1
+		else: 							starts = ordinals - window + 1
+		first 							= numpy.searchsorted(ordinals, starts, side='left')
+		last 							= numpy.arange(1, self._n + 1)
+		if how in ('sum', 'count', 'mean'):
+			count 						= last - first
+			if how == 'count': 			return TimeSeries(ordinals, count)
+			totals 						= numpy.concatenate(([0], numpy.cumsum(values)))
+			sums 						= totals[last] - totals[first]
+			return TimeSeries(ordinals, sums if how == 'sum' else sums / count.astype(float))
+		if how not in ('min', 'max'): 	raise ValueError, "how must be 'sum', 'count', 'mean', 'min' or 'max'"
+		return TimeSeries(ordinals, self._extremes(values.tolist(), first.tolist(), how == 'max'), self._values.dtype)
+
+	@staticmethod
+	def _extremes(values, first, largest):
+		"""Return the min (or max) of values[first[i]..i] for each i, with a monotonic queue of indices, in O(n)."""
+		queue, result 					= (deque(), [])
+		for (i, value) in enumerate(values):
+			while queue and (values[queue[-1]] <= value if largest else values[queue[-1]] >= value): 	queue.pop()
+			queue.append(i)
+			while queue[0] < first[i]: 	queue.popleft()
+			result.append(values[queue[0]])
+		return result
@@ -0,0 +1,138 @@
+"""Timestamp
+============
+"""
+from date 								import Date, _digits, _directives, _fromOrdinal, _toOrdinal, formatter as _formatter
+from numbers 							import Number
+import datetime
+import time
+
+_epoch 									= _toOrdinal(1970, 1, 1)
+_usPerSecond 							= 1000000
+_usPerDay 								= 86400 * _usPerSecond
+
+
+def _fields(us):
+	"""Return (y, m, d, H, M, S, f) of a number of microseconds since the epoch."""
+	days, us 							= divmod(us, _usPerDay)
+	s, f 								= divmod(us, _usPerSecond)
+	H, s 								= divmod(s, 3600)
+	M, S 								= divmod(s, 60)
+	y, m, d 							= _fromOrdinal(days + _epoch)
+	return (y, m, d, H, M, S, f)
+
+
+_timeDirectives 						= dict(_directives,
+											H=lambda f: _digits[f[3]], M=lambda f: _digits[f[4]], S=lambda f: _digits[f[5]],
+											f=lambda f: '%06d' % f[6], I=lambda f: _digits[(f[3] - 1) % 12 + 1],
+											p=lambda f: 'AM' if f[3] < 12 else 'PM')
+"""The strftime directives rendered directly, as functions of the fields (y, m, d, H, M, S, f), with %f (microseconds)
+as datetime."""
+
+def _strftime(time_spec, fmt_spec):
+	"""Return a function f(y, m, d, H, M, S, f) that formats with :func:`time.strftime`, for directives not in :data:`_timeDirectives`."""
+	def render(y, m, d, H, M, S, f):
+		n 								= _toOrdinal(y, m, d)
+		return format(time.strftime(time_spec, (y, m, d, H, M, S, (n - 1) % 7, n - _toOrdinal(y, 1, 1) + 1, 0)), fmt_spec)
+	return render
+
+_formatters = {}
+def formatter(spec):
+	"""Return a function f(y, m, d, H, M, S, f) that formats a timestamp as `format(timestamp, spec)`, e.g.
+	formatter('%Y-%m-%d %Hh%M:20'), or None if `spec` has no strftime part (the timestamp is formatted as a string).
+	Specs are compiled by :func:`.date.formatter`, with :data:`_timeDirectives`."""
+	return _formatter(spec, _timeDirectives, _strftime, _formatters)
+
+def format_many(timestamps, spec):
+	"""Return a list of `timestamps` (Timestamps, or a :class:`.TimestampArray`) each formatted by `spec`, as `format(timestamp, spec)`."""
+	render 								= formatter(spec)
+	if render is None: 					return [format(t, spec) for t in timestamps]
+	if hasattr(timestamps, 'fields'): 	return map(render, *(a.tolist() for a in timestamps.fields))
+	return [render(*_fields(t.us)) for t in timestamps]
+
+
+class Timestamp(object):
+	"""An instant, stored as an integer number of microseconds since 1-Jan-1970 00:00 (UTC).
+
+	.. inheritance-diagram:: Timestamp
+
+	t = Timestamp(us), Timestamp.fromSeconds(time.time()), Timestamp.fromDatetime(dt) (naive datetimes are UTC)
+	Timestamp.fromDate(15-Jan-2013, 10, 30) returns 15-Jan-2013 10:30:00, Timestamp.now() reads :attr:`Date.clock`
+	t.date returns the Date (by integer division), t.hour, t.minute, t.second, t.microsecond, t.seconds (since the epoch)
+	t + n and t - n add microseconds (or a timedelta), t2 - t1 returns the microseconds between them
+	format(t, '%Y-%m-%d %H:%M:%S.%f') formats with compiled specs (see :func:`formatter`), str(t) as datetime
+	"""
+	__slots__ 	= ('us',)
+	def __init__(self, us): 			self.us = int(us)
+
+	@classmethod
+	def fromSeconds(cls, seconds):
+		"""Return a Timestamp from a number of seconds since the epoch (e.g. from time.time())."""
+		return cls(round(seconds * _usPerSecond))
+	@classmethod
+	def fromDate(cls, d, hour=0, minute=0, second=0, microsecond=0):
+		"""Return a Timestamp of a time on Date `d`."""
+		return cls((int(d) - _epoch) * _usPerDay + ((hour * 60 + minute) * 60 + second) * _usPerSecond + microsecond)
+	@classmethod
+	def fromDatetime(cls, dt):
+		"""Return a Timestamp from a datetime (UTC, if it is naive)."""
+		offset 							= dt.utcoffset()
+		t 								= cls.fromDate(dt.toordinal(), dt.hour, dt.minute, dt.second, dt.microsecond)
+		return t if offset is None else t - offset
+	@classmethod
+	def now(cls):
+		"""Return the current Timestamp, from :attr:`Date.clock` (so it may be frozen)."""
+		return cls.fromSeconds(Date.clock.time())
+
+	def toDatetime(self):
+		"""Return a (naive, UTC) datetime."""
+		return datetime.datetime(*_fields(self.us))
+
+	@property
+	def date(self): 					return Date(self.us // _usPerDay + _epoch)
+	@property
+	def hour(self): 					return self.us % _usPerDay // (3600 * _usPerSecond)
+	@property
+	def minute(self): 					return self.us % (3600 * _usPerSecond) // (60 * _usPerSecond)
+	@property
+	def second(self): 					return self.us % (60 * _usPerSecond) // _usPerSecond
+	@property
+	def microsecond(self): 				return self.us % _usPerSecond
+	@property
+	def seconds(self): 					return self.us / float(_usPerSecond)
+
+	def __int__(self): 					return self.us
+	__long__ 							= __int__
+	def __hash__(self): 				return hash(self.us)
+	def __eq__(self, other): 			return isinstance(other, Timestamp) and self.us == other.us
+	def __ne__(self, other): 			return not self == other
+	def __lt__(self, other): 			return self.us  < other.us
+	def __le__(self, other): 			return self.us <= other.us
+	def __gt__(self, other): 			return self.us  > other.us
+	def __ge__(self, other): 			return self.us >= other.us
+	def __reduce__(self): 				return (Timestamp, (self.us,))
+
+	def __add__(self, us):
+		"""Add a number of microseconds (or a timedelta)."""
+		if isinstance(us, datetime.timedelta): 	us = (us.days * 86400 + us.seconds) * _usPerSecond + us.microseconds
+		if not isinstance(us, Number): 			return NotImplemented
+		return Timestamp(self.us + us)
+	__radd__ 							= __add__
+	def __sub__(self, other):
+		"""Subtract a number of microseconds (or a timedelta), or return the microseconds since `other` (a Timestamp)."""
+		if isinstance(other, Timestamp): 	return self.us - other.us
+		if isinstance(other, datetime.timedelta): 	return self + -other
+		if not isinstance(other, Number): 	return NotImplemented
+		return Timestamp(self.us - other)
+
+	def __repr__(self): 				return '%s(%d)' % (self.__class__.__name__, self.us)
+	def __str__(self):
+		y, m, d, H, M, S, f 			= _fields(self.us)
+		s 								= '%04d-%02d-%02d %02d:%02d:%02d' % (y, m, d, H, M, S)
+		return s + '.%06d' % f if f else s
+	def __format__(self, spec):
+		"""Allow strftime formatting e.g. format(timestamp, '%Y%m%d%H%M%S:14')."""
+		try:
+			render 						= _formatters[spec]
+		except KeyError:
+			render 						= formatter(spec)
+		return format(str(self), spec.lstrip(':')) if render is None else render(*_fields(self.us))
@@ -0,0 +1,159 @@
+"""
+Time zones for :mod:`dateparser`: UTC, fixed offsets, the local time zone
+and TZ strings with a fixed offset.
+
+The instances are shared (tzutc() and tzlocal() always return the same
+object, as does tzoffset() for the same name and offset), so parsing many
+timestamps in the same zone doesn't create a tzinfo for each of them.
+"""
+import datetime
+import time
+
+__all__ = ["tzutc", "tzoffset", "tzlocal", "tzstr"]
+
+ZERO = datetime.timedelta(0)
+EPOCHORDINAL = datetime.datetime.utcfromtimestamp(0).toordinal()
+
+
+class tzutc(datetime.tzinfo):
+    """UTC."""
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = datetime.tzinfo.__new__(cls)
+        return cls._instance
+
+    def utcoffset(self, dt):
+        return ZERO
+
+    def dst(self, dt):
+        return ZERO
+
+    def tzname(self, dt):
+        return "UTC"
+
+    def __eq__(self, other):
+        return (isinstance(other, tzutc) or
+                (isinstance(other, tzoffset) and other._offset == ZERO))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(ZERO)
+
+    def __repr__(self):
+        return "%s()" % self.__class__.__name__
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+
+class tzoffset(datetime.tzinfo):
+    """A fixed offset of `offset` seconds east of UTC, called `name`."""
+    _instances = {}
+    _size = 1024
+
+    def __new__(cls, name, offset):
+        key = (name, offset)
+        try:
+            return cls._instances[key]
+        except KeyError:
+            if len(cls._instances) >= cls._size:
+                cls._instances.clear()
+            self = cls._instances[key] = datetime.tzinfo.__new__(cls)
+            self._name = name
+            self._offset = datetime.timedelta(seconds=offset)
+            return self
+
+    def __init__(self, name, offset):
+        pass
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return ZERO
+
+    def tzname(self, dt):
+        return self._name
+
+    def __eq__(self, other):
+        return (isinstance(other, tzoffset) and self._offset == other._offset
+                or isinstance(other, tzutc) and self._offset == ZERO)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._offset)
+
+    def __repr__(self):
+        return "%s(%s, %s)" % (self.__class__.__name__, repr(self._name),
+                               self._offset.days*86400+self._offset.seconds)
+
+    def __reduce__(self):
+        return (self.__class__, (self._name,
+                    self._offset.days*86400+self._offset.seconds))
+
+
+class tzlocal(datetime.tzinfo):
+    """The local time zone (as the time module)."""
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = datetime.tzinfo.__new__(cls)
+            cls._instance._std_offset = datetime.timedelta(seconds=-time.timezone)
+            if time.daylight:
+                cls._instance._dst_offset = datetime.timedelta(seconds=-time.altzone)
+            else:
+                cls._instance._dst_offset = cls._instance._std_offset
+        return cls._instance
+
+    def utcoffset(self, dt):
+        if self._isdst(dt):
+            return self._dst_offset
+        return self._std_offset
+
+    def dst(self, dt):
+        if self._isdst(dt):
+            return self._dst_offset-self._std_offset
+        return ZERO
+
+    def tzname(self, dt):
+        return time.tzname[self._isdst(dt)]
+
+    def _isdst(self, dt):
+        if self._dst_offset == self._std_offset:
+            return False
+        timestamp = ((dt.toordinal() - EPOCHORDINAL) * 86400
+                     + dt.hour * 3600 + dt.minute * 60 + dt.second)
+        return time.localtime(timestamp+time.timezone).tm_isdst > 0
+
+    def __repr__(self):
+        return "%s()" % self.__class__.__name__
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+
+_tzstrs = {}
+def tzstr(s):
+    """Return the tzinfo for a TZ string with a fixed offset, e.g.
+    "AEST-10" (note that the TZ variable's offsets are west of UTC).
+    Daylight saving rules (e.g. "AEST-10AEDT") aren't supported."""
+    try:
+        return _tzstrs[s]
+    except KeyError:
+        from dateparser import _parsetz
+        res = _parsetz(s)
+        if res is None or not res.stdabbr:
+            raise ValueError, "unknown string format"
+        if res.dstabbr:
+            raise ValueError, "daylight saving rules aren't supported"
+        if len(_tzstrs) >= tzoffset._size:
+            _tzstrs.clear()
+        tzinfo = _tzstrs[s] = tzoffset(res.stdabbr, res.stdoffset or 0)
+        return tzinfo
@@ -0,0 +1,49 @@
+"""Money Benchmarks
+===================
+Time displaying :class:`.Dollars` with the display format built once per class against building it on every
+call (as :class:`.Currency` did before), e.g.::
+
+	python -m money.benchmark [n]
+
+"""
+from money 								import Dollars
+from random								import Random
+from timeit								import default_timer
+import sys
+
+
+def timed(name, fn):
+	"""Run `fn()` once and print the elapsed time."""
+	start 								= default_timer()
+	fn()
+	print '%-36s %8.3fs' % (name, default_timer() - start)
+
+def rebuilt(value):
+	"""Display a Dollars `value`, building the display format on every call."""
+	return value._format(value.digits).format(float(value))
+
+def parsed(value, spec):
+	"""Format a Dollars `value` as before :class:`.FormatPlan`: splitting `spec` and building the display format on every call."""
+	base, rate 							= spec.split('/') if '/' in spec else (spec, '')
+	if rate: 							return format(value.conversion(rate), base)
+	if value.splitOff(spec, 'b') != spec and float(value) == 0.0: 	return ' '
+	return format(rebuilt(value), spec.replace('b', ''))
+
+def benchmark_format(n=1000000, seed=0):
+	"""Benchmark displaying `n` random Dollars with str() and some common specs."""
+	random 								= Random(seed)
+	values 								= [Dollars(random.randint(-10**8, 10**8) / 100.0) for _ in xrange(n)]
+	print 'str(Dollars) (%d values)' % n
+	timed('  format built each call', lambda: [rebuilt(d) for d in values])
+	timed('  format built once', lambda: [str(d) for d in values])
+	for spec in ('>14', '>14b', '>14/wk'):
+		print 'format(Dollars, %r) (%d values)' % (spec, n)
+		timed('  spec parsed each call', lambda: [parsed(d, spec) for d in values])
+		timed('  FormatPlan', lambda: [format(d, spec) for d in values])
+
+def benchmark(n=1000000, seed=0):
+	"""Run all the benchmarks."""
+	benchmark_format(n, seed)
+
+if __name__ == '__main__':
+	benchmark(*(int(arg) for arg in sys.argv[1:2]))
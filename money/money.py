@@ -3,7 +3,7 @@
 
 .. inheritance-diagram:: Currency
 """
-from quantity 							import Float_Quantity, Unit
+from quantity 							import Float_Quantity, Unit, conversions
 
 class Currency(Float_Quantity):
 	"""Currency is a :class:`.Float_Quantity` with units of `Money` and a currency symbol. sub-Classed to a specific currency."""
@@ -12,24 +12,44 @@ class Currency(Float_Quantity):
 	digits                              = 2
 	def __new__(cls, value, digits=None):
 				return Float_Quantity.__new__(cls, round(value, digits or cls.digits))
-	def __str__(self): 					return self._format(self.digits).format(float(self))
-	def __format__(self, spec):			return self.format_rate(self, spec) or self.format_b(self, spec) or format(str(self), spec.replace('b', ''))
+	def __str__(self):
+		"""Display as, e.g. $10.00, with the format of this class (see :meth:`_format`), built once and kept with the format plans."""
+		try:
+			display 					= self._plans[self.__class__]
+		except KeyError:
+			display 					= self._plan(self.__class__, self._format(self.digits))
+		return display.format(float(self))
+	def __format__(self, spec):
+		if not spec: 					return str(self)
+		plan 							= self.formatPlan(spec)
+		if plan.rate: 					return format(self.conversion(plan.rate), plan.rateSpec)
+		if plan.flag == 'b' and float(self) == 0.0: 	return ' '
+		return format(str(self), spec.replace('b', ''))
 	def __repr__(self): 				return '{}({})'.format(self.Class.__name__, str(self))
 	def __hash__(self): 				return hash(float(self))
-	def __mul__(self, other):			return self.Class(float(self) * float(other))
+	def __mul__(self, other):			return self._new(float(self) * float(other))
 	#def __div__(self, other):			return self.Class(float(self) / float(other))
 	#def __mod__(self, other):			return self.Class(float(self) % float(other))
-	def __add__(self, other):			return self.Class(float(self) + float(other))
-	def __sub__(self, other):			return self.Class(float(self) - float(other))
+	def __add__(self, other):			return self._new(float(self) + self._convert(other))
+	def __sub__(self, other):			return self._new(float(self) - self._convert(other))
 	def __abs__(self):					return self if float(self) > 0.0 else self * -1.0
-	def __eq__(self, other):			return repr(self) == repr(other)
+	def __eq__(self, other):
+		"""Compare (to the cent) with another Currency, converting Cents to Dollars, etc."""
+		if isinstance(other, Currency) and other.units != self.units:
+			try:
+				other 					= self._new(self._convert(other))
+			except TypeError:
+				return False
+		return repr(self) == repr(other)
 	__rmul__ = __mul__
 	# def __rdiv__(self, other):	TODO
 	#	if isinstance(other, Number): 	return self.Class(float(other)/ float(self))  # Division isn't commutative
 	#def __rmod__(self, other):			return self.Class(float(other)% float(self))  # Modulus isn't commutative
 	__radd__ = __add__
-	__rsub__ = __sub__
-	def conversion(self, units):		return ''  # This is where the format spec /rate is handled for Currency objects.
+	def __rsub__(self, other):			return self._new(self._convert(other) - float(self))
+	def _new(self, value):
+		"""Return a Currency of the same Class from a (float) value, e.g. Cents are stored as dollars."""
+		return self.Class(value / self.scale)
 	@property
 	def symbol(self):					return self.units.symbol
 	@property
@@ -89,7 +109,10 @@ class Dollars(Currency):
 class Cents(Dollars):
 	"""A Currency for cents only, displayed as, e.g. *5c*."""
 	units 	                    	    = Unit('cents', symbol='c')
+	scale 								= 0.01
 	def __new__(cls, cents): 			return Currency.__new__(cls, cents / 100.0)
 	def __str__(self): 					return '{:.0f}{}'.format(float(self) * 100, self.symbol)
 	@property
-	def toWords(self):					return self.xillions(self * 10000, 0) if self else ''
+	def toWords(self):					return self.xillions(round(float(self) / self.scale), 0) if self else ''
+
+conversions.add('dollars', 'cents', 100)
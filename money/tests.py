@@ -2,11 +2,20 @@
 =============
 """
 from unittest import TestCase
-from money import Dollars, Cents
+from money import Currency, Dollars, Cents, Unit
 
 dollars = Dollars(1.0)
 cents=Cents(1)
 
+class Salary(Dollars):
+    """An annual rate, in Dollars."""
+    per = 'years'
+
+class Yen(Currency):
+    """A Currency without cents."""
+    units = Unit('yen', symbol='Y')
+    digits = 0
+
 class TestDollars(TestCase):
     """Test a :class:`.Dollars`.
     """
@@ -28,3 +37,33 @@ class TestDollars(TestCase):
         self.assertEqual(Dollars.fromString("1,234.56").asCents, 123456)
         self.assertEqual(Dollars.fromString("1,234.56").toWords,
             "one thousand two hundred thirty four dollars and fifty six cents")
+
+    def test_conversions(self):
+        """Test Dollars and Cents are converted as required."""
+        self.assertEqual(Cents(250), 2.5*dollars)
+        self.assertEqual(2.5*dollars, Cents(250))
+        self.assertNotEqual(Cents(251), 2.5*dollars)
+        self.assertEqual(5*dollars + Cents(50), Dollars(5.5))
+        self.assertEqual(Cents(50) + 5*dollars, Cents(550))
+        self.assertEqual(str(Cents(50) + Cents(25)), "75c")
+        self.assertEqual(str(5*dollars - Cents(50)), "$4.50")
+        self.assertTrue(Cents(50) < 1*dollars)
+        self.assertEqual(Cents(56).toWords, "fifty six cents")
+
+    def test_rate(self):
+        """Test the /rate format spec."""
+        self.assertEqual(format(10*dollars, '/hr'), "$10.00/hr")
+        self.assertEqual(format(Salary(52000), '/wk'), "$1,000.00/wk")
+        self.assertEqual(format(Salary(52000), '>15/mth'), "  $4,333.33/mth")
+
+    def test_format(self):
+        """Test format specs."""
+        self.assertEqual(format(1234.5*dollars, ''), "$1,234.50")
+        self.assertEqual(format(1234.5*dollars, '>10'), " $1,234.50")
+        self.assertEqual(format(0*dollars, '>10b'), " ")
+        self.assertEqual(format(5*dollars, '>6b'), " $5.00")
+        self.assertRaises(ValueError, format, 50000*dollars, 'k')
+        self.assertRaises(ValueError, format, 5*dollars, '>8i')
+        self.assertEqual('{:<7}|{}'.format(Cents(5), 5*dollars), "5c     |$5.00")
+        self.assertEqual((5*dollars)._format(), "${:0,.2f}")
+        self.assertEqual((str(Yen(1234)), str(1234*dollars), str(Yen(5))), ("Y1,234", "$1,234.00", "Y5"))
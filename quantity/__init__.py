@@ -1 +1 @@
-from quantity import Float_Quantity, Fractional_Quantity, Unit, percent, qty
+from quantity import Converter, Float_Quantity, Fractional_Quantity, Unit, conversions, percent, qty
@@ -5,6 +5,82 @@
 from null 								import Null
 from fractions							import Fraction
 
+class Converter(object):
+	"""A graph of conversion factors between units, e.g. `converter.add('weeks', 'days', 7)` (1 week is 7 days).
+
+	`converter.factor(unit, other)` returns the factor from `unit` to `other` (or None), multiplying the factors along
+	the path between them. The factors from a unit to every unit reachable from it are calculated (exactly, as Fractions)
+	the first time it is converted from, and cached, so later conversions are a lookup and a multiplication.
+
+	"""
+
+	def __init__(self):
+		self._edges, self._factors, self._scaled, self._bases = ({}, {}, {}, {})
+
+	def add(self, unit, other, factor):
+		"""Add a conversion: 1 `unit` is `factor` `other`s (and 1 `other` is 1/`factor` `unit`s)."""
+		unit, other, factor 		= (str(unit), str(other), Fraction(factor))
+		self._edges.setdefault(unit, {})[other] 	= factor
+		self._edges.setdefault(other, {})[unit] 	= 1 / factor
+		self._factors.clear()
+		self._scaled.clear()
+		self._bases.clear()
+
+	def _reachable(self, unit):
+		"""Return {other: factor} for every unit reachable from `unit`, by a breadth-first walk of the graph."""
+		factors, queue 				= ({unit: Fraction(1)}, [unit])
+		for u in queue:
+			for (v, factor) in self._edges.get(u, {}).items():
+				if v not in factors:
+					factors[v] 		= factors[u] * factor
+					queue.append(v)
+		return dict((v, float(factor)) for (v, factor) in factors.items())
+
+	def factor(self, unit, other):
+		"""Return the factor to convert a number of `unit`s to `other`s, or None if there is no conversion."""
+		unit 						= str(unit)
+		try:
+			factors 				= self._factors[unit]
+		except KeyError:
+			factors 				= self._factors[unit] = self._reachable(unit)
+		return factors.get(str(other))
+
+	def baseFactor(self, unit):
+		"""Return the factor to convert `unit`s to their base unit: the first (by name) of the units `unit` converts to,
+		so every unit that converts to `unit` has the same base. Cached for each unit."""
+		unit 						= str(unit)
+		try:
+			return self._bases[unit]
+		except KeyError:
+			self.factor(unit, unit)
+			factors 				= self._factors[unit]
+			self._bases[unit] 		= factors[min(factors)]
+			return self._bases[unit]
+
+	def scaled(self, cls, other):
+		"""Return the factor to convert the (float) value of a `cls` Quantity to the value of an `other` Quantity,
+		including the `scale` of each (e.g. Cents are stored as dollars), or None if there is no conversion."""
+		try:
+			return self._scaled[(cls, other)]
+		except KeyError:
+			factor 					= self.factor(cls.units, other.units)
+			self._scaled[(cls, other)] 	= None if factor is None else factor / cls.scale * other.scale
+			return self._scaled[(cls, other)]
+
+	def convert(self, value, unit, other):
+		"""Return `value` `unit`s as a number of `other`s, e.g. `convert(2, 'weeks', 'days')` -> 14.0."""
+		factor 						= self.factor(unit, other)
+		if factor is None: 			raise TypeError, "Can't convert {} to {}".format(unit, other)
+		return value * factor
+
+conversions = Converter()
+"""The default :class:`Converter` of :class:`Unit` (with time units, years of 52 weeks and 12 months)."""
+for (unit, other, factor) in [	('days', 'hours', 24), ('weeks', 'days', 7), ('years', 'weeks', 52), ('years', 'months', 12),
+								('hours', 'hr', 1), ('days', 'day', 1), ('weeks', 'wk', 1), ('months', 'mth', 1), ('years', 'yr', 1),
+								('years', 'pa', 1)]:
+	conversions.add(unit, other, factor)
+
+
 class Unit(object):
 	"""Unit is a base class that represents a unit for a Quantity.
 
@@ -13,12 +89,12 @@ class Unit(object):
 	`symbol`
 		A symbol that can be used in place of the unit (e.g. the symbol for 'dollars' is '$')
 	`converter`
-		A converter class that knows how to convert between different units.
+		A :class:`Converter` that knows how to convert between different units (default, :data:`conversions`).
 
 	"""
 
-	def __init__(self, unit, symbol=Null, converter=Null):
-		self.unit, self.symbol, self.converter = (str(unit), symbol, converter)
+	def __init__(self, unit, symbol=Null, converter=None):
+		self.unit, self.symbol, self.converter = (str(unit), symbol, conversions if converter is None else converter)
 	def __str__(self):					return self.unit
 	def __repr__(self):					return 'Unit({})'.format(self.unit)
 	def __eq__(self, other):			return self.unit == getattr(other, 'unit', None)
@@ -27,36 +103,71 @@ class Unit(object):
 		"""Return the unit name formatted as a String. (**Note:** This handles plural forms)."""
 		return _.plural(float(number), str(self.unit)) if self.symbol is Null else self.symbol
 
+class FormatPlan(object):
+	"""A format spec, parsed by :meth:`FormatSpecs.formatPlan`.
+
+	`base`
+		The standard format spec, without the new format specs (e.g. '>10' for '>10i').
+	`flag`
+		The new format spec at the end of the spec ('i', 'b' or 'k'), or ''.
+	`rate`
+		The units of a */rate* format spec (e.g. 'hr' for '>10/hr'), or '', and `rateSpec` the spec before it.
+
+	"""
+	__slots__ 						= ('base', 'flag', 'rate', 'rateSpec')
+
+	def __init__(self, spec):
+		self.flag 					= spec[-1:] if spec[-1:] in ('i', 'b', 'k') else ''
+		self.rateSpec, self.rate 	= spec.split('/') if '/' in spec else (spec, '')
+		for id in ('i', 'k', 'b'):
+			spec 					= spec[:-1] if spec.endswith(id) else spec
+		self.base 					= spec
+
 class FormatSpecs(object):
 	"""Mixin class to extend the Format Specification mini-language."""
 
+	_plans 							= {}
+	"""The :class:`FormatPlan` of each spec (and any other format built once, e.g. by :class:`.Currency`), so each
+	spec is only parsed once."""
+
+	def formatPlan(self, spec):
+		"""Return the :class:`FormatPlan` of `spec` (parsed once, then cached)."""
+		try:
+			return FormatSpecs._plans[spec]
+		except KeyError:
+			return self._plan(spec, FormatPlan(spec))
+
+	@staticmethod
+	def _plan(key, plan):
+		"""Cache `plan` for `key` in :attr:`_plans` (clearing it when it is full) and return it."""
+		if len(FormatSpecs._plans) >= 1024: 	FormatSpecs._plans.clear()
+		FormatSpecs._plans[key] 	= plan
+		return plan
+
 	def splitOff(self, spec, id):
 		"""Split the new format specifier `id` out from the format `spec`."""
 		return spec[:-1] if spec is not None and spec.endswith(id) else spec
 
 	def format_i(self, value, spec):
 		"""Format `:i` format displays it in integer format, if possible. e.g. `5.00%:i` -> 5%."""
-		return ''.join((str(int(value)), self.formatUnits)) if self.splitOff(spec, 'i') != spec and (float(value) % 1 == 0.0) else None
+		return ''.join((str(int(value)), self.formatUnits)) if self.formatPlan(spec).flag == 'i' and (float(value) % 1 == 0.0) else None
 
 	def format_b(self, value, spec):
 		"""Format `:b` format displays it as blank when zero. e.g. `0.00:b` -> ."""
-		return ' ' if self.splitOff(spec, 'b') != spec and (float(value) == 0.0) else None
+		return ' ' if self.formatPlan(spec).flag == 'b' and (float(value) == 0.0) else None
 
 	def format_k(self, value, spec):
 		"""Format a PayRate Rate, shortening $1,000's to $k's, e.g. $50,000pa -> $50k."""
-		return value._format_k.format(float(value)/1000.0) if self.splitOff(spec, 'k') != spec and float(value) % 1000.0 == 0.0 else None
+		return value._format_k.format(float(value)/1000.0) if self.formatPlan(spec).flag == 'k' and float(value) % 1000.0 == 0.0 else None
 
 	def format_rate(self, value, spec):
 		"""Support a */rate* format specification, i.e. `{value:spec/rate}`."""
-		spec, rate_format			= spec.split('/') if '/' in spec else (spec, '')
-		return format(value.conversion(rate_format), spec) if rate_format else None
+		plan 						= self.formatPlan(spec)
+		return format(value.conversion(plan.rate), plan.rateSpec) if plan.rate else None
 
 	def parse_spec(self, spec):
 		"""Drop the new format specs. They are only only processed when called explicitly from a Qty sub-class."""
-		spec						= self.splitOff(spec, 'i')
-		spec 						= self.splitOff(spec, 'k')
-		spec 						= self.splitOff(spec, 'b')
-		return spec
+		return self.formatPlan(spec).base
 
 	@property
 	def div_format(self):
@@ -74,6 +185,10 @@ class Qty(FormatSpecs, object):
 
 	units 							= Unit('')
 	"""The name of the units."""
+	scale 							= 1.0
+	"""The value stored for one unit (e.g. 0.01 for Cents, which are stored as dollars)."""
+	per 							= None
+	"""The time unit of a rate (e.g. 'years' for an annual salary), used by :meth:`conversion`."""
 
 	def __repr__(self):
 		return '{}({}{})'.format(self.__class__.__name__, float(self), self.units.units(self))
@@ -84,8 +199,21 @@ class Qty(FormatSpecs, object):
 
 	#Conversion Routines
 	def conversion(self, other):
-		"""Describe a conversion, e.g. `{num:>10/hr}.format(10*dollars)` -> $10.00/hr."""
-		return ''
+		"""Describe a conversion, e.g. `{num:>10/hr}.format(10*dollars)` -> $10.00/hr.
+		A rate (with a `per` unit) is converted, e.g. an annual salary of $52,000 is $1,000.00/wk."""
+		value 						= self
+		if self.per is not None:
+			value 					= self.__class__(float(self) / self.scale * self.units.converter.convert(1, other, self.per))
+		return '{}/{}'.format(value, other)
+
+	def _convert(self, other):
+		"""Return `other` as the (float) value of this Quantity, converting a Quantity in other units.
+		Numbers and Quantities without units are returned as they are. Raises TypeError if there is no conversion."""
+		units 						= getattr(other, 'units', None)
+		if units is None or units == self.units or not units.unit: 	return float(other)
+		factor 						= self.units.converter.scaled(other.__class__, self.__class__)
+		if not factor: 				raise TypeError, "Can't convert {} to {}".format(units, self.units)
+		return float(other) * factor
 
 	@property
 	def formatValue(self):
@@ -102,8 +230,12 @@ class Qty(FormatSpecs, object):
 		return other.__rmul__(self)
 
 	def __eq__(self, other):
-		"""Handle Qty == Qty, TODO doing units conversion as required."""
-		return super(Qty, self).__eq__(other) if self.units == getattr(other, 'units', None) else False  # TODO - Unit conversions.
+		"""Handle Qty == Qty, doing units conversion as required."""
+		if self.units == getattr(other, 'units', None): 	return super(Qty, self).__eq__(other)
+		try:
+			return hasattr(other, 'units') and super(Qty, self).__eq__(self._convert(other))
+		except TypeError:
+			return False
 
 	def __ne__(self, other):
 		return not (self == other)
@@ -114,6 +246,7 @@ class Qty(FormatSpecs, object):
 
 class Float_Quantity(Qty, float):
 	"""A real number in particular units. Quantity sub-classes override `units` and `__str__`.
+	Adding or subtracting a Quantity (converted to these units) or a number returns a Quantity of the same class.
 
 	.. inheritance-diagram:: Float_Quantity
 
@@ -123,15 +256,45 @@ class Float_Quantity(Qty, float):
 	def _format(self, spec=None):	return format(float(self), spec if spec is not None else _.float_spec)
 	def __format__(self, spec):
 		"""Format this Float_Quantity. `:i` format displays it in integer format, if possible. e.g. `5.00:i` -> 5."""
-		return self.format_i(self, spec) or Qty.__format__(self, spec)
+		return self._format_plan(float(self), self.formatPlan(spec))
+
+	def _format_plan(self, value, plan):
+		"""Format with a :class:`FormatPlan`, where `value` is the value displayed (for the `:i` format)."""
+		if plan.flag == 'i' and value % 1 == 0.0: 	return ''.join((str(int(value)), self.formatUnits))
+		return format(str(self), plan.base)
 
 	def __eq__(self, other):
-		"""Handle Qty == Qty, (to 4dp). TODO doing units conversion as required."""
-		return (abs(abs(float(self)) - abs(float(other))) < 0.0001) if self.units == getattr(other, 'units', None) else False  # TODO - Unit conversions.
+		"""Handle Qty == Qty, (to 4dp), doing units conversion as required.
+		A Quantity without units is only equal to another without units."""
+		if not hasattr(other, 'units') or bool(self.units.unit) != bool(other.units.unit): 	return False
+		try:
+			return abs(abs(float(self)) - abs(self._convert(other))) < 0.0001
+		except TypeError:
+			return False
 
 	def __ne__(self, other):
 		return not (self == other)
 
+	def __hash__(self):
+		"""Hash the value in the base unit (to 4dp), as Quantities in different units can be equal, e.g. Hours(168) == Weeks(1).
+		Units without a converter are only equal to the same units, so aren't converted."""
+		converter 					= self.units.converter
+		factor 						= 1.0 if converter is Null else converter.baseFactor(self.units)
+		return hash(round(abs(float(self) / self.scale * factor), 4))
+
+	def __add__(self, other):		return self._new(float(self) + self._convert(other))
+	def __sub__(self, other):		return self._new(float(self) - self._convert(other))
+	__radd__ = __add__
+	def __rsub__(self, other):		return self._new(self._convert(other) - float(self))
+	def _new(self, value):
+		"""Return a Quantity of the same class from a (float) value, e.g. Percents are stored divided by 100."""
+		return self.__class__(value / self.scale)
+
+	def __lt__(self, other):			return float(self)  < self._convert(other)
+	def __le__(self, other):			return float(self) <= self._convert(other)
+	def __gt__(self, other):			return float(self)  > self._convert(other)
+	def __ge__(self, other):			return float(self) >= self._convert(other)
+
 	words = {
 				10**9: 	'billion',
 				10**6: 	'million',
@@ -210,11 +373,12 @@ class Percent_Quantity(Float_Quantity):
 
 	"""
 	units 	= Unit('pct', symbol='%')
+	scale 	= 0.01
 	def _format(self, spec=None):	return Float_Quantity._format(10000.0 * self)
 	def __new__(cls, value):		return float.__new__(cls, value / 100.0)
 	def __format__(self, spec):
 		"""Format this Percent_Quantity. `:i` format displays it in integer format, if possible. e.g. `5.00%:i` -> 5%."""
-		return self.format_i(self * 100.0, spec) or Float_Quantity.__format__(self, spec)
+		return self._format_plan(float(self) * 100.0, self.formatPlan(spec))
 percent = Percent_Quantity(100.0)
 """Usage: e.g. `rate = 5 * percent`"""
 
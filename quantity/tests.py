@@ -2,6 +2,18 @@
 =======
 """
 from unittest import TestCase
+from null import Null
+from quantity import Converter, FormatPlan, Float_Quantity, Unit, conversions, percent, qty
+
+
+class Hours(Float_Quantity):
+    units = Unit('hours', symbol='h')
+
+class Weeks(Float_Quantity):
+    units = Unit('weeks', symbol='w')
+
+class Days(Float_Quantity):
+    units = Unit('days', symbol='d', converter=Null)
 
 
 class TestSomething(TestCase):
@@ -11,3 +23,72 @@ class TestSomething(TestCase):
     def test_test(self):
         """Test."""
         self.assertEqual(1, 1)
+
+
+class TestConverter(TestCase):
+    """Test a :class:`.Converter`.
+    """
+
+    def test_factors(self):
+        """Factors multiply along the path between units, and are cached."""
+        self.assertEqual(conversions.factor('weeks', 'hours'), 168.0)
+        self.assertEqual(conversions.factor('hr', 'yr'), 1 / (24.0 * 7 * 52))
+        self.assertAlmostEqual(conversions.factor('months', 'weeks'), 52 / 12.0)
+        self.assertEqual(conversions.convert(2, 'weeks', 'days'), 14.0)
+        self.assertEqual(conversions.factor('hours', 'pct'), None)
+        self.assertRaises(TypeError, conversions.convert, 1, 'hours', 'pct')
+
+    def test_add(self):
+        """Adding a conversion clears the cached factors."""
+        converter = Converter()
+        converter.add('a', 'b', 3)
+        self.assertEqual(converter.factor('a', 'c'), None)
+        converter.add('c', 'b', 2)
+        self.assertEqual(converter.factor('a', 'c'), 1.5)
+        self.assertEqual(converter.factor('c', 'a'), 2 / 3.0)
+
+    def test_quantities(self):
+        """Quantities in different units are converted to compare them."""
+        self.assertEqual(Hours(168), Weeks(1))
+        self.assertNotEqual(Hours(167), Weeks(1))
+        self.assertTrue(Hours(167) < Weeks(1) <= Hours(168))
+        self.assertTrue(Weeks(2) > Hours(300))
+        self.assertRaises(TypeError, Hours(1).__lt__, 1*qty)
+        self.assertTrue(Hours(1) < Float_Quantity(2))
+        self.assertEqual(hash(Hours(168)), hash(Weeks(1)))
+        self.assertEqual(len(set([Hours(168), Weeks(1), 2 * Hours(84)])), 1)
+        self.assertNotEqual(Float_Quantity(2), Hours(2))
+        self.assertNotEqual(Hours(2), Float_Quantity(2))
+        self.assertEqual(len(set([Float_Quantity(2), Hours(2), Hours(2)])), 2)
+        self.assertEqual(conversions.baseFactor('weeks'), conversions.baseFactor('wk'))
+        self.assertEqual(hash(Days(7)), hash(Days(7.0)))
+
+    def test_arithmetic(self):
+        """Adding and subtracting Quantities converts to the units of the first, and returns a Quantity (not a float)."""
+        self.assertEqual(Hours(1) + Weeks(1), Hours(169))
+        self.assertEqual([type(q) for q in (Hours(1) + Weeks(1), Hours(2) + 1, 1 + Hours(2), Hours(2) - 1, 5 - Hours(2))], [Hours] * 5)
+        self.assertEqual(type(5*percent - 1*percent), type(percent))
+        self.assertEqual(Weeks(2) - Hours(168), Weeks(1))
+        self.assertEqual(Hours(2) + 1, Hours(3))
+        self.assertEqual(5 - Hours(2), Hours(3))
+        self.assertEqual(5*percent + 5*percent, 10*percent)
+        self.assertRaises(TypeError, Hours(1).__add__, 1*qty)
+
+
+class TestFormatPlan(TestCase):
+    """Test a :class:`.FormatPlan`.
+    """
+
+    def test_parse(self):
+        """Specs are parsed into the base spec, the flag and the rate, once."""
+        plan = Hours(1).formatPlan('>10i')
+        self.assertEqual((plan.base, plan.flag, plan.rate), ('>10', 'i', ''))
+        self.assertTrue(Weeks(1).formatPlan('>10i') is plan)
+        plan = FormatPlan('>12,.2f/hr')
+        self.assertEqual((plan.rateSpec, plan.rate, plan.flag), ('>12,.2f', 'hr', ''))
+        self.assertEqual(FormatPlan('b').base, '')
+
+    def test_format_i(self):
+        """`:i` formats whole numbers as integers."""
+        self.assertEqual(format(Hours(5), 'i'), '5h')
+        self.assertEqual(format(5*percent, 'i'), '5%')